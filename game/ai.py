@@ -2,22 +2,28 @@
 """AI player controller with 1990s-style decision-making.
 
 This module implements a simple but effective AI using if/then logic,
-distance calculations, and basic pathfinding. The AI can move units,
+distance calculations, and A* pathfinding. The AI can move units,
 found bases, and make strategic decisions without using modern ML techniques.
 """
 import random
 
+from game.influence import InfluenceMap
+from game.units.pathfinding import FlowField
+
 
 class AIPlayer:
     """AI controller for computer players using classic rule-based logic.
 
     Uses simple heuristics and greedy algorithms to play the game:
-    - Colony pods seek good founding locations with proper spacing
+    - Colony pods seek the best founding site nearby (see game.base_sites)
     - Military units pursue player targets or explore randomly
-    - Movement uses basic pathfinding toward objectives
+    - Military units share per-faction flow fields toward common objectives
+    - Colony pods follow A* paths toward their chosen sites
 
     Attributes:
         player_id (int): The AI player's ID (1+)
+        flow_fields (dict): Shared FlowFields by (objective, unit type)
+        influence (InfluenceMap): Strength/threat grids for the current turn
     """
 
     def __init__(self, player_id):
@@ -27,6 +33,8 @@ class AIPlayer:
             player_id (int): Player ID for this AI (1+)
         """
         self.player_id = player_id
+        self.flow_fields = {}  # (objective, unit type) -> FlowField
+        self.influence = None  # InfluenceMap, rebuilt once per turn
 
     def _move_unit(self, unit, game):
         """Decide how to move a unit based on its type.
@@ -41,17 +49,17 @@ class AIPlayer:
             self._move_military_unit(unit, game)
 
     def _move_colony_pod(self, unit, game):
-        """Move colony pod and potentially found a base."""
-        # Check if current location is good for founding
-        if self._is_good_base_location(unit.x, unit.y, game):
-            # Found a base here
+        """Move colony pod toward the best nearby site and found a base there."""
+        target = self._find_base_location(unit, game)
+
+        # Found here if this is the best site around, or straight away for a first base
+        if target == (unit.x, unit.y) or (
+                not game.faction_bases(self.player_id) and game.base_sites.can_found(unit.x, unit.y)):
             base_name = game.generate_base_name(self.player_id)
             game.found_base(unit, base_name)
             print(f"AI founded base '{base_name}' at ({unit.x}, {unit.y})")
             return
 
-        # Otherwise, move toward a good location
-        target = self._find_base_location(unit, game)
         if target:
             self._move_toward(unit, target[0], target[1], game)
         else:
@@ -60,9 +68,40 @@ class AIPlayer:
 
     def _move_military_unit(self, unit, game):
         """Move military unit - balance offense, defense, and exploration."""
+        influence = self._influence_map(game)
+
         # First, check for adjacent enemies we can attack
-        player_units = [u for u in game.units if u.owner == 0]
+        if influence.hostile_near(unit.x, unit.y):
+            if self._attack_adjacent(unit, game):
+                return
+
+        # Defenders of a threatened base hold their post
+        tile = game.game_map.get_tile(unit.x, unit.y)
+        if tile.base and unit in tile.base.garrison and influence.threat_at(unit.x, unit.y) > 0:
+            return
 
+        # Check for bases that need defending (ungarrisoned or threatened)
+        garrison_field = self._objective_field('garrison', unit, game)
+        base_distance = garrison_field.distance(unit)
+        if base_distance is not None and self._should_garrison(unit, base_distance):
+            # Move toward undefended base
+            self._follow_field(unit, garrison_field, game)
+            return
+
+        # No immediate defensive needs - head for the nearest player unit or base
+        player_field = self._objective_field('player', unit, game)
+        if player_field.distance(unit) is not None and random.random() < 0.6:  # 60% chance to pursue player
+            self._follow_field(unit, player_field, game)
+        else:
+            # Explore randomly
+            self._move_randomly(unit, game)
+
+    def _attack_adjacent(self, unit, game):
+        """Attack an adjacent player unit if the odds are good.
+
+        Returns:
+            bool: True if an attack was made
+        """
         for dx in [-1, 0, 1]:
             for dy in [-1, 0, 1]:
                 if dx == 0 and dy == 0:
@@ -85,68 +124,71 @@ class AIPlayer:
                             target_x = check_x
                             target_y = check_y
                             game.movement.try_move_unit(unit, target_x, target_y)
-                            return
-
-        # Check for ungarrisoned bases that need defending
-        garrison_target = self._find_nearest_ungarrisoned_base(unit, game)
-        if garrison_target:
-            base_x, base_y, distance = garrison_target
-            if self._should_garrison(unit, distance):
-                # Move toward undefended base
-                self._move_toward(unit, base_x, base_y, game)
-                return
+                            return True
 
-        # No immediate defensive needs - find nearest player unit or base
-        player_bases = [b for b in game.bases if b.owner == 0]
-
-        targets = []
-        map_width = game.game_map.width
-        for u in player_units:
-            targets.append((u.x, u.y, self._distance(unit.x, unit.y, u.x, u.y, map_width)))
-        for b in player_bases:
-            targets.append((b.x, b.y, self._distance(unit.x, unit.y, b.x, b.y, map_width)))
-
-        if targets and random.random() < 0.6:  # 60% chance to pursue player
-            # Find nearest target
-            targets.sort(key=lambda t: t[2])
-            nearest = targets[0]
-            self._move_toward(unit, nearest[0], nearest[1], game)
-        else:
-            # Explore randomly
-            self._move_randomly(unit, game)
+        return False
 
-    def _move_toward(self, unit, target_x, target_y, game):
-        """Move unit one step toward target (with horizontal wrapping)."""
-        dx = target_x - unit.x
-        dy = target_y - unit.y
-
-        # Handle horizontal wrapping - take the shortest path
-        map_width = game.game_map.width
-        if dx > map_width // 2:
-            dx -= map_width
-        elif dx < -map_width // 2:
-            dx += map_width
-
-        # Normalize to -1, 0, or 1
-        move_x = 0 if dx == 0 else (1 if dx > 0 else -1)
-        move_y = 0 if dy == 0 else (1 if dy > 0 else -1)
-
-        # Try diagonal first
-        if move_x != 0 and move_y != 0:
-            if self._try_move_with_combat_check(unit, move_x, move_y, game):
-                return
+    def _influence_map(self, game):
+        """Return this turn's influence map, building it on first use."""
+        if self.influence is None or self.influence.turn != game.turn:
+            self.influence = InfluenceMap(game, self.player_id)
+        return self.influence
+
+    def _objective_field(self, objective, unit, game):
+        """Return this faction's flow field toward an objective for a unit's domain.
 
-        # Try horizontal
-        if move_x != 0:
-            if self._try_move_with_combat_check(unit, move_x, 0, game):
+        Fields are kept per (objective, unit type) and brought up to date
+        with the current targets before use; see FlowField.update.
+
+        Args:
+            objective (str): 'player' (player units and bases) or
+                'garrison' (own bases that need defending, see InfluenceMap)
+            unit (Unit): Unit that will read the field
+            game (Game): Current game state
+
+        Returns:
+            FlowField: Field whose targets are the objective's tiles
+        """
+        key = (objective, unit.type)
+        field = self.flow_fields.get(key)
+        if field is None:
+            field = self.flow_fields[key] = FlowField(game, self.player_id, unit.type)
+
+        if objective == 'player':
+            targets = [(u.x, u.y) for u in game.faction_units(0)]
+            targets.extend((b.x, b.y) for b in game.faction_bases(0))
+        else:
+            bases = self._influence_map(game).bases_needing_defense(game.faction_bases(self.player_id))
+            targets = [(b.x, b.y) for b in bases]
+        field.update(targets)
+        return field
+
+    def _follow_field(self, unit, field, game):
+        """Take one step down a flow field, or move randomly if it fails."""
+        step = field.next_step(unit)
+        if step is not None:
+            dx = (step[0] - unit.x + 1) % game.game_map.width - 1
+            dy = step[1] - unit.y
+            if self._try_move_with_combat_check(unit, dx, dy, game):
                 return
+        self._move_randomly(unit, game)
 
-        # Try vertical
-        if move_y != 0:
-            if self._try_move_with_combat_check(unit, 0, move_y, game):
+    def _move_toward(self, unit, target_x, target_y, game):
+        """Move unit one step along its path to target.
+
+        Follows the unit's cached A* path (see game.pathfinder). Moves
+        randomly instead when the target is unreachable or the step fails,
+        rather than pushing against a coastline toward it.
+        """
+        step = game.pathfinder.next_step(unit, target_x, target_y)
+        if step is not None:
+            dx = (step[0] - unit.x + 1) % game.game_map.width - 1
+            dy = step[1] - unit.y
+            if self._try_move_with_combat_check(unit, dx, dy, game):
                 return
+            # Step refused (e.g. bad attack odds) - plan again next time
+            game.pathfinder.forget(unit)
 
-        # Stuck - try random
         self._move_randomly(unit, game)
 
     def _try_move_with_combat_check(self, unit, dx, dy, game):
@@ -197,6 +239,9 @@ class AIPlayer:
         random.shuffle(directions)
 
         for dx, dy in directions:
+            # Skip tiles the unit cannot enter at all (ocean for land units, etc.)
+            if not game.pathfinder.can_enter(unit, unit.x + dx, unit.y + dy):
+                continue
             if self._try_move(unit, dx, dy, game):
                 return
 
@@ -209,118 +254,39 @@ class AIPlayer:
             return True
         return False
 
-    def _is_good_base_location(self, x, y, game):
-        """Check if a location is good for founding a base.
-
-        Validates spacing rules: no adjacent bases and minimum 2 tile separation.
-
-        Args:
-            x (int): X coordinate to check
-            y (int): Y coordinate to check
-            game (Game): Current game state
-
-        Returns:
-            bool: True if location is suitable for a new base
-        """
-        # Don't found if there's already a base here
-        tile = game.game_map.get_tile(x, y)
-        if tile and tile.base:
-            return False
-
-        # Check for adjacent bases (including diagonals) - same rule as player
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue
-                check_x = x + dx
-                check_y = y + dy
-                check_tile = game.game_map.get_tile(check_x, check_y)
-                if check_tile and check_tile.base:
-                    return False
-
-        # Also prefer some spacing - minimum 2 tiles away from other bases
-        for base in game.bases:
-            dist = self._distance(x, y, base.x, base.y, game.game_map.width)
-            if dist < 2:
-                return False
-
-        # Location is good!
-        return True
-
     def _find_base_location(self, unit, game):
-        """Find a nearby good location for a base."""
-        # Search in expanding radius
-        for radius in range(1, 8):
-            candidates = []
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    check_x = (unit.x + dx) % game.game_map.width  # Wrap X
-                    check_y = unit.y + dy
-
-                    # Y doesn't wrap - check bounds
-                    if check_y < 0 or check_y >= game.game_map.height:
-                        continue
-
-                    tile = game.game_map.get_tile(check_x, check_y)
-                    if not tile:
-                        continue
-
-                    # Check if unit can exist on this terrain
-                    if unit.weapon == 'colony_pod' and unit.chassis in ['foil', 'cruiser', 'gravship'] and tile.is_ocean():
-                        continue
-                    if unit.weapon == 'colony_pod' and unit.chassis in ['infantry', 'rover', 'hovertank', 'gravship'] and tile.is_land():
-                        continue
-
-                    if self._is_good_base_location(check_x, check_y, game):
-                        candidates.append((check_x, check_y))
+        """Find the best base site within reach of a colony pod.
 
-            if candidates:
-                # Pick random candidate at this radius
-                return random.choice(candidates)
-
-        return None
-
-    def _find_nearest_ungarrisoned_base(self, unit, game):
-        """Find the nearest AI base without any garrison.
+        Reads the shared site map (game.base_sites), limited to the pod's own
+        landmass or ocean so it never picks a site it cannot walk to.
 
         Args:
-            unit (Unit): The unit looking for a base to garrison
+            unit (Unit): Colony pod
             game (Game): Current game state
 
         Returns:
-            tuple: (base_x, base_y, distance) or None if no ungarrisoned bases
+            tuple: (x, y) of the chosen site, or None if there is none within range
         """
-        ai_bases = [b for b in game.bases if b.owner == self.player_id]
-        ungarrisoned_bases = [b for b in ai_bases if len(b.garrison) == 0]
-
-        if not ungarrisoned_bases:
-            return None
-
-        # Find nearest ungarrisoned base
-        map_width = game.game_map.width
-        nearest = None
-        nearest_dist = float('inf')
-
-        for base in ungarrisoned_bases:
-            dist = self._distance(unit.x, unit.y, base.x, base.y, map_width)
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest = (base.x, base.y, dist)
-
-        return nearest
+        ocean = unit.type == 'sea'
+        tile = game.game_map.get_tile(unit.x, unit.y)
+        regions = None
+        if unit.type != 'air' and tile.is_ocean() == ocean:
+            labels = game.pathfinder.region_labels()
+            regions = (labels, labels[unit.y, unit.x])
+        return game.base_sites.best_site(unit.x, unit.y, 7, ocean, regions)
 
     def _should_garrison(self, unit, base_distance):
         """Decide if unit should prioritize garrisoning over other actions.
 
-        Uses distance-based priority system:
-        - 1-2 tiles (CRITICAL): Always garrison
-        - 3-4 tiles (MODERATE): 50% chance to garrison
-        - 5+ tiles (LOW): Continue mission, don't garrison
+        Uses distance-based priority system (distance in moves, so roads count less):
+        - Up to 2 moves (CRITICAL): Always garrison
+        - Up to 4 moves (MODERATE): 50% chance to garrison
+        - Further (LOW): Continue mission, don't garrison
         - Damaged units (<75% HP): Always prefer garrison
 
         Args:
             unit (Unit): The unit considering garrison
-            base_distance (int): Distance to nearest ungarrisoned base
+            base_distance (float): Move cost to the nearest ungarrisoned base
 
         Returns:
             bool: True if unit should move to garrison
@@ -338,27 +304,24 @@ class AIPlayer:
 
         return False  # LOW priority - continue mission
 
-    def _distance(self, x1, y1, x2, y2, map_width):
-        """Calculate Manhattan distance with horizontal wrapping."""
-        dx = abs(x2 - x1)
-        # Account for wrapping - take the shortest path
-        if dx > map_width // 2:
-            dx = map_width - dx
-        dy = abs(y2 - y1)
-        return dx + dy
-
-    def _calculate_attack_odds(self, attacker, defender):
+    def _calculate_attack_odds(self, attacker, defender, game=None):
         """Calculate probability of attacker winning combat.
 
-        Factors in both combat strength (weapon vs armor) and current health.
+        With a game, this is the exact win probability from the combat
+        solver (modifiers, multi-round damage and disengage included).
+        Without one, falls back to the weapon/armor x health strength ratio.
 
         Args:
             attacker (Unit): Attacking unit
             defender (Unit): Defending unit
+            game (Game): Current game state (optional)
 
         Returns:
             float: Probability of attacker winning (0.0 to 1.0)
         """
+        if game is not None:
+            return game.combat.calculate_combat_odds(attacker, defender)
+
         # Factor in both combat strength and current health
         attacker_weapon_value = attacker.weapon_data['attack']
         defender_armor_value = defender.armor_data['defense']
@@ -395,7 +358,7 @@ class AIPlayer:
             return False
 
         # Calculate odds
-        odds = self._calculate_attack_odds(unit, target_unit)
+        odds = self._calculate_attack_odds(unit, target_unit, game)
 
         # Get health status
         unit_health_pct = unit.get_health_percentage()
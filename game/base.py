@@ -6,6 +6,8 @@ on the game map. Bases grow in population over time, produce units,
 and can garrison military units for defense.
 """
 
+import numpy as np
+
 from game import facilities
 
 
@@ -58,7 +60,7 @@ class Base:
         owner (int): Player ID who owns this base (0 = human, 1+ = AI)
         name (str): Display name of the base
         population (int): Current population (1-7)
-        facilities (list): Buildings constructed in this base
+        facilities (FacilitySet): IDs of buildings constructed in this base, in build order
         garrison (list): Units stationed at this base for defense
         supported_units (list): Units being supplied by this base
         current_production (str): Item currently being produced
@@ -87,7 +89,7 @@ class Base:
 
         # Base attributes
         self.population = 1
-        self.facilities = []  # Facility IDs in the base (e.g., 'perimeter_defense', 'network_node')
+        self.facilities = facilities.FacilitySet()  # Facility IDs in the base (e.g., 'perimeter_defense', 'network_node')
         self.free_facilities = []  # IDs of facilities that are free (for UI display with *)
         self.garrison = []  # Units stationed at this base (legacy - use get_garrison_units instead)
         self.supported_units = []  # Units this base supports
@@ -145,6 +147,9 @@ class Base:
         self.manual_include_coords = set()  # player explicitly wants these worked
         self.manual_exclude_coords = set()  # player explicitly doesn't want these worked
 
+        # Last worked-tile assignment (see get_worked_tiles); not saved
+        self._worked_tiles_cache = None
+
         # Initialise happiness so the citizens bar is correct before the first upkeep
         self.calculate_population_happiness()
 
@@ -170,7 +175,7 @@ class Base:
                     domain.append((tile, (nx, ny)))
         return domain
 
-    def get_unworkable_coords(self, game_map, all_bases):
+    def get_unworkable_coords(self, game_map, all_bases, base_index=None):
         """Return the set of coords in this base's fat cross that are closer to
         any other base — friendly or enemy — and thus not workable by this base.
 
@@ -180,18 +185,27 @@ class Base:
         Args:
             game_map: GameMap instance
             all_bases: list of every Base object in the game
+            base_index (BaseIndex): Spatial index of all_bases (optional).  When
+                given, only bases near enough to contest the fat cross are checked.
 
         Returns:
             set: Coordinates (x, y) that this base cannot work
         """
         unworkable = set()
         width = game_map.width
-        for _, coord in self._get_fat_cross_domain(game_map):
+        domain = [(coord, _manhattan_dist(self.x, self.y, coord[0], coord[1], width))
+                  for _, coord in self._get_fat_cross_domain(game_map)]
+        if base_index is not None and domain:
+            # A rival can only be at least as close to a domain tile if it is
+            # within twice the farthest domain distance of this base
+            reach = 2 * max(dist for _, dist in domain)
+            rivals = base_index.bases_within(self.x, self.y, reach)
+        else:
+            rivals = all_bases
+        rivals = [other for other in rivals if other is not self]
+        for coord, my_dist in domain:
             cx, cy = coord
-            my_dist = _manhattan_dist(self.x, self.y, cx, cy, width)
-            for other in all_bases:
-                if other is self:
-                    continue
+            for other in rivals:
                 other_dist = _manhattan_dist(other.x, other.y, cx, cy, width)
                 if other_dist < my_dist or (
                     other_dist == my_dist
@@ -210,6 +224,10 @@ class Base:
         score (nutrients×4 + minerals×2 + energy×1), skipping manually-excluded
         tiles.  Ties broken deterministically by map position.
 
+        The assignment is cached and only recomputed when population,
+        specialist count, the manual include/exclude sets, the unworkable
+        set, or the yields of a domain tile change.
+
         Args:
             game_map: GameMap instance
             unworkable_coords: optional set of (x,y) coords claimed by a nearby
@@ -218,7 +236,40 @@ class Base:
         Returns:
             list[Tile]: Tiles being worked (base tile first)
         """
-        from game.map import tile_base_nutrients, tile_base_minerals, tile_base_energy
+        store = game_map.terrain
+        key = (
+            self.population,
+            len(getattr(self, 'specialists', [])),
+            frozenset(self.manual_include_coords),
+            frozenset(self.manual_exclude_coords),
+            frozenset(unworkable_coords) if unworkable_coords else frozenset(),
+        )
+        cache = self._worked_tiles_cache
+        if cache is not None and cache['store'] is store and cache['key'] == key:
+            if cache['epoch'] == store.yield_epoch:
+                return list(cache['tiles'])
+            # Some tile changed somewhere on the map — reuse unless it was in our domain
+            versions = store.yield_version.take(cache['domain_indices'])
+            if np.array_equal(versions, cache['versions']):
+                cache['epoch'] = store.yield_epoch
+                return list(cache['tiles'])
+
+        tiles = self._assign_worked_tiles(game_map, unworkable_coords)
+        domain_indices = np.array([y * game_map.width + x for _, (x, y) in self._get_fat_cross_domain(game_map)],
+                                  dtype=np.intp)
+        self._worked_tiles_cache = {
+            'store': store,
+            'key': key,
+            'epoch': store.yield_epoch,
+            'domain_indices': domain_indices,
+            'versions': store.yield_version.take(domain_indices),
+            'tiles': tiles,
+        }
+        return list(tiles)
+
+    def _assign_worked_tiles(self, game_map, unworkable_coords=None):
+        """Compute the worked-tile assignment for get_worked_tiles (uncached)."""
+        from game.map import tile_yields
 
         base_tile = game_map.get_tile(self.x, self.y)
         if base_tile is None:
@@ -261,9 +312,10 @@ class Base:
                     continue
                 if coord in placed_coords:
                     continue
-                score = (tile_base_nutrients(tile) * 4
-                         + tile_base_minerals(tile) * 2
-                         + tile_base_energy(tile))
+                yields = tile_yields(tile)
+                score = (yields.base_nutrients * 4
+                         + yields.base_minerals * 2
+                         + yields.base_energy)
                 nx, ny = coord
                 # Adjust dx for east-west wrapping to get true ring distance
                 adx = nx - self.x
@@ -344,9 +396,8 @@ class Base:
         Returns:
             tuple: (nutrients_per_turn, minerals_per_turn, energy_per_turn)
         """
-        from game.map import tile_base_nutrients, tile_base_minerals, tile_base_energy
+        from game.map import tile_yields
         from game.data.faction_data import FACTION_DATA
-        from game.terraforming import get_tile_yields
         bonuses = FACTION_DATA[self.owner].get('bonuses', {}) if self.owner < len(FACTION_DATA) else {}
         fungus_nut_bonus = bonuses.get('fungus_nutrients', 0)
 
@@ -355,20 +406,10 @@ class Base:
         m = 0
         e = 0
         for t in worked:
-            imp_yields = get_tile_yields(t)
-            if imp_yields['fixed']:
-                fn, fm, fe = imp_yields['fixed']
-                n += fn
-                m += fm
-                e += fe
-            else:
-                tn = tile_base_nutrients(t) + imp_yields['nutrients']
-                tm = tile_base_minerals(t) + imp_yields['minerals']
-                te = tile_base_energy(t) + imp_yields['energy']
-                mult = imp_yields['nutrients_multiplier']
-                n += int(tn * mult)
-                m += tm
-                e += te
+            yields = tile_yields(t)
+            n += yields.nutrients
+            m += yields.minerals
+            e += yields.energy
 
         # Deirdre: +1 nutrient per fungus tile worked (including base tile)
         if fungus_nut_bonus:
@@ -627,7 +668,7 @@ class Base:
         # Compute tiles claimed by closer bases — friendly or enemy (once per turn)
         unworkable_coords = None
         if game is not None:
-            unworkable_coords = self.get_unworkable_coords(game.game_map, game.bases)
+            unworkable_coords = self.get_unworkable_coords(game.game_map, game.bases, game.base_index)
 
         # Calculate energy production and allocate it
         self.calculate_energy_output(game, unworkable_coords=unworkable_coords)
@@ -665,6 +706,7 @@ class Base:
         tank_capacity = columns * (1 + self.population)
 
         self.nutrients_accumulated += nut_surplus
+        population_before = self.population
 
         if self.nutrients_accumulated < 0:
             # Starvation: lose a citizen, reset tanks
@@ -698,6 +740,10 @@ class Base:
         # Recompute tank capacity after any population change, store for display
         self.nutrients_needed = columns * (1 + self.population)
 
+        # Population breaks territory ties, so re-resolve tiles around this base
+        if game is not None and self.population != population_before:
+            game.territory.update_territory_for_base(self, game.bases)
+
         # Update growth turns remaining
         self.growth_turns_remaining = self._calculate_growth_turns()
 
@@ -796,9 +842,9 @@ class Base:
             int: Total energy production
         """
         if game is not None:
-            from game.map import tile_base_energy
+            from game.map import tile_yields
             worked = self.get_worked_tiles(game.game_map, unworkable_coords=unworkable_coords)
-            self.energy_production = sum(tile_base_energy(t) for t in worked)
+            self.energy_production = sum(tile_yields(t).base_energy for t in worked)
             self.energy_per_turn = self.energy_production
         else:
             self.energy_production = 2
@@ -1053,7 +1099,7 @@ class Base:
 
         # Copy basic attributes
         base.population = data['population']
-        base.facilities = data['facilities']
+        base.facilities = facilities.FacilitySet(data['facilities'])
         base.free_facilities = data.get('free_facilities', [])  # Default to empty for old saves
         base.current_production = data['current_production']
         base.previous_production = data.get('previous_production', None)
@@ -0,0 +1,165 @@
+"""Spatial index of bases for proximity queries.
+
+Bases are bucketed into square blocks of the map so that "which bases are
+near this tile" only looks at the blocks around the tile instead of every
+base in the game.  Distances wrap east-west and are clamped north-south
+like the rest of the map.
+
+The Game keeps one BaseIndex in sync with game.bases (see Game.add_base and
+Game.remove_base).  Bases never move, and owner filters are applied at
+query time, so a captured base needs no index update.
+"""
+
+BUCKET_SIZE = 8  # Tiles per bucket side
+
+
+class BaseIndex:
+    """Grid-bucketed index of bases by map position.
+
+    Attributes:
+        width (int): Map width in tiles
+        height (int): Map height in tiles
+        bucket_size (int): Tiles per bucket side
+        version (int): Change counter, bumped whenever a base is added or removed
+    """
+
+    def __init__(self, width, height, bucket_size=BUCKET_SIZE):
+        """Create an empty index for a map.
+
+        Args:
+            width (int): Map width in tiles
+            height (int): Map height in tiles
+            bucket_size (int): Tiles per bucket side
+        """
+        self.width = width
+        self.height = height
+        self.bucket_size = bucket_size
+        self._buckets = {}  # (col, row) -> list of bases
+        self._count = 0
+        self.version = 0
+
+    def __len__(self):
+        return self._count
+
+    def _bucket_key(self, x, y):
+        return (x // self.bucket_size, y // self.bucket_size)
+
+    def add(self, base):
+        """Add a base to the index.
+
+        Args:
+            base (Base): Base to add
+        """
+        self._buckets.setdefault(self._bucket_key(base.x, base.y), []).append(base)
+        self._count += 1
+        self.version += 1
+
+    def remove(self, base):
+        """Remove a base from the index (no-op if it is not indexed).
+
+        Args:
+            base (Base): Base to remove
+        """
+        bucket = self._buckets.get(self._bucket_key(base.x, base.y))
+        if bucket and base in bucket:
+            bucket.remove(base)
+            self._count -= 1
+            self.version += 1
+
+    def rebuild(self, bases):
+        """Replace the index contents with a new list of bases.
+
+        Args:
+            bases (list): All bases in the game
+        """
+        self._buckets = {}
+        self._count = 0
+        self.version += 1
+        for base in bases:
+            self.add(base)
+
+    def distance(self, x1, y1, x2, y2, chebyshev=False):
+        """Distance between two tiles with east-west wrapping.
+
+        Args:
+            x1, y1 (int): First tile
+            x2, y2 (int): Second tile
+            chebyshev (bool): Use Chebyshev (king move) distance instead of Manhattan
+
+        Returns:
+            int: Distance in tiles
+        """
+        dx = abs(x2 - x1)
+        if dx > self.width // 2:
+            dx = self.width - dx
+        dy = abs(y2 - y1)
+        return max(dx, dy) if chebyshev else dx + dy
+
+    def _buckets_near(self, x, y, radius):
+        """Yield the non-empty buckets that may hold tiles within radius of (x, y)."""
+        size = self.bucket_size
+        if 2 * radius + 1 >= self.width:
+            cols = range((self.width - 1) // size + 1)
+        else:
+            cols = sorted({((x + dx) % self.width) // size for dx in range(-radius, radius + 1)})
+        first_row = max(0, y - radius) // size
+        last_row = min(self.height - 1, y + radius) // size
+        for row in range(first_row, last_row + 1):
+            for col in cols:
+                bucket = self._buckets.get((col, row))
+                if bucket:
+                    yield bucket
+
+    def bases_within(self, x, y, radius, owner=None, chebyshev=False):
+        """Find every base within a distance of a tile.
+
+        Args:
+            x (int): Tile X coordinate
+            y (int): Tile Y coordinate
+            radius (int): Maximum distance (inclusive)
+            owner (int): Only return bases owned by this faction (optional)
+            chebyshev (bool): Measure radius as Chebyshev instead of Manhattan distance
+
+        Returns:
+            list: Bases within radius, in no particular order
+        """
+        found = []
+        for bucket in self._buckets_near(x, y, radius):
+            for base in bucket:
+                if owner is not None and base.owner != owner:
+                    continue
+                if self.distance(x, y, base.x, base.y, chebyshev) <= radius:
+                    found.append(base)
+        return found
+
+    def nearest_base(self, x, y, owner=None, chebyshev=False):
+        """Find the base closest to a tile.
+
+        Searches outward in doubling radii, so nearby bases are found
+        without looking at the rest of the map.  Ties go to the base with
+        the lower (y, x).
+
+        Args:
+            x (int): Tile X coordinate
+            y (int): Tile Y coordinate
+            owner (int): Only consider bases owned by this faction (optional)
+            chebyshev (bool): Use Chebyshev instead of Manhattan distance
+
+        Returns:
+            tuple: (base, distance), or (None, None) if no base matches
+        """
+        max_radius = self.width // 2 + self.height
+        radius = self.bucket_size
+        while True:
+            candidates = self.bases_within(x, y, radius, owner, chebyshev)
+            if candidates:
+                best = min(candidates,
+                           key=lambda b: (self.distance(x, y, b.x, b.y, chebyshev), b.y, b.x))
+                return best, self.distance(x, y, best.x, best.y, chebyshev)
+            if radius >= max_radius:
+                return None, None
+            radius = min(radius * 2, max_radius)
+
+    def closest_base(self, x, y):
+        """Return the base closest to a tile regardless of owner, or None."""
+        return self.nearest_base(x, y)[0]
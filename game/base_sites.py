@@ -0,0 +1,189 @@
+"""Base-site quality map shared by every faction.
+
+Scores every tile as a place to found a base: the yields of its fat cross
+(the 21 tiles a base can work, itself included) weighted like Base's
+worked-tile auto-assignment, plus whether Game.can_found_base would allow
+a base there at all (terrain and spacing).
+
+The map is refreshed lazily.  Only tiles whose yields changed since the
+last refresh are rescored (TerrainStore.yield_version), and base spacing
+is updated base by base when bases are founded or destroyed
+(BaseIndex.version), so colony pods of all factions read the same arrays
+instead of scanning the area around themselves.
+"""
+
+import numpy as np
+
+from game.map import tile_yields
+from game.map_arrays import shift_grid
+from game.terrain_store import improvement_bit
+
+# Same weights as Base auto-assigning worked tiles
+NUTRIENT_WEIGHT = 4
+MINERAL_WEIGHT = 2
+ENERGY_WEIGHT = 1
+
+# Quality lost per tile a colony pod has to walk to reach a site
+SITE_DISTANCE_PENALTY = 6.0
+
+# The fat cross: 5x5 minus the corners, base tile included
+FAT_CROSS_OFFSETS = [(dx, dy) for dy in range(-2, 3) for dx in range(-2, 3)
+                     if not (abs(dx) == 2 and abs(dy) == 2)]
+
+
+class BaseSiteMap:
+    """Fat-cross yield scores and founding legality for every tile.
+
+    Accessed via game.base_sites.
+
+    Attributes:
+        quality (ndarray): Weighted fat-cross yield of each tile, indexed [y][x]
+        buildable (ndarray): True where terrain allows a base (ignores spacing)
+        nearby_bases (ndarray): Bases on or adjacent to each tile
+    """
+
+    def __init__(self, game):
+        """Initialize site map (arrays are built on first use).
+
+        Args:
+            game (Game): Reference to main game instance
+        """
+        self.game = game
+        self.quality = None
+        self.buildable = None
+        self.nearby_bases = None
+        self._store = None
+        self._epoch = None
+        self._versions = None  # yield_version when each tile was last scored
+        self._tile_scores = None
+        self._base_version = None
+        self._base_tiles = set()  # (x, y) of the bases counted in nearby_bases
+
+    def refresh(self):
+        """Bring scores and spacing up to date with the map and bases."""
+        game = self.game
+        store = game.game_map.terrain
+        if store is not self._store:
+            # New map: start from scratch
+            self._store = store
+            self._epoch = None
+            self._versions = np.full(store.yield_version.shape, -1, dtype=np.int64)
+            self._tile_scores = np.zeros(store.land.shape)
+            self.nearby_bases = np.zeros(store.land.shape, dtype=np.int16)
+            self._base_version = None
+            self._base_tiles = set()
+
+        if store.yield_epoch != self._epoch:
+            self._epoch = store.yield_epoch
+            self._rescore(store)
+
+        if game.base_index.version != self._base_version:
+            self._base_version = game.base_index.version
+            current = {(base.x, base.y) for base in game.bases}
+            for x, y in current - self._base_tiles:
+                self._mark_base(x, y, 1)
+            for x, y in self._base_tiles - current:
+                self._mark_base(x, y, -1)
+            self._base_tiles = current
+
+    def _rescore(self, store):
+        """Rescore tiles whose yields changed and rebuild the derived grids."""
+        game_map = self.game.game_map
+        width = game_map.width
+        changed = np.flatnonzero(store.yield_version.ravel() != self._versions.ravel())
+        scores = self._tile_scores.ravel()
+        void = store.void.ravel()
+        for index in changed.tolist():
+            if void[index]:
+                continue
+            y, x = divmod(index, width)
+            record = tile_yields(game_map.get_tile(x, y))
+            scores[index] = (record.nutrients * NUTRIENT_WEIGHT + record.minerals * MINERAL_WEIGHT
+                             + record.energy * ENERGY_WEIGHT)
+        self._versions = store.yield_version.astype(np.int64)
+
+        quality = np.zeros(store.land.shape)
+        for dx, dy in FAT_CROSS_OFFSETS:
+            quality += shift_grid(self._tile_scores, dx, dy, 0)
+        self.quality = quality
+
+        # Terrain rules from Game.can_found_base
+        improvements = store.improvements
+        fungus = np.where(store.land,
+                          ((improvements & np.uint64(improvement_bit('fungus'))) != 0) | store.fungus,
+                          (improvements & np.uint64(improvement_bit('sea_fungus'))) != 0)
+        rocky = store.land & (store.rockiness == 2)
+        self.buildable = ~(store.void | fungus | rocky | store.monolith)
+
+    def _mark_base(self, x, y, delta):
+        """Add delta to nearby_bases on a base tile and its neighbours."""
+        game_map = self.game.game_map
+        ys = np.arange(max(0, y - 1), min(game_map.height, y + 2))
+        xs = np.arange(x - 1, x + 2) % game_map.width
+        self.nearby_bases[np.ix_(ys, xs)] += delta
+
+    def can_found(self, x, y):
+        """Return True if a base may be founded at (x, y) (terrain and spacing).
+
+        Args:
+            x (int): Tile X coordinate
+            y (int): Tile Y coordinate
+
+        Returns:
+            bool: Same answer as Game.can_found_base for a pod with moves left
+        """
+        self.refresh()
+        return bool(self.buildable[y, x]) and self.nearby_bases[y, x] == 0
+
+    def best_site(self, x, y, radius, ocean, regions=None):
+        """Find the best legal site near a tile.
+
+        Sites are ranked by quality minus SITE_DISTANCE_PENALTY per tile of
+        Chebyshev distance; ties go to the first in row order.
+
+        Args:
+            x (int): Search centre X
+            y (int): Search centre Y
+            radius (int): Chebyshev search radius
+            ocean (bool): Look for ocean sites (sea pods) instead of land sites
+            regions (tuple): (region grid, region id) to only accept sites in
+                one land/ocean region (see PathFinder.region_labels), or None
+
+        Returns:
+            tuple: (x, y) of the best site, or None if there is none
+        """
+        self.refresh()
+        store = self.game.game_map.terrain
+        width, height = store.width, store.height
+        ys = np.arange(max(0, y - radius), min(height, y + radius + 1))
+        xs = (x + np.arange(-radius, radius + 1)) % width
+        window = np.ix_(ys, xs)
+
+        legal = self.buildable[window] & (self.nearby_bases[window] == 0)
+        legal &= ~store.land[window] if ocean else store.land[window]
+        if regions is not None:
+            grid, region = regions
+            legal &= grid[window] == region
+        if not legal.any():
+            return None
+
+        distance = np.maximum(np.abs(ys - y)[:, None], np.abs(np.arange(-radius, radius + 1))[None, :])
+        score = np.where(legal, self.quality[window] - SITE_DISTANCE_PENALTY * distance, -np.inf)
+        row, col = np.unravel_index(np.argmax(score), score.shape)
+        return int(xs[col]), int(ys[row])
+
+    def site_scores(self, ocean=False):
+        """Return quality where a base could be founded and NaN elsewhere.
+
+        Meant for a "suggest base site" overlay.
+
+        Args:
+            ocean (bool): Score ocean sites instead of land sites
+
+        Returns:
+            ndarray: Float grid indexed [y][x]
+        """
+        self.refresh()
+        land = self.game.game_map.terrain.land
+        legal = self.buildable & (self.nearby_bases == 0) & (~land if ocean else land)
+        return np.where(legal, self.quality, np.nan)
@@ -183,7 +183,7 @@ class CommerceCalculator:
 
     def _rank_bases_by_energy(self, faction_id):
         """Return faction's bases sorted by energy output (highest first)."""
-        faction_bases = [b for b in self.game.bases if b.owner == faction_id]
+        faction_bases = self.game.faction_bases(faction_id)
         return sorted(
             faction_bases,
             key=lambda b: b.energy_production,
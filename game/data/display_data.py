@@ -47,4 +47,5 @@ COLOR_COUNCIL_BOX = (25, 35, 30)
 
 # Timing constants (milliseconds)
 AI_TURN_DELAY = 300  # Delay between AI unit moves
+AI_FRAME_BUDGET = 8  # Fast AI mode: milliseconds of AI work per frame
 SCROLL_DELAY = 300  # Delay between scroll ticks
\ No newline at end of file
@@ -181,7 +181,7 @@ class DebugManager:
         count = 0
         for tech_id in all_techs:
             if not player_tech_tree.has_tech(tech_id):
-                player_tech_tree.discovered_techs.add(tech_id)
+                player_tech_tree.discover(tech_id)
                 count += 1
 
         game.set_status_message(f"DEBUG: Granted {count} technologies")
@@ -228,7 +228,7 @@ class DebugManager:
         if unit.type == 'land':
             unit.has_artillery = True
 
-        game.units.append(unit)
+        game.add_unit(unit)
         game.game_map.add_unit_at(x, y, unit)
         game.set_status_message(f"DEBUG: Spawned {unit.name} at ({x}, {y})")
         print(f"DEBUG: Spawned {name} at ({x}, {y})")
@@ -248,8 +248,7 @@ class DebugManager:
         # Remove from map
         game.game_map.remove_unit_at(unit.x, unit.y, unit)
         # Remove from game units list
-        if unit in game.units:
-            game.units.remove(unit)
+        game._unregister_unit(unit)
         # Deselect if it was selected
         if game.selected_unit == unit:
             game.selected_unit = None
@@ -274,27 +273,28 @@ class DebugManager:
         # Create base
         base_name = f"Debug Base {len(game.bases) + 1}"
         base = Base(x, y, game.player_id, base_name)
-        game.bases.append(base)
+        game.add_base(base)
         tile.base = base
 
         # Update territory
-        game.territory.update_territory(game.bases)
+        game.territory.update_territory_for_base(base, game.bases)
 
         game.set_status_message(f"DEBUG: Created {base_name} at ({x}, {y})")
         print(f"DEBUG: Created base at ({x}, {y})")
 
-    def draw_overlay(self, screen, font):
+    def draw_overlay(self, screen, font, game=None):
         """Draw debug mode overlay with available commands.
 
         Args:
             screen: Pygame screen surface
             font: Font to use for text
+            game: Game instance (optional, for cache statistics)
         """
         if not self.enabled or not self.show_help:
             return
 
         # Semi-transparent background
-        overlay = pygame.Surface((400, 450))
+        overlay = pygame.Surface((400, 480))
         overlay.set_alpha(220)
         overlay.fill((20, 20, 30))
         screen.blit(overlay, (10, 10))
@@ -333,6 +333,14 @@ class DebugManager:
             screen.blit(text, (20, y))
             y += 22
 
+        # Tile yield cache statistics
+        if game is not None:
+            store = game.game_map.terrain
+            stats = (f"Yield cache: {store.yield_cache_hits} hits / "
+                     f"{store.yield_cache_misses} misses ({len(store.yield_cache)} tiles)")
+            screen.blit(small_font.render(stats, True, (150, 200, 150)), (20, y))
+            y += 22
+
         # Show current spawn mode
         if self.cursor_spawn_mode:
             mode_text = font.render("SPAWN MODE ACTIVE", True, (255, 255, 100))
@@ -5,9 +5,84 @@ This module contains all base facilities (buildings) and secret projects
 that can be constructed in bases. Each facility has tech prerequisites,
 costs, maintenance, and effects.
 """
+from collections import namedtuple
+from collections.abc import MutableSet
+from types import MappingProxyType
+
 from game.data.facility_data import FACILITIES, SECRET_PROJECTS
 
 
+def _build_index(key):
+    """Map a record field to its record; regular facilities win over projects."""
+    index = {}
+    for record in FACILITIES + SECRET_PROJECTS:
+        index.setdefault(record[key], record)
+    return MappingProxyType(index)
+
+
+# Read-only lookup tables built once at import
+FACILITIES_BY_ID = _build_index('id')
+FACILITIES_BY_NAME = _build_index('name')
+SECRET_PROJECT_IDS = frozenset(project['id'] for project in SECRET_PROJECTS)
+
+# Facilities whose effect reaches every unit of the owning faction, not just
+# the base they are built in. Game tracks which factions own one.
+GLOBAL_EFFECT_FACILITIES = frozenset({'nano_factory', 'xenoempathy_dome'})
+
+# What a faction can currently build: facility/project IDs plus the
+# facility and project records in data order.
+Buildable = namedtuple('Buildable', ['ids', 'facilities', 'projects'])
+
+
+class FacilitySet(MutableSet):
+    """Insertion-ordered set of the facility IDs built in a base.
+
+    Keeps the list-style append()/remove() and indexing that older code
+    uses. `on_change(facility_id)` is called after every add or removal,
+    if set.
+    """
+
+    __slots__ = ('_ids', 'on_change')
+
+    def __init__(self, facility_ids=(), on_change=None):
+        self._ids = dict.fromkeys(facility_ids)
+        self.on_change = on_change
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Results of &, |, - etc. are plain sets
+        return set(it)
+
+    def __contains__(self, facility_id):
+        return facility_id in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        return list(self._ids)[index]
+
+    def add(self, facility_id):
+        if facility_id not in self._ids:
+            self._ids[facility_id] = None
+            if self.on_change is not None:
+                self.on_change(facility_id)
+
+    def discard(self, facility_id):
+        if facility_id in self._ids:
+            del self._ids[facility_id]
+            if self.on_change is not None:
+                self.on_change(facility_id)
+
+    append = add
+
+    def __repr__(self):
+        return f"FacilitySet({list(self._ids)!r})"
+
+
 def get_facility_by_id(facility_id):
     """Get facility data by ID.
 
@@ -17,13 +92,7 @@ def get_facility_by_id(facility_id):
     Returns:
         dict: Facility data, or None if not found
     """
-    for facility in FACILITIES:
-        if facility['id'] == facility_id:
-            return facility
-    for project in SECRET_PROJECTS:
-        if project['id'] == facility_id:
-            return project
-    return None
+    return FACILITIES_BY_ID.get(facility_id)
 
 
 def get_facility_by_name(name):
@@ -35,13 +104,19 @@ def get_facility_by_name(name):
     Returns:
         dict: Facility data, or None if not found
     """
-    for facility in FACILITIES:
-        if facility['name'] == name:
-            return facility
-    for project in SECRET_PROJECTS:
-        if project['name'] == name:
-            return project
-    return None
+    return FACILITIES_BY_NAME.get(name)
+
+
+def is_secret_project(facility_id):
+    """Check whether a facility ID is a secret project.
+
+    Args:
+        facility_id (str): Facility ID
+
+    Returns:
+        bool: True if it is a secret project
+    """
+    return facility_id in SECRET_PROJECT_IDS
 
 
 def is_facility_available(facility, tech_tree):
@@ -90,3 +165,28 @@ def get_available_projects(tech_tree, completed_secret_projects):
         if project['id'] not in completed_secret_projects and is_facility_available(project, tech_tree):
             available.append(project)
     return available
+
+
+def get_buildable(faction, completed_secret_projects):
+    """Get what a faction can build, recomputing only when it could change.
+
+    Techs are only ever added and projects only ever completed, so the
+    number of discovered techs and completed projects identify the state.
+    The result is cached on the faction until one of them changes.
+
+    Args:
+        faction (Faction): Faction to check
+        completed_secret_projects (dict): {project_id: {...}} of globally built projects
+
+    Returns:
+        Buildable: (ids frozenset, facilities tuple, projects tuple)
+    """
+    tech_tree = faction.tech_tree
+    key = (tech_tree, len(tech_tree.discovered_techs), len(completed_secret_projects))
+    if faction.buildable_key != key:
+        available_facilities = tuple(get_available_facilities(tech_tree))
+        available_projects = tuple(get_available_projects(tech_tree, completed_secret_projects))
+        ids = frozenset(f['id'] for f in available_facilities + available_projects)
+        faction.buildable = Buildable(ids, available_facilities, available_projects)
+        faction.buildable_key = key
+    return faction.buildable
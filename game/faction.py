@@ -20,6 +20,7 @@ class Faction:
         energy_credits (int): Current energy credits
         bases (list): References to bases owned by this faction
         units (list): References to units owned by this faction
+        global_facilities (set): Global-effect facility IDs owned by any of its bases
     """
 
     def __init__(self, faction_id, is_player=False):
@@ -46,6 +47,9 @@ class Faction:
         self.bases = []  # List of Base objects
         self.units = []  # List of Unit objects
 
+        # Global-effect facilities (e.g. Nano Factory) owned by any base (maintained by Game)
+        self.global_facilities = set()
+
         # Diplomacy (this faction's view of others)
         # Key: other_faction_id, Value: status ('Vendetta', 'Treaty', 'Pact', etc.)
         self.relations = {}
@@ -53,6 +57,10 @@ class Faction:
         # Contact status (which factions have been discovered)
         self.contacts = set()  # Set of faction_ids
 
+        # Cached facilities.get_buildable() result and the state it was built for
+        self.buildable = None
+        self.buildable_key = None
+
         # AI-specific state (only used if not is_player)
         self.ai_personality = None  # Will be AIPersonality if AI
         self.ai_strategic_state = None  # Will be StrategicState if AI
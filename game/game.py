@@ -18,12 +18,15 @@ from game import facilities
 from game.map import GameMap
 from game.units.unit import Unit
 from game.base import Base
+from game.base_index import BaseIndex
+from game.base_sites import BaseSiteMap
 from game.ai import AIPlayer
 from game.tech import TechTree
 from game.territory import TerritoryManager
 from game.units.combat import Combat
 from game.commerce import CommerceCalculator
 from game.units.movement import MovementManager
+from game.units.pathfinding import PathFinder
 from game.turn_manager import TurnManager
 from game.debug import DebugManager  # DEBUG: Remove for release
 
@@ -83,6 +86,7 @@ class Game:
 
         # Base management
         self.bases = []
+        self.base_index = BaseIndex(self.game_map.width, self.game_map.height)
 
         # Status message
         self.status_message = ""
@@ -110,6 +114,8 @@ class Game:
         # Battle system
         self.combat = Combat(self)
         self.movement = MovementManager(self)
+        self.pathfinder = PathFinder(self)
+        self.base_sites = BaseSiteMap(self)
         self.turns = TurnManager(self)
         self.pending_treaty_break = None  # Dict for player attacks that might break treaties
         self.pending_ai_attack = None  # Dict for AI surprise attacks
@@ -141,7 +147,7 @@ class Game:
         }
 
         # Territory
-        self.territory = TerritoryManager(self.game_map)
+        self.territory = TerritoryManager(self.game_map, self.base_index)
 
         # AI players (one for each AI faction)
         self.ai_players = [AIPlayer(fid) for fid in self.ai_faction_ids]
@@ -233,7 +239,7 @@ class Game:
             tech_tree = self.factions[faction_id].tech_tree
             starting_tech = FACTION_DATA[faction_id].get('starting_tech')
             if starting_tech and starting_tech in tech_tree.technologies:
-                tech_tree.discovered_techs.add(starting_tech)
+                tech_tree.discover(starting_tech)
                 tech_name = tech_tree.technologies[starting_tech]['name']
                 is_player = (faction_id == self.player_faction_id)
                 prefix = "Player" if is_player else f"AI Faction {faction_id}"
@@ -306,7 +312,7 @@ class Game:
                     ability1=military_design.get('ability1', 'none'),
                     ability2=military_design.get('ability2', 'none')
                 )
-                self.units.append(scout)
+                self.add_unit(scout)
                 self.game_map.set_unit_at(x, y, scout)
                 print(f"Spawned {faction_prefix} {military_name} at ({x}, {y})")
 
@@ -331,14 +337,14 @@ class Game:
                     ability1=colony_design.get('ability1', 'none'),
                     ability2=colony_design.get('ability2', 'none')
                 )
-                self.units.append(colony)
+                self.add_unit(colony)
                 self.game_map.set_unit_at(x, y, colony)
                 print(f"Spawned {faction_prefix} {colony_name} at ({x}, {y})")
 
         print(f"Total units spawned: {len(self.units)}")
 
         # Auto-select starting colony pod; fall back to first friendly unit
-        friendly_units = [u for u in self.units if u.owner == self.player_faction_id]
+        friendly_units = self.faction_units(self.player_faction_id)
         colony_pods = [u for u in friendly_units if u.weapon == 'colony_pod']
         if friendly_units:
             self._select_unit(colony_pods[0] if colony_pods else friendly_units[0])
@@ -446,7 +452,7 @@ class Game:
             if available:
                 tech_id, tech_data = random.choice(available)
                 tech_name = tech_data.get('name', tech_id)
-                tech_tree.discovered_techs.add(tech_id)
+                tech_tree.discover(tech_id)
                 # If they were researching this tech, clear it (it's done)
                 if tech_tree.current_research == tech_id:
                     tech_tree.current_research = None
@@ -485,7 +491,7 @@ class Game:
             )
             artifact.moves_remaining = 0  # Can't move on turn discovered
             artifact.has_moved = True
-            self.units.append(artifact)
+            self.add_unit(artifact)
             self.game_map.add_unit_at(tile.x, tile.y, artifact)
 
             if unit.owner == self.player_faction_id:
@@ -561,7 +567,7 @@ class Game:
                     old_owner = artifact.owner
                     self.game_map.remove_unit_at(artifact.x, artifact.y, artifact)
                     artifact.move_to(nx, ny)
-                    artifact.owner = adj_unit.owner
+                    self.set_unit_owner(artifact, adj_unit.owner)
                     self.game_map.add_unit_at(nx, ny, artifact)
                     if old_owner == self.player_faction_id:
                         thief_faction = self.factions.get(adj_unit.owner, {})
@@ -614,6 +620,142 @@ class Game:
             if unit.owner == self.player_faction_id:
                 self.set_status_message(f"{unit.name} visited Monolith (already Elite)")
 
+    def add_base(self, base):
+        """Register a new base with the game (bases list, faction registry, spatial index).
+
+        Args:
+            base (Base): Base to add
+        """
+        self.bases.append(base)
+        faction = self.factions.get(base.owner)
+        if faction is not None:
+            faction.bases.append(base)
+        self.base_index.add(base)
+        self._watch_facilities(base)
+        self._refresh_global_facilities(base.owner)
+
+    def remove_base(self, base):
+        """Unregister a base from the game (bases list, faction registry, spatial index).
+
+        Args:
+            base (Base): Base to remove
+        """
+        if base in self.bases:
+            self.bases.remove(base)
+        faction = self.factions.get(base.owner)
+        if faction is not None and base in faction.bases:
+            faction.bases.remove(base)
+        self.base_index.remove(base)
+        base.facilities.on_change = None
+        self._refresh_global_facilities(base.owner)
+
+    def set_base_owner(self, base, new_owner):
+        """Transfer a base to another faction (capture, mind control).
+
+        Args:
+            base (Base): Base changing hands
+            new_owner (int): Faction ID of the new owner
+        """
+        old_owner = base.owner
+        base.owner = new_owner
+        self._refresh_faction_registry(old_owner)
+        self._refresh_faction_registry(new_owner)
+        self._refresh_global_facilities(old_owner)
+        self._refresh_global_facilities(new_owner)
+
+    def add_unit(self, unit):
+        """Register a new unit with the game (units list and faction registry).
+
+        Does not place the unit on the map.
+
+        Args:
+            unit (Unit): Unit to add
+        """
+        self.units.append(unit)
+        faction = self.factions.get(unit.owner)
+        if faction is not None:
+            faction.units.append(unit)
+
+    def _unregister_unit(self, unit):
+        """Drop a unit from the units list and its faction registry."""
+        if unit in self.units:
+            self.units.remove(unit)
+        self.pathfinder.forget(unit)
+        faction = self.factions.get(unit.owner)
+        if faction is not None and unit in faction.units:
+            faction.units.remove(unit)
+
+    def set_unit_owner(self, unit, new_owner):
+        """Transfer a unit to another faction (artifact capture, mind control).
+
+        Args:
+            unit (Unit): Unit changing hands
+            new_owner (int): Faction ID of the new owner
+        """
+        old_owner = unit.owner
+        unit.owner = new_owner
+        self._refresh_faction_registry(old_owner)
+        self._refresh_faction_registry(new_owner)
+
+    def _refresh_faction_registry(self, faction_id):
+        """Rebuild one faction's base and unit lists from the global lists.
+
+        Keeps the registry in the same order as game.bases / game.units.
+        """
+        faction = self.factions.get(faction_id)
+        if faction is None:
+            return
+        faction.bases = [b for b in self.bases if b.owner == faction_id]
+        faction.units = [u for u in self.units if u.owner == faction_id]
+
+    def rebuild_faction_registries(self):
+        """Rebuild every faction's base and unit lists (new game, loaded save)."""
+        for base in self.bases:
+            self._watch_facilities(base)
+        for faction_id in self.factions:
+            self._refresh_faction_registry(faction_id)
+            self._refresh_global_facilities(faction_id)
+
+    def _watch_facilities(self, base):
+        """Route a base's facility changes to the global-effect flags."""
+        def on_change(facility_id):
+            if facility_id in facilities.GLOBAL_EFFECT_FACILITIES:
+                self._refresh_global_facilities(base.owner)
+        base.facilities.on_change = on_change
+
+    def _refresh_global_facilities(self, faction_id):
+        """Recompute which global-effect facilities a faction owns anywhere."""
+        faction = self.factions.get(faction_id)
+        if faction is None:
+            return
+        faction.global_facilities = {
+            facility_id for b in faction.bases for facility_id in b.facilities
+            if facility_id in facilities.GLOBAL_EFFECT_FACILITIES
+        }
+
+    def faction_has_facility(self, faction_id, facility_id):
+        """Check whether any base of a faction has a global-effect facility.
+
+        Args:
+            faction_id (int): Faction to check
+            facility_id (str): ID from facilities.GLOBAL_EFFECT_FACILITIES
+
+        Returns:
+            bool: True if the faction owns the facility somewhere
+        """
+        faction = self.factions.get(faction_id)
+        return faction is not None and facility_id in faction.global_facilities
+
+    def faction_bases(self, faction_id):
+        """Return the list of bases owned by a faction (do not modify)."""
+        faction = self.factions.get(faction_id)
+        return faction.bases if faction is not None else []
+
+    def faction_units(self, faction_id):
+        """Return the list of units owned by a faction (do not modify)."""
+        faction = self.factions.get(faction_id)
+        return faction.units if faction is not None else []
+
     def _remove_unit(self, unit, killer=None):
         """Remove a unit from the game completely.
 
@@ -624,16 +766,14 @@ class Game:
         # If this is a transport with loaded units, destroy them too
         if hasattr(unit, 'loaded_units') and unit.loaded_units:
             for loaded_unit in unit.loaded_units[:]:  # Copy list to avoid modification during iteration
-                if loaded_unit in self.units:
-                    self.units.remove(loaded_unit)
+                self._unregister_unit(loaded_unit)
                 # Remove from home base's supported units list
                 if hasattr(loaded_unit, 'home_base') and loaded_unit.home_base:
                     if loaded_unit in loaded_unit.home_base.supported_units:
                         loaded_unit.home_base.supported_units.remove(loaded_unit)
 
         # Remove from units list
-        if unit in self.units:
-            self.units.remove(unit)
+        self._unregister_unit(unit)
 
         # Remove from map
         tile = self.game_map.get_tile(unit.x, unit.y)
@@ -659,7 +799,7 @@ class Game:
                     old_owner = artifact.owner
                     self.game_map.remove_unit_at(artifact.x, artifact.y, artifact)
                     artifact.move_to(killer.x, killer.y)
-                    artifact.owner = killer.owner
+                    self.set_unit_owner(artifact, killer.owner)
                     self.game_map.add_unit_at(killer.x, killer.y, artifact)
                     if old_owner == self.player_faction_id:
                         killer_faction = self.factions.get(killer.owner, {})
@@ -788,8 +928,8 @@ class Game:
         """
         units_to_remove = []
 
-        for unit in self.units:
-            if unit.owner != player_id or not unit.is_air_unit():
+        for unit in self.faction_units(player_id):
+            if not unit.is_air_unit():
                 continue
 
             # Check if unit is at a friendly base
@@ -805,7 +945,7 @@ class Game:
                     self.set_status_message(f"{unit.name} crashed! Out of fuel!")
                     print(f"{unit.name} crashed at ({unit.x}, {unit.y}) - out of fuel")
                     units_to_remove.append(unit)
-                elif not unit.can_reach_refuel_point(self.game_map, self.bases):
+                elif not unit.can_reach_refuel_point(self.game_map, self.bases, self.base_index):
                     # Warning: can't reach refuel point
                     self.set_status_message(f"WARNING: {unit.name} cannot reach base!")
 
@@ -821,10 +961,7 @@ class Game:
         """
         from game.units.repair import calculate_repair
 
-        for unit in self.units:
-            if unit.owner != player_id:
-                continue
-
+        for unit in self.faction_units(player_id):
             # Calculate repair using the repair module
             repair_amount = calculate_repair(unit, self)
 
@@ -892,7 +1029,7 @@ class Game:
                 if stealable:
                     stolen_tech = random.choice(list(stealable))
                     tech_name = player_tech_tree.technologies[stolen_tech]['name']
-                    player_tech_tree.discovered_techs.add(stolen_tech)
+                    player_tech_tree.discover(stolen_tech)
                     return True, f"Stole technology: {tech_name}!"
                 else:
                     return True, "No new technologies to steal"
@@ -932,13 +1069,15 @@ class Game:
             if success:
                 # Capture the base
                 old_owner = target_base.owner
-                target_base.owner = probe_unit.owner
+                self.set_base_owner(target_base, probe_unit.owner)
                 target_base.turns_since_capture = 0  # Mark as newly captured for disloyal citizens
 
                 # Transfer all units in the base
-                for unit in self.units:
-                    if unit.x == target_base.x and unit.y == target_base.y and unit.owner == old_owner:
-                        unit.owner = probe_unit.owner
+                for unit in list(self.faction_units(old_owner)):
+                    if unit.x == target_base.x and unit.y == target_base.y:
+                        self.set_unit_owner(unit, probe_unit.owner)
+
+                self.territory.update_territory_for_base(target_base, self.bases)
 
                 return True, f"Mind controlled {target_base.name}!"
             else:
@@ -1139,7 +1278,7 @@ class Game:
         faction_id = player_id
         if faction_id >= len(FACTION_DATA):
             # Fallback if faction not found
-            player_bases = [b for b in self.bases if b.owner == player_id]
+            player_bases = self.faction_bases(player_id)
             return f"Base {len(player_bases) + 1}"
 
         faction = FACTION_DATA[faction_id]
@@ -1147,11 +1286,11 @@ class Game:
 
         if not base_names:
             # Fallback if no base names defined
-            player_bases = [b for b in self.bases if b.owner == player_id]
+            player_bases = self.faction_bases(player_id)
             return f"Base {len(player_bases) + 1}"
 
         # Get existing base names for this player
-        player_bases = [b for b in self.bases if b.owner == player_id]
+        player_bases = self.faction_bases(player_id)
         used_names = {b.name for b in player_bases}
 
         # First base always gets the HQ name (first in list)
@@ -1188,7 +1327,7 @@ class Game:
         base = Base(unit.x, unit.y, unit.owner, base_name)
 
         # Check if this is the player's first base - if so, add Headquarters
-        player_bases = [b for b in self.bases if b.owner == unit.owner]
+        player_bases = self.faction_bases(unit.owner)
         if len(player_bases) == 0:
             base.facilities.append('headquarters')
             print(f"First base founded - Headquarters added automatically")
@@ -1236,7 +1375,7 @@ class Game:
                 base.governor_enabled = True
                 base.governor_mode = get_ai_governor_mode(unit.owner)
 
-        self.bases.append(base)
+        self.add_base(base)
 
         # Set initial production to the faction's actual slot 0 design name
         from game.governor import get_default_unit_name
@@ -1262,8 +1401,7 @@ class Game:
                 print(f"{other_unit.name} garrisoned at newly founded {base.name}")
 
         # Remove the unit (if still in list - may have been removed during faction elimination)
-        if unit in self.units:
-            self.units.remove(unit)
+        self._unregister_unit(unit)
 
         # Deselect if this was the selected unit
         if self.selected_unit == unit:
@@ -1275,7 +1413,7 @@ class Game:
                 self.last_unit_action = 'action'
 
         # Update territory
-        self.territory.update_territory(self.bases)
+        self.territory.update_territory_for_base(base, self.bases)
 
         # Center camera on newly founded base
         if unit.owner != self.player_faction_id:
@@ -1301,8 +1439,8 @@ class Game:
 
     def _get_hq_base(self, faction_id):
         """Return the Headquarters base for a faction, or None if none exists."""
-        for base in self.bases:
-            if base.owner == faction_id and 'headquarters' in base.facilities:
+        for base in self.faction_bases(faction_id):
+            if 'headquarters' in base.facilities:
                 return base
         return None
 
@@ -1318,7 +1456,7 @@ class Game:
         import math
         from game.social_engineering import calculate_se_effects
 
-        faction_bases = [b for b in self.bases if b.owner == faction_id]
+        faction_bases = self.faction_bases(faction_id)
         if not faction_bases:
             return {}
 
@@ -1562,9 +1700,7 @@ class Game:
         A faction is eliminated when they have no bases remaining.
         """
         # Count bases per player
-        bases_per_player = {}
-        for base in self.bases:
-            bases_per_player[base.owner] = bases_per_player.get(base.owner, 0) + 1
+        bases_per_player = {fid: len(faction.bases) for fid, faction in self.factions.items()}
 
         # Check each AI faction for elimination
         for faction_id in self.ai_faction_ids:
@@ -1585,7 +1721,7 @@ class Game:
                     self.faction_contacts.remove(faction_id)
 
                 # Remove all units belonging to this faction
-                units_to_remove = [u for u in self.units if u.owner == faction_id]
+                units_to_remove = list(self.faction_units(faction_id))
                 for unit in units_to_remove:
                     self._remove_unit(unit)
 
@@ -1624,8 +1760,7 @@ class Game:
         if facility_data:
             # Facilities are already added to base.facilities in base.process_turn()
             # Check if it's a secret project
-            project_data = facilities.get_facility_by_id(facility_data['id'])
-            if project_data in facilities.SECRET_PROJECTS:
+            if facilities.is_secret_project(facility_data['id']):
                 # Mark as globally built
                 self.completed_secret_projects[facility_data['id']] = {
                     'owner': base.owner,
@@ -1685,7 +1820,7 @@ class Game:
             )
             unit.home_base = base
             base.supported_units.append(unit)
-            self.units.append(unit)
+            self.add_unit(unit)
             self.game_map.add_unit_at(base.x, base.y, unit)
             self.set_status_message(f"{base.name} completed Scout Patrol (fallback)")
             return
@@ -1724,7 +1859,7 @@ class Game:
                 morale_gained = unit.morale_level - original_morale
                 print(f"  Command Center: +{morale_gained} morale (now {unit.morale_level})")
 
-        self.units.append(unit)
+        self.add_unit(unit)
         self.game_map.add_unit_at(base.x, base.y, unit)
         self.set_status_message(f"{base.name} completed {item_name}")
         print(f"{base.name} spawned {item_name} at ({base.x}, {base.y})")
@@ -1737,10 +1872,10 @@ class Game:
         the project from pending_production if another base completed it on the
         same turn, and cleans up the duplicate from that base's facilities.
         """
-        from game.data.facility_data import SECRET_PROJECTS
-        project_name = next((p['name'] for p in SECRET_PROJECTS if p['id'] == project_id), None)
-        if not project_name:
+        from game.facilities import get_facility_by_id, is_secret_project
+        if not is_secret_project(project_id):
             return
+        project_name = get_facility_by_id(project_id)['name']
 
         # Cancel in-progress production at other bases
         for b in self.bases:
@@ -1910,7 +2045,7 @@ class Game:
 
         bonus_id = random.choice(available)
         bonus_name = tech_tree.technologies[bonus_id]['name']
-        tech_tree.discovered_techs.add(bonus_id)
+        tech_tree.discover(bonus_id)
         if tech_tree.current_research == bonus_id:
             tech_tree.current_research = None
             tech_tree.research_points = 0
@@ -1990,13 +2125,13 @@ class Game:
         5. Scenario: Custom objectives (if enabled)
         """
         # Count bases by owner
-        player_bases = [b for b in self.bases if b.owner == self.player_faction_id]
-        enemy_bases = [b for b in self.bases if b.owner != self.player_faction_id]
+        player_bases = self.faction_bases(self.player_faction_id)
+        enemy_base_count = len(self.bases) - len(player_bases)
 
         # Track if players have ever had bases
         if len(player_bases) > 0:
             self.player_ever_had_base = True
-        if len(enemy_bases) > 0:
+        if enemy_base_count > 0:
             self.enemy_ever_had_base = True
 
         # Check DEFEAT: Player has lost all bases
@@ -2009,7 +2144,7 @@ class Game:
             return
 
         # Check CONQUEST VICTORY: All enemy bases destroyed
-        if self.enemy_ever_had_base and len(enemy_bases) == 0:
+        if self.enemy_ever_had_base and enemy_base_count == 0:
             self.game_over = True
             self.winner = self.player_faction_id
             self.victory_type = "conquest"
@@ -2064,6 +2199,7 @@ class Game:
         self.energy_credits = 0
         self.units = []
         self.bases = []
+        self.base_index = BaseIndex(self.game_map.width, self.game_map.height)
         self.selected_unit = None
         self.processing_ai = False
         self.current_ai_index = 0
@@ -2106,7 +2242,7 @@ class Game:
             self._grant_starting_tech(faction_id)
             self.factions[faction_id].tech_tree.auto_select_research()
             self.factions[faction_id].designs = UnitDesign(faction_id)
-        self.territory = TerritoryManager(self.game_map)
+        self.territory = TerritoryManager(self.game_map, self.base_index)
         self.completed_secret_projects = {}
         self.se_selections = {
             'Politics': 0,
@@ -2162,7 +2298,10 @@ class Game:
                 'major_atrocity_committed': self.major_atrocity_committed,
                 'integrity_level': self.integrity_level,
                 'truce_expiry_turns': {str(k): v for k, v in self.truce_expiry_turns.items()},
-                'global_energy_allocation': self.global_energy_allocation.copy()
+                'global_energy_allocation': self.global_energy_allocation.copy(),
+                'animate_battles': self.combat.animate_battles,
+                'fast_ai': self.turns.fast_ai,
+                'ai_camera_follow': self.turns.ai_camera_follow
             },
             'map': self.game_map.to_dict(),
             'units': [u.to_dict(unit_index_map) for u in self.units],
@@ -2275,6 +2414,7 @@ class Game:
             else:
                 faction.designs = UnitDesign(faction_id)
             game.factions[faction_id] = faction
+        game.rebuild_faction_registries()
 
         # Restore AI players
         game.ai_players = [AIPlayer(fid) for fid in game.ai_faction_ids]
@@ -2283,8 +2423,10 @@ class Game:
         sel_idx = data['selected_unit_index']
         game.selected_unit = game.units[sel_idx] if sel_idx is not None else None
 
-        # Restore territory
-        game.territory = TerritoryManager(game.game_map)
+        # Restore base index and territory
+        game.base_index = BaseIndex(game.game_map.width, game.game_map.height)
+        game.base_index.rebuild(game.bases)
+        game.territory = TerritoryManager(game.game_map, game.base_index)
         game.territory.update_territory(game.bases)
 
         # Initialize runtime state (not saved)
@@ -2331,8 +2473,13 @@ class Game:
 
         # Initialize combat system
         game.combat = Combat(game)
+        game.combat.animate_battles = gs.get('animate_battles', True)
         game.movement = MovementManager(game)
+        game.pathfinder = PathFinder(game)
+        game.base_sites = BaseSiteMap(game)
         game.turns = TurnManager(game)
+        game.turns.fast_ai = gs.get('fast_ai', False)
+        game.turns.ai_camera_follow = gs.get('ai_camera_follow', True)
 
         # Initialize auto-cycle delay
         game.auto_cycle_delay = 500  # Wait 500ms before auto-cycling
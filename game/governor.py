@@ -9,6 +9,8 @@ The Governor automatically selects production for bases based on one of four mod
 
 import random
 
+from game.facilities import get_facility_by_name, get_buildable, is_secret_project
+
 
 def select_production(base, faction, game):
     """Select production for a base based on governor mode.
@@ -190,31 +192,17 @@ def select_explore_production(base, faction, game):
 
 def _can_build(base, faction, item_name, game=None):
     """Check if base can build a specific item."""
-    from game.data.facility_data import FACILITIES, SECRET_PROJECTS
-
-    # Check facilities
-    for facility in FACILITIES:
-        if facility['name'] == item_name:
-            # Check if already built
-            if item_name in base.facilities:
-                return False
-            # Check tech prereq
-            if facility['prereq'] and not faction.tech_tree.has_tech(facility['prereq']):
-                return False
-            return True
+    record = get_facility_by_name(item_name)
+    if record is None:
+        return False
 
-    # Check secret projects
-    for project in SECRET_PROJECTS:
-        if project['name'] == item_name:
-            # Check if already built globally
-            if game and project['id'] in game.completed_secret_projects:
-                return False
-            # Check tech prereq
-            if project['prereq'] and not faction.tech_tree.has_tech(project['prereq']):
-                return False
-            return True
+    # Facilities can only be built once per base
+    if not is_secret_project(record['id']) and item_name in base.facilities:
+        return False
 
-    return False
+    # Buildable set covers tech prereqs and globally completed projects
+    completed = game.completed_secret_projects if game else {}
+    return record['id'] in get_buildable(faction, completed).ids
 
 
 def _can_build_unit(base, faction, weapon_type):
@@ -427,14 +415,11 @@ def _select_general_facility(base, faction, game):
 
 def _select_secret_project(base, faction, game):
     """Select a secret project if available."""
-    from game.data.facility_data import SECRET_PROJECTS
-
     # Get affordable projects
     affordable = []
-    for project in SECRET_PROJECTS:
-        if _can_build(base, faction, project['name'], game):
-            if project['cost'] <= faction.energy_credits // 2:
-                affordable.append(project['name'])
+    for project in get_buildable(faction, game.completed_secret_projects).projects:
+        if project['cost'] <= faction.energy_credits // 2:
+            affordable.append(project['name'])
 
     if affordable:
         return random.choice(affordable)
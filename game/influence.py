@@ -0,0 +1,144 @@
+"""Influence and threat maps for AI decisions.
+
+Once per AI turn, every unit's attack and defense strength is stamped on a
+grid and spread to nearby tiles with a small convolution kernel.  A unit
+then reads how much hostile force can reach its tile, how much friendly
+support is nearby, or whether a hostile unit is next to it, with one array
+lookup instead of scanning neighbouring tiles.
+
+Strength is weapon attack (or armor defense) times the fraction of health
+left.  The map wraps east-west and is clamped north-south.
+"""
+
+import numpy as np
+
+# Kernel weights by Chebyshev distance (index 0 = the unit's own tile)
+ENEMY_REACH = (1.0, 1.0, 0.5)  # Hostile attack can arrive within a turn or two
+FRIENDLY_SUPPORT = (1.0, 0.5)  # Own defense helps the tile and its neighbours
+
+
+def box_sum(grid, radius):
+    """Sum every cell's (2 * radius + 1) square neighbourhood.
+
+    Separable: rows are summed with an east-west wrap, then columns with
+    nothing beyond the north and south edges.
+
+    Args:
+        grid (ndarray): 2D array indexed [y][x]
+        radius (int): Chebyshev radius of the square
+
+    Returns:
+        ndarray: Float grid of the same shape
+    """
+    rows = grid.astype(float)
+    for dx in range(1, radius + 1):
+        rows += np.roll(grid, dx, axis=1) + np.roll(grid, -dx, axis=1)
+    result = rows.copy()
+    for dy in range(1, radius + 1):
+        result[dy:] += rows[:-dy]
+        result[:-dy] += rows[dy:]
+    return result
+
+
+def spread_grid(grid, weights):
+    """Convolve a grid with a square kernel weighted by Chebyshev distance.
+
+    result[y][x] = sum of weights[d] * grid[y + dy][x + dx] over all
+    offsets with max(|dx|, |dy|) = d < len(weights).  The kernel is applied
+    as a weighted sum of box_sum squares, one per radius.
+
+    Args:
+        grid (ndarray): 2D array indexed [y][x]
+        weights (sequence): Kernel weight for each distance
+
+    Returns:
+        ndarray: Float grid of the same shape
+    """
+    result = np.zeros(grid.shape)
+    for radius, weight in enumerate(weights):
+        # Ring d gets weights[d]: each square adds its weight minus the next one's
+        outer = weights[radius + 1] if radius + 1 < len(weights) else 0.0
+        if weight != outer:
+            result += (weight - outer) * box_sum(grid, radius)
+    return result
+
+
+class InfluenceMap:
+    """Friendly and hostile strength around every tile for one faction.
+
+    Built from a snapshot of the units at the start of the faction's turn;
+    AIPlayer rebuilds it once per turn.
+
+    Attributes:
+        faction_id (int): Faction the map is built for
+        turn (int): Game turn the snapshot was taken on
+        enemy (ndarray): Hostile attack strength that can reach each tile
+        friendly (ndarray): Own defense strength supporting each tile
+        threat (ndarray): enemy - friendly, never below zero
+        hostile_adjacent (ndarray): Hostile units on or next to each tile
+    """
+
+    def __init__(self, game, faction_id):
+        """Take the unit snapshot and build the grids.
+
+        Args:
+            game (Game): Current game state
+            faction_id (int): Faction whose point of view to use
+        """
+        self.faction_id = faction_id
+        self.turn = game.turn
+        shape = (game.game_map.height, game.game_map.width)
+
+        enemy_attack = np.zeros(shape)
+        hostile_count = np.zeros(shape)
+        friendly_defense = np.zeros(shape)
+        hostile = {}
+        for unit in game.units:
+            health = unit.get_health_percentage()
+            if unit.owner == faction_id:
+                friendly_defense[unit.y, unit.x] += unit.armor_data['defense'] * health
+                continue
+            is_hostile = hostile.get(unit.owner)
+            if is_hostile is None:
+                is_hostile = hostile[unit.owner] = not game.has_pact_with(faction_id, unit.owner)
+            if is_hostile:
+                enemy_attack[unit.y, unit.x] += unit.weapon_data['attack'] * health
+                hostile_count[unit.y, unit.x] += 1
+
+        self.enemy = spread_grid(enemy_attack, ENEMY_REACH)
+        self.friendly = spread_grid(friendly_defense, FRIENDLY_SUPPORT)
+        self.threat = np.maximum(self.enemy - self.friendly, 0.0)
+        self.hostile_adjacent = spread_grid(hostile_count, (1.0, 1.0))
+
+        # Garrison sizes when the snapshot was taken (see bases_needing_defense)
+        self._garrisons = {base: len(base.garrison) for base in game.faction_bases(faction_id)}
+
+    def hostile_near(self, x, y):
+        """Return True if a hostile unit is on or next to (x, y)."""
+        return self.hostile_adjacent[y, x] > 0
+
+    def threat_at(self, x, y):
+        """Return the net hostile strength that can reach (x, y)."""
+        return float(self.threat[y, x])
+
+    def bases_needing_defense(self, bases):
+        """Return the bases a free unit should move to.
+
+        A base qualifies if it has no garrison, or if it is threatened and
+        has not received a reinforcement since the snapshot (so units stop
+        converging on it once help has arrived this turn).
+
+        Args:
+            bases (iterable): Bases of the map's faction
+
+        Returns:
+            list: Bases that need another defender
+        """
+        needy = []
+        for base in bases:
+            garrison = len(base.garrison)
+            if garrison == 0:
+                needy.append(base)
+            elif self.threat[base.y, base.x] > 0 and garrison <= self._garrisons.get(base, 0):
+                needy.append(base)
+        return needy
@@ -7,10 +7,20 @@ This module handles the game map including:
 - Unit placement and stacking on tiles
 - Tile state management (base, units, displayed unit index)
 
-The Map class creates and manages the 2D grid of Tile objects that
-represent the game world.
+The GameMap class stores terrain for the whole grid in a TerrainStore
+(typed per-tile arrays) and hands out Tile views that represent the game
+world one tile at a time.
 """
 import random
+from collections import namedtuple
+
+import numpy as np
+
+from game.map_arrays import relax_altitudes, numpy_rng, propagate_moisture, classify_rainfall
+from game.smoothing import smooth_scores, percentile_threshold, smooth_and_threshold
+from game.terrain_store import (TerrainStore, ImprovementSet, RiverEdgeSet, RIVER_EDGE_BITS,
+                                improvement_bit, improvement_mask, improvement_keys, river_edge_keys)
+from game.terraforming import get_tile_yields
 
 
 def tile_base_nutrients(tile):
@@ -68,26 +78,125 @@ def tile_base_minerals(tile):
     return 1 if getattr(tile, 'rockiness', 0) >= 1 else 0
 
 
+TileYields = namedtuple('TileYields', [
+    'base_nutrients', 'base_minerals', 'base_energy',  # Unimproved yields
+    'nutrients', 'minerals', 'energy',                 # Worked-tile output with improvements
+    'fixed',                                           # (N, M, E) override, or None
+    'nutrients_multiplier',
+])
+
+
+def tile_yields(tile):
+    """Memoized yield record for a tile.
+
+    Combines the unimproved yields (tile_base_*) with the improvement
+    bonuses from terraforming.get_tile_yields.  Records are cached in the
+    map's TerrainStore and dropped when any terrain field that feeds them
+    (terrain type, altitude, rainfall, rockiness, monolith, fungus, river,
+    improvements) changes on that tile.
+
+    Returns:
+        TileYields: Yield record for the tile
+    """
+    store = tile._store
+    record = store.yield_cache.get(tile._index)
+    if record is not None:
+        store.yield_cache_hits += 1
+        return record
+    store.yield_cache_misses += 1
+
+    base_n = tile_base_nutrients(tile)
+    base_m = tile_base_minerals(tile)
+    base_e = tile_base_energy(tile)
+    imp_yields = get_tile_yields(tile)
+    fixed = imp_yields['fixed']
+    mult = imp_yields['nutrients_multiplier']
+    if fixed:
+        n, m, e = fixed
+    else:
+        n = int((base_n + imp_yields['nutrients']) * mult)
+        m = base_m + imp_yields['minerals']
+        e = base_e + imp_yields['energy']
+    record = TileYields(base_n, base_m, base_e, n, m, e, fixed, mult)
+    store.yield_cache[tile._index] = record
+    return record
+
+
+def _terrain_field(name, doc, affects_yields=False):
+    """Property that reads/writes one cell of a TerrainStore array.
+
+    Writes to fields with affects_yields=True drop the tile's cached yields.
+    """
+    def fget(self):
+        return getattr(self._store, name).item(self._index)
+
+    def fset(self, value):
+        getattr(self._store, name).flat[self._index] = value
+        if affects_yields:
+            self._store.touch_yields(self._index)
+
+    return property(fget, fset, doc=doc)
+
+
 class Tile:
-    """Represents a single map tile."""
+    """Represents a single map tile.
+
+    Terrain state lives in the owning map's TerrainStore; a Tile is a view
+    onto one cell of it plus the non-terrain state (units, base).  Tiles
+    are created on demand by GameMap.get_tile — don't construct them directly.
+    """
 
-    def __init__(self, x, y, terrain_type):
+    __slots__ = ('x', 'y', '_store', '_index', 'units', 'base', 'displayed_unit_index')
+
+    def __init__(self, store, x, y):
         self.x = x
         self.y = y
-        self.terrain_type = terrain_type  # 'land' or 'ocean' for now
+        self._store = store
+        self._index = y * store.width + x
         self.units = []  # Changed from single unit to list for stacking
         self.base = None
-        self.supply_pod = False  # Unity supply pods
-        self.monolith = False  # Alien monolith
         self.displayed_unit_index = 0  # Which unit in stack to display
-        self.altitude = 0  # Exact altitude in meters: -3000 to 3500
-        self.rainfall = 1  # 0=arid, 1=moderate, 2=rainy (land only; ocean is always 1)
-        self.rockiness = 0  # 0=flat, 1=rolling, 2=rocky (land only; ocean is always 0)
-        self._fungus = False  # Backing store — use tile.fungus property
-        self.improvements = set()  # Completed terraforming improvements, e.g. {'farm', 'mine', 'road'}
-        self.void = False  # True for edge rows — not part of the playable map
-        self.river_edges = set()  # Directions {'N','S','E','W'} where a river crosses this tile's edge
-        self.has_river = False  # True if an aquifer has been drilled here
+
+    altitude = _terrain_field('altitude', "Exact altitude in meters: -3000 to 3500", affects_yields=True)
+    rainfall = _terrain_field('rainfall', "0=arid, 1=moderate, 2=rainy (land only; ocean is always 1)",
+                              affects_yields=True)
+    rockiness = _terrain_field('rockiness', "0=flat, 1=rolling, 2=rocky (land only; ocean is always 0)",
+                               affects_yields=True)
+    supply_pod = _terrain_field('supply_pod', "Unity supply pod present")
+    monolith = _terrain_field('monolith', "Alien monolith present", affects_yields=True)
+    void = _terrain_field('void', "True for edge rows — not part of the playable map")
+    has_river = _terrain_field('has_river', "True if an aquifer has been drilled here", affects_yields=True)
+    _fungus = _terrain_field('fungus', "Backing store — use tile.fungus property", affects_yields=True)
+
+    @property
+    def terrain_type(self):
+        """'land' or 'ocean'."""
+        return 'land' if self._store.land.item(self._index) else 'ocean'
+
+    @terrain_type.setter
+    def terrain_type(self, value):
+        self._store.land.flat[self._index] = (value == 'land')
+        self._store.touch_yields(self._index)
+
+    @property
+    def improvements(self):
+        """Completed terraforming improvements, e.g. {'farm', 'mine', 'road'}."""
+        return ImprovementSet(self._store.improvements, self._index, self._store.touch_yields)
+
+    @improvements.setter
+    def improvements(self, keys):
+        self._store.improvements.flat[self._index] = improvement_mask(keys)
+        self._store.touch_yields(self._index)
+
+    @property
+    def river_edges(self):
+        """Directions {'N','S','E','W'} where a river crosses this tile's edge."""
+        return RiverEdgeSet(self._store.river_edges, self._index, self._store.touch_yields)
+
+    @river_edges.setter
+    def river_edges(self, directions):
+        self._store.river_edges.flat[self._index] = sum(RIVER_EDGE_BITS[d] for d in set(directions))
+        self._store.touch_yields(self._index)
 
     @property
     def fungus(self):
@@ -109,11 +218,11 @@ class Tile:
 
     def is_land(self):
         """Check if this tile is land terrain."""
-        return self.terrain_type == 'land'
+        return self._store.land.item(self._index)
 
     def is_ocean(self):
         """Check if this tile is ocean terrain."""
-        return self.terrain_type == 'ocean'
+        return not self._store.land.item(self._index)
 
 
 class GameMap:
@@ -131,7 +240,8 @@ class GameMap:
         """
         self.width = width
         self.height = height
-        self.tiles = []
+        self.terrain = TerrainStore(width, height)
+        self._tile_views = [None] * (width * height)  # Tile views, created on demand
         # Default to 60% ocean (equivalent to old default of 40% land)
         # TODO: This should not be here. Erase. (Edit: or do I randomize here, for Make Random Map?)
         self.ocean_percentage = ocean_percentage if ocean_percentage is not None else int(60)
@@ -159,39 +269,25 @@ class GameMap:
     def generate_random_map(self):
         """Generate a map with specified ocean percentage using percentile-based approach."""
         # Generate random values for all tiles
-        random_values = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                value = random.random()
-                row.append(value)
-            random_values.append(row)
+        random_values = numpy_rng().random((self.height, self.width))
 
         # Calculate threshold at desired percentile for exact ocean percentage
-        # Flatten all values to sort them
-        all_values = []
-        for row in random_values:
-            all_values.extend(row)
-        all_values.sort()
-
-        # Get threshold at the ocean percentage percentile
         # If we want X% ocean, then values < threshold become ocean
+        all_values = random_values.ravel()
         threshold_index = int(len(all_values) * (self.ocean_percentage / 100.0))
-        threshold = all_values[threshold_index] if threshold_index < len(all_values) else 0.0
+        if threshold_index < len(all_values):
+            threshold = np.partition(all_values, threshold_index)[threshold_index]
+        else:
+            threshold = 0.0
 
         # Assign terrain based on threshold
         # Edge rows (y=0 and y=height-1) are marked void — they sit under the
         # black border overlay and are not part of the playable map.
-        self.tiles = []
-        for y in range(self.height):
-            row = []
-            for x in range(self.width):
-                terrain = 'ocean' if random_values[y][x] < threshold else 'land'
-                tile = Tile(x, y, terrain)
-                if y == 0 or y == self.height - 1:
-                    tile.void = True
-                row.append(tile)
-            self.tiles.append(row)
+        self.terrain = TerrainStore(self.width, self.height)
+        self._tile_views = [None] * (self.width * self.height)
+        self.terrain.land[:] = random_values >= threshold
+        self.terrain.void[0] = True
+        self.terrain.void[-1] = True
 
         # Generate altitudes for all tiles
         self._generate_altitudes(random_values)
@@ -200,7 +296,7 @@ class GameMap:
         self._apply_erosion(self.erosive_forces)
 
         # Generate rockiness using independent noise (must come before rainfall)
-        rock_noise = [[random.random() for _ in range(self.width)] for _ in range(self.height)]
+        rock_noise = numpy_rng().random((self.height, self.width))
         self._generate_rockiness(rock_noise, self.erosive_forces)
 
         # Generate rainfall using altitude, cloud cover, and rockiness
@@ -224,17 +320,13 @@ class GameMap:
         """
         import random
         num_rivers = random.randint(1, 2)
-        land_tiles = [
-            self.tiles[y][x]
-            for y in range(1, self.height - 1)
-            for x in range(self.width)
-            if self.tiles[y][x].is_land()
-        ]
+        land = self.terrain.land & ~self.terrain.void
+        land_tiles = [(int(x), int(y)) for y, x in zip(*np.nonzero(land))]
         if not land_tiles:
             return
         for _ in range(num_rivers):
-            start = random.choice(land_tiles)
-            self.generate_river_from(start.x, start.y)
+            start_x, start_y = random.choice(land_tiles)
+            self.generate_river_from(start_x, start_y)
 
     def generate_river_from(self, start_x, start_y):
         """Walk a river starting at (start_x, start_y) for 3-10 land tiles.
@@ -318,10 +410,9 @@ class GameMap:
         while placed < num_pods and attempts < max_attempts:
             x = random.randint(0, self.width - 1)
             y = random.randint(1, self.height - 2)  # Avoid first and last rows
-            tile = self.get_tile(x, y)
 
-            if tile and not tile.supply_pod:
-                tile.supply_pod = True
+            if not self.terrain.supply_pod[y, x]:
+                self.terrain.supply_pod[y, x] = True
                 placed += 1
 
             attempts += 1
@@ -331,8 +422,7 @@ class GameMap:
     def _place_monoliths(self):
         """Place monoliths randomly on 1% of land tiles (excluding edge rows)."""
         # Count land tiles (excluding edge rows)
-        land_tiles = sum(1 for y, row in enumerate(self.tiles) for tile in row
-                        if tile.is_land() and 0 < y < self.height - 1)
+        land_tiles = int(self.terrain.land[1:-1].sum())
         num_monoliths = max(3, int(land_tiles * 0.01))  # At least 3 monoliths
 
         placed = 0
@@ -342,11 +432,11 @@ class GameMap:
         while placed < num_monoliths and attempts < max_attempts:
             x = random.randint(0, self.width - 1)
             y = random.randint(1, self.height - 2)  # Avoid first and last rows
-            tile = self.get_tile(x, y)
+            terrain = self.terrain
 
             # Only place on land, and not on supply pods or other monoliths
-            if tile and tile.is_land() and not tile.supply_pod and not tile.monolith:
-                tile.monolith = True
+            if terrain.land[y, x] and not terrain.supply_pod[y, x] and not terrain.monolith[y, x]:
+                terrain.monolith[y, x] = True
                 placed += 1
 
             attempts += 1
@@ -377,55 +467,22 @@ class GameMap:
         land_frac, sea_frac = targets.get(native_life, targets['average'])
 
         # Step 1: Generate independent noise
-        noise = [[random.random() for _ in range(self.width)] for _ in range(self.height)]
-
-        # Step 2: One smoothing pass for geographic clustering
-        smoothed = [row[:] for row in noise]
-        for y in range(self.height):
-            for x in range(self.width):
-                neighbors = []
-                for dy in [-1, 0, 1]:
-                    for dx in [-1, 0, 1]:
-                        if dx == 0 and dy == 0:
-                            continue
-                        nx = (x + dx) % self.width
-                        ny = y + dy
-                        if 0 <= ny < self.height:
-                            neighbors.append(noise[ny][nx])
-                if neighbors:
-                    smoothed[y][x] = noise[y][x] * 0.6 + (sum(neighbors) / len(neighbors)) * 0.4
-
-        # Step 3: Separate percentile classification for land and sea
-        land_scores = sorted(
-            smoothed[y][x]
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.tiles[y][x].is_land()
-        )
-        sea_scores = sorted(
-            smoothed[y][x]
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.tiles[y][x].is_ocean()
-        )
-
-        n_land = len(land_scores)
-        n_sea = len(sea_scores)
-
-        land_threshold = land_scores[max(0, int(n_land * (1.0 - land_frac)) - 1)] if n_land > 0 else 1.1
-        sea_threshold = sea_scores[max(0, int(n_sea * (1.0 - sea_frac)) - 1)] if n_sea > 0 else 1.1
-
-        land_fungus_count = sea_fungus_count = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                s = smoothed[y][x]
-                if tile.is_land() and s >= land_threshold:
-                    tile.fungus = True
-                    land_fungus_count += 1
-                elif tile.is_ocean() and s >= sea_threshold:
-                    tile.fungus = True
-                    sea_fungus_count += 1
+        noise = numpy_rng().random((self.height, self.width))
+
+        # Step 2: One smoothing pass for geographic clustering, then
+        # separate percentile thresholds for land and sea
+        land = ~self.terrain.ocean
+        smoothed, land_threshold, sea_threshold = smooth_and_threshold(
+            noise, land, land_frac, sea_frac, self_weight=0.6, passes=1)
+
+        # Step 3: Classify
+        land_fungus = land & (smoothed >= land_threshold)
+        sea_fungus = ~land & (smoothed >= sea_threshold)
+        self.terrain.fungus |= land_fungus | sea_fungus
+        self.terrain.improvements[land_fungus] |= np.uint64(improvement_bit('fungus'))
+        self.terrain.improvements[sea_fungus] |= np.uint64(improvement_bit('sea_fungus'))
+        land_fungus_count = int(land_fungus.sum())
+        sea_fungus_count = int(sea_fungus.sum())
 
         print(f"  Land fungus: {land_fungus_count} tiles  Sea fungus: {sea_fungus_count} tiles")
         print("=== FUNGUS GENERATION COMPLETE ===\n")
@@ -434,7 +491,9 @@ class GameMap:
         """Generate exact altitude values for all tiles using noise and constraint enforcement.
 
         Altitudes range from -3000m (deep ocean) to 3500m (mountain peaks).
-        Adjacent tiles can differ by at most 1000m.
+        Adjacent tiles can differ by at most 1000m (including across the
+        east-west wrap).  The relaxation runs on whole-grid arrays; see
+        map_arrays.relax_altitudes.
 
         Args:
             noise_values: 2D array of random values (0.0-1.0) from terrain generation
@@ -442,92 +501,26 @@ class GameMap:
         print("\n=== GENERATING ALTITUDES ===")
 
         # Step 1: Initial assignment based on noise values (exact meters)
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                noise = noise_values[y][x]
-
-                if tile.is_ocean():
-                    # Ocean: -3000 to -1 meters
-                    # Map noise 0.0-1.0 to -3000 to -1
-                    tile.altitude = int(-3000 + (noise * 2999))
-                else:
-                    # Land: 0 to 3500 meters
-                    # Map noise 0.0-1.0 to 0 to 3500
-                    tile.altitude = int(noise * 3500)
+        #   Ocean: noise 0.0-1.0 → -3000 to -1 meters
+        #   Land:  noise 0.0-1.0 → 0 to 3500 meters
+        noise = np.asarray(noise_values, dtype=np.float64)
+        ocean = self.terrain.ocean
+        altitude = np.where(ocean, -3000 + noise * 2999, noise * 3500).astype(np.int64)
 
         # Step 2: Enforce ±1000m constraint using iterative relaxation
         # This gradually adjusts tiles instead of snapping them to boundaries
-        max_iterations = 200
-        relaxation_factor = 0.3  # Adjust 30% of violation per iteration
-
-        for iteration in range(max_iterations):
-            max_violation = 0
-            adjustments_made = 0
-
-            # Store proposed adjustments for this iteration
-            adjustments = {}
-
-            for y in range(self.height):
-                for x in range(self.width):
-                    tile = self.tiles[y][x]
-
-                    # Calculate average desired adjustment from all neighbors
-                    total_adjustment = 0
-                    neighbor_count = 0
-
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue
-
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.width and 0 <= ny < self.height:
-                                neighbor = self.tiles[ny][nx]
-                                diff = tile.altitude - neighbor.altitude
-
-                                # If constraint violated, calculate adjustment needed
-                                if abs(diff) > 1000:
-                                    max_violation = max(max_violation, abs(diff) - 1000)
-
-                                    # Calculate how much to move toward valid range
-                                    if diff > 1000:
-                                        # Too high, need to lower
-                                        target = neighbor.altitude + 1000
-                                        adjustment = target - tile.altitude
-                                    else:  # diff < -1000
-                                        # Too low, need to raise
-                                        target = neighbor.altitude - 1000
-                                        adjustment = target - tile.altitude
-
-                                    total_adjustment += adjustment
-                                    neighbor_count += 1
-
-                    # If adjustments needed, apply gradual relaxation
-                    if neighbor_count > 0:
-                        avg_adjustment = total_adjustment / neighbor_count
-                        proposed_altitude = tile.altitude + int(avg_adjustment * relaxation_factor)
-                        adjustments[(x, y)] = proposed_altitude
-                        adjustments_made += 1
-
-            # Apply adjustments with clamping
-            for (x, y), new_altitude in adjustments.items():
-                tile = self.tiles[y][x]
-                tile.altitude = new_altitude
-
-                # Clamp to valid ranges
-                if tile.is_ocean():
-                    tile.altitude = max(-3000, min(-1, tile.altitude))
-                else:
-                    tile.altitude = max(0, min(3500, tile.altitude))
-
-            # Stop if violations are minimal
-            if max_violation < 5:
-                print(f"  Converged after {iteration + 1} iterations")
-                break
+        altitude, iterations, max_violation, timings = relax_altitudes(
+            altitude, ocean, max_iterations=200, relaxation_factor=0.3)
+        if max_violation < 5:
+            print(f"  Converged after {iterations} iterations")
+
+        self.terrain.altitude[:] = altitude
 
         print(f"  Initial altitude assignment complete")
-        print(f"  Constraint enforcement: {iteration + 1} iterations, max violation: {max_violation}m")
+        print(f"  Constraint enforcement: {iterations} iterations, max violation: {max_violation}m")
+        print(f"  Relaxation time: {sum(timings) * 1000:.1f}ms total, "
+              f"{sum(timings) * 1000 / len(timings):.2f}ms/iteration, "
+              f"slowest {max(timings) * 1000:.2f}ms")
         print("=== ALTITUDE GENERATION COMPLETE ===\n")
 
     def _generate_rainfall(self, cloud_cover):
@@ -538,24 +531,19 @@ class GameMap:
         dropping it on the upwind (western) slopes of mountain ranges and leaving
         a rain shadow on the downwind (eastern) side.  The map wraps east-west.
 
+        Both steps run on whole-grid arrays; see map_arrays.propagate_moisture
+        and map_arrays.classify_rainfall.
+
         Args:
             cloud_cover (str): 'arid', 'moderate', or 'rainy' – overall wetness bias
         """
         print(f"\n=== GENERATING RAINFALL (cloud_bias={cloud_cover:.2f}) ===")
 
-        # ------------------------------------------------------------------
-        # Step 1: Initialise moisture grid
-        #   Ocean = 1.0 (moisture source)
-        #   Land  = 0.0 (dry starting point; propagation fills this)
-        # ------------------------------------------------------------------
-        moisture = [[0.0] * self.width for _ in range(self.height)]
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.tiles[y][x].is_ocean():
-                    moisture[y][x] = 1.0
+        ocean = self.terrain.ocean
 
         # ------------------------------------------------------------------
-        # Step 2: Propagate moisture eastward in three Gauss-Seidel passes.
+        # Step 1: Propagate moisture eastward in three Gauss-Seidel passes.
+        #   Ocean = 1.0 (moisture source), land starts dry.
         #   Because the map wraps east-west, the western neighbour of x=0 is
         #   x=width-1.  Three passes converge well even with wrap-around.
         #
@@ -567,66 +555,24 @@ class GameMap:
         #                 altitude jump at the coast must not count, or it would
         #                 make nearly every coastal tile rainy regardless of bias.
         # ------------------------------------------------------------------
-        decay = 0.58
-        for _ in range(3):
-            for y in range(self.height):
-                for x in range(self.width):
-                    tile = self.tiles[y][x]
-                    if tile.is_ocean():
-                        moisture[y][x] = 1.0
-                        continue
-
-                    west_x = (x - 1) % self.width
-                    west_tile = self.tiles[y][west_x]
-                    west_m = moisture[y][west_x]
-
-                    # Orographic only between two land tiles (coast rise excluded)
-                    if west_tile.is_land():
-                        alt_diff = tile.altitude - west_tile.altitude
-                        orographic = max(-0.4, min(0.4, alt_diff / 2500.0))
-                    else:
-                        orographic = 0.0
-
-                    moisture[y][x] = max(0.0, min(1.0,
-                        west_m * decay + orographic * 0.35))
+        moisture = propagate_moisture(ocean, self.terrain.altitude, passes=3, decay=0.58)
 
         # ------------------------------------------------------------------
-        # Step 3: Apply cloud-cover bias, equatorial bonus, noise, classify.
+        # Step 2: Apply cloud-cover bias, equatorial bonus, noise, classify.
         #   The equatorial bonus is additive here (after propagation) so it
         #   is not overwritten.  It peaks at +0.10 on the map's centre row
         #   and falls to 0 at the top and bottom edges.
+        #
+        #   Rocky terrain is drier: exposed rock sheds water quickly and
+        #   sits in high-altitude rain shadows.  The penalty is applied at
+        #   classification time so it doesn't propagate to neighbouring
+        #   tiles — rocky zones are dry but don't create artificial aridity
+        #   further inland.  Oceans always produce 1 base nutrient.
         # ------------------------------------------------------------------
-        bias = cloud_cover  # float bias sampled from the chosen cloud cover range
-
-        equator_y = (self.height - 1) / 2.0
-
-        for y in range(self.height):
-            dist = abs(y - equator_y) / equator_y if equator_y > 0 else 0.0
-            tropical_bonus = 0.10 * (1.0 - dist)
-
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                if tile.is_ocean():
-                    tile.rainfall = 1  # Oceans always produce 1 base nutrient
-                    continue
-
-                m = moisture[y][x] + tropical_bonus + bias + random.gauss(0, 0.06)
-                m = max(0.0, min(1.0, m))
-
-                # Rocky terrain is drier: exposed rock sheds water quickly and
-                # sits in high-altitude rain shadows.  Apply a moisture penalty
-                # at classification time so the penalty doesn't propagate to
-                # neighbouring tiles — rocky zones are dry but don't create
-                # artificial aridity further inland.
-                rock_penalty = (0.0, 0.07, 0.25)[tile.rockiness]
-                effective_m = m - rock_penalty
-
-                if effective_m < 0.25:
-                    tile.rainfall = 0   # Arid
-                elif effective_m < 0.62:
-                    tile.rainfall = 1   # Moderate
-                else:
-                    tile.rainfall = 2   # Rainy
+        noise = numpy_rng().normal(0.0, 0.06, size=ocean.shape)
+        rainfall = classify_rainfall(moisture, ocean, self.terrain.rockiness,
+                                     cloud_cover, noise)
+        self.terrain.rainfall[:] = rainfall
 
         print("=== RAINFALL GENERATION COMPLETE ===\n")
 
@@ -646,11 +592,9 @@ class GameMap:
         scale = 1.0 + (erosive_forces - 0.20) * 2.0
         scale = max(0.7, min(1.3, scale))
 
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                if tile.is_land():
-                    tile.altitude = int(max(0, min(3500, tile.altitude * scale)))
+        land = self.terrain.land
+        altitude = self.terrain.altitude
+        altitude[land] = np.clip(np.trunc(altitude[land] * scale), 0, 3500)
 
     def _generate_rockiness(self, rock_noise, erosive_forces=0.0):
         """Generate rockiness levels for all land tiles.
@@ -675,39 +619,16 @@ class GameMap:
         # Step 1: Compute raw score for each land tile.
         #   noise component   (65%) — provides variety independent of altitude
         #   altitude component (35%) — higher ground is more likely to be rocky
-        score = [[0.0] * self.width for _ in range(self.height)]
-
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                if tile.is_ocean():
-                    continue
-                alt_factor = tile.altitude / 3500.0  # 0 (sea level) → 1 (peak)
-                score[y][x] = rock_noise[y][x] * 0.65 + alt_factor * 0.35
+        land = ~self.terrain.ocean
+        alt_factor = self.terrain.altitude / 3500.0  # 0 (sea level) → 1 (peak)
+        score = np.where(land, np.asarray(rock_noise) * 0.65 + alt_factor * 0.35, 0.0)
 
         # Step 2: Two passes of neighbor-averaging for geographic clustering.
-        #   Tiles influence their neighbours so rocky zones clump together
-        #   rather than scattering randomly across the map.
-        for _ in range(2):
-            new_score = [row[:] for row in score]
-            for y in range(self.height):
-                for x in range(self.width):
-                    if self.tiles[y][x].is_ocean():
-                        continue
-                    neighbors = []
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dx == 0 and dy == 0:
-                                continue  # Exclude center tile from neighbor average
-                            nx = (x + dx) % self.width
-                            ny = y + dy
-                            if 0 <= ny < self.height and self.tiles[ny][nx].is_land():
-                                neighbors.append(score[ny][nx])
-                    if neighbors:
-                        # 70 % own score, 30 % neighbor average — enough smoothing to
-                        # cluster rocky zones without collapsing the variance entirely.
-                        new_score[y][x] = score[y][x] * 0.7 + (sum(neighbors) / len(neighbors)) * 0.3
-            score = new_score
+        #   Tiles influence their land neighbours so rocky zones clump together
+        #   rather than scattering randomly across the map.  70 % own score,
+        #   30 % neighbor average — enough smoothing to cluster rocky zones
+        #   without collapsing the variance entirely.
+        score = smooth_scores(score, self_weight=0.7, passes=2, mask=land)
 
         # Step 3: Percentile-based classification.
         #   erosive_forces is the TARGET fraction of land tiles that should be rocky
@@ -717,37 +638,18 @@ class GameMap:
         rolling_fraction = 0.35
         rocky_fraction   = erosive_forces  # e.g. 0.20 for average
 
-        land_scores = sorted(
-            score[y][x]
-            for y in range(self.height)
-            for x in range(self.width)
-            if self.tiles[y][x].is_land()
-        )
-        n = len(land_scores)
-        if n > 0:
-            rocky_threshold  = land_scores[max(0, int(n * (1.0 - rocky_fraction)) - 1)]
-            rolling_threshold = land_scores[max(0, int(n * (1.0 - rocky_fraction - rolling_fraction)) - 1)]
-        else:
-            rocky_threshold  = 0.99
-            rolling_threshold = 0.99
+        land_scores = score[land]
+        rocky_threshold = percentile_threshold(land_scores, rocky_fraction, 0.99)
+        rolling_threshold = percentile_threshold(land_scores, rocky_fraction + rolling_fraction, 0.99)
 
-        flat_count = rolling_count = rocky_count = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                tile = self.tiles[y][x]
-                if tile.is_ocean():
-                    tile.rockiness = 0
-                    continue
-                s = score[y][x]
-                if s >= rocky_threshold:
-                    tile.rockiness = 2   # Rocky
-                    rocky_count += 1
-                elif s >= rolling_threshold:
-                    tile.rockiness = 1   # Rolling
-                    rolling_count += 1
-                else:
-                    tile.rockiness = 0   # Flat
-                    flat_count += 1
+        rockiness = np.where(score >= rocky_threshold, 2, np.where(score >= rolling_threshold, 1, 0))
+        rockiness = np.where(land, rockiness, 0)
+        self.terrain.rockiness[:] = rockiness
+
+        land_rockiness = rockiness[land]
+        flat_count = int((land_rockiness == 0).sum())
+        rolling_count = int((land_rockiness == 1).sum())
+        rocky_count = int((land_rockiness == 2).sum())
 
         land_total = flat_count + rolling_count + rocky_count
         if land_total:
@@ -759,7 +661,12 @@ class GameMap:
     def get_tile(self, x, y):
         """Safely get a tile at coordinates."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            index = y * self.width + x
+            tile = self._tile_views[index]
+            if tile is None:
+                tile = Tile(self.terrain, x, y)
+                self._tile_views[index] = tile
+            return tile
         return None
 
     def is_valid_position(self, x, y):
@@ -817,21 +724,33 @@ class GameMap:
         Returns:
             dict: Map data as dictionary
         """
+        terrain = self.terrain
+        improvement_lists = {}
+        river_lists = {}
         tiles_data = []
-        for row in self.tiles:
+        for y in range(self.height):
+            columns = zip(terrain.land[y].tolist(), terrain.supply_pod[y].tolist(),
+                          terrain.monolith[y].tolist(), terrain.altitude[y].tolist(),
+                          terrain.rainfall[y].tolist(), terrain.rockiness[y].tolist(),
+                          terrain.fungus[y].tolist(), terrain.improvements[y].tolist(),
+                          terrain.has_river[y].tolist(), terrain.river_edges[y].tolist())
             row_data = []
-            for tile in row:
+            for land, pod, monolith, altitude, rainfall, rockiness, fungus, imps, river, edges in columns:
+                if imps not in improvement_lists:
+                    improvement_lists[imps] = improvement_keys(imps)
+                if edges not in river_lists:
+                    river_lists[edges] = river_edge_keys(edges)
                 row_data.append({
-                    'terrain': tile.terrain_type,
-                    'supply_pod': tile.supply_pod,
-                    'monolith': tile.monolith,
-                    'altitude': tile.altitude,
-                    'rainfall': tile.rainfall,
-                    'rockiness': tile.rockiness,
-                    'fungus': tile._fungus,
-                    'improvements': list(tile.improvements),
-                    'has_river': tile.has_river,
-                    'river_edges': list(tile.river_edges)
+                    'terrain': 'land' if land else 'ocean',
+                    'supply_pod': pod,
+                    'monolith': monolith,
+                    'altitude': altitude,
+                    'rainfall': rainfall,
+                    'rockiness': rockiness,
+                    'fungus': fungus,
+                    'improvements': list(improvement_lists[imps]),
+                    'has_river': river,
+                    'river_edges': list(river_lists[edges])
                 })
             tiles_data.append(row_data)
 
@@ -855,25 +774,34 @@ class GameMap:
         game_map.width = data['width']
         game_map.height = data['height']
 
-        # Rebuild tiles
-        game_map.tiles = []
-        for y, row_data in enumerate(data['tiles']):
-            row = []
-            for x, tile_data in enumerate(row_data):
-                tile = Tile(x, y, tile_data['terrain'])
-                tile.supply_pod = tile_data.get('supply_pod', False)
-                tile.monolith = tile_data.get('monolith', False)
-                tile.altitude = tile_data.get('altitude', 0)    # Default to 0 for old saves
-                tile.rainfall = tile_data.get('rainfall', 1)    # Default to moderate for old saves
-                tile.rockiness = tile_data.get('rockiness', 0)  # Default to flat for old saves
-                tile._fungus = tile_data.get('fungus', False)
-                tile.improvements = set(tile_data.get('improvements', []))
+        # Rebuild terrain arrays
+        columns = {name: [] for name in ('land', 'supply_pod', 'monolith', 'altitude', 'rainfall',
+                                         'rockiness', 'fungus', 'improvements', 'has_river', 'river_edges')}
+        for row_data in data['tiles']:
+            for tile_data in row_data:
+                is_ocean = tile_data['terrain'] == 'ocean'
+                fungus = tile_data.get('fungus', False)
+                improvements = tile_data.get('improvements', [])
                 # Back-compat: old saves stored fungus as bool, not in improvements set
-                if tile._fungus and 'fungus' not in tile.improvements and 'sea_fungus' not in tile.improvements:
-                    tile.improvements.add('sea_fungus' if tile.terrain_type == 'ocean' else 'fungus')
-                tile.has_river = tile_data.get('has_river', False)
-                tile.river_edges = set(tile_data.get('river_edges', []))
-                row.append(tile)
-            game_map.tiles.append(row)
-
-        return game_map
\ No newline at end of file
+                if fungus and 'fungus' not in improvements and 'sea_fungus' not in improvements:
+                    improvements = list(improvements) + ['sea_fungus' if is_ocean else 'fungus']
+                columns['land'].append(not is_ocean)
+                columns['supply_pod'].append(tile_data.get('supply_pod', False))
+                columns['monolith'].append(tile_data.get('monolith', False))
+                columns['altitude'].append(tile_data.get('altitude', 0))    # Default to 0 for old saves
+                columns['rainfall'].append(tile_data.get('rainfall', 1))    # Default to moderate for old saves
+                columns['rockiness'].append(tile_data.get('rockiness', 0))  # Default to flat for old saves
+                columns['fungus'].append(fungus)
+                columns['improvements'].append(improvement_mask(improvements))
+                columns['has_river'].append(tile_data.get('has_river', False))
+                columns['river_edges'].append(
+                    sum(RIVER_EDGE_BITS[d] for d in set(tile_data.get('river_edges', []))))
+
+        terrain = TerrainStore(game_map.width, game_map.height)
+        for name, values in columns.items():
+            array = getattr(terrain, name)
+            array[:] = np.array(values, dtype=array.dtype).reshape(array.shape)
+        game_map.terrain = terrain
+        game_map._tile_views = [None] * (game_map.width * game_map.height)
+
+        return game_map
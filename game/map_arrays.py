@@ -0,0 +1,224 @@
+"""Array-backed map generation kernels.
+
+NumPy implementations of the whole-grid passes used by GameMap during
+map generation.  Each function takes and returns plain 2D arrays indexed
+[y][x]; GameMap is responsible for reading tile state into arrays and
+writing the results back.
+
+The map wraps east-west (x) and is clamped north-south (y), matching the
+rest of the game's neighbour logic.
+
+Public API
+----------
+shift_grid(grid, dx, dy, fill)              → array
+relax_altitudes(altitude, ocean_mask, ...)  → (altitude, iterations, max_violation, timings)
+numpy_rng()                                 → Generator
+propagate_moisture(ocean_mask, altitude)    → moisture
+classify_rainfall(moisture, ocean_mask, rockiness, cloud_cover, noise) → rainfall
+"""
+
+import random
+import time
+
+import numpy as np
+
+
+# Altitude limits in meters (see Tile.altitude)
+OCEAN_MIN_ALTITUDE = -3000
+OCEAN_MAX_ALTITUDE = -1
+LAND_MIN_ALTITUDE = 0
+LAND_MAX_ALTITUDE = 3500
+
+# 8-neighbour offsets, same visiting order as the tile loops in map.py
+NEIGHBOR_OFFSETS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1)
+                    if not (dx == 0 and dy == 0)]
+
+
+def shift_grid(grid, dx, dy, fill=0):
+    """Return the grid value of the (dx, dy) neighbour for every cell.
+
+    result[y][x] == grid[y + dy][(x + dx) % width].  Rows that fall off the
+    north or south edge are filled with `fill`.
+
+    Args:
+        grid (ndarray): 2D array indexed [y][x]
+        dx (int): Horizontal offset (wraps)
+        dy (int): Vertical offset (clamped)
+        fill: Value for cells whose neighbour is off the map
+
+    Returns:
+        ndarray: Shifted copy of grid with the same shape and dtype
+    """
+    shifted = np.roll(grid, -dx, axis=1) if dx else grid.copy()
+    if dy > 0:
+        shifted[:-dy] = shifted[dy:]
+        shifted[-dy:] = fill
+    elif dy < 0:
+        shifted[-dy:] = shifted[:dy]
+        shifted[:-dy] = fill
+    return shifted
+
+
+def _row_valid_mask(height, width, dy):
+    """Boolean grid: True where the (dy) neighbour row exists."""
+    valid = np.ones((height, width), dtype=bool)
+    if dy > 0:
+        valid[-dy:] = False
+    elif dy < 0:
+        valid[:-dy] = False
+    return valid
+
+
+def relax_altitudes(altitude, ocean_mask, max_iterations=200, relaxation_factor=0.3,
+                    max_step=1000, tolerance=5):
+    """Enforce the adjacent-altitude constraint by iterative relaxation.
+
+    Every iteration compares each tile to its 8 neighbours.  Each violated
+    pair proposes the adjustment that would bring the tile back within
+    `max_step` of that neighbour; the tile moves by `relaxation_factor`
+    of the average proposal (truncated toward zero, like int()).  All
+    proposals are computed from the previous iteration's altitudes and
+    then applied together, and adjusted tiles are clamped to the ocean or
+    land altitude range.  Iteration stops once the largest violation is
+    below `tolerance` meters.
+
+    Args:
+        altitude (ndarray): 2D int array of starting altitudes in meters
+        ocean_mask (ndarray): 2D bool array, True for ocean tiles
+        max_iterations (int): Iteration cap
+        relaxation_factor (float): Fraction of the average violation corrected per pass
+        max_step (int): Maximum allowed altitude difference between neighbours
+        tolerance (int): Stop once the largest violation is below this
+
+    Returns:
+        tuple: (altitude ndarray, iterations run, final max violation in meters,
+                list of per-iteration wall times in seconds)
+    """
+    alt = np.array(altitude, dtype=np.int64)
+    height, width = alt.shape
+    ocean_mask = np.asarray(ocean_mask, dtype=bool)
+    low = np.where(ocean_mask, OCEAN_MIN_ALTITUDE, LAND_MIN_ALTITUDE)
+    high = np.where(ocean_mask, OCEAN_MAX_ALTITUDE, LAND_MAX_ALTITUDE)
+    valid_masks = {dy: _row_valid_mask(height, width, dy) for dy in (-1, 0, 1)}
+
+    timings = []
+    max_violation = 0
+    iteration = 0
+    for iteration in range(max_iterations):
+        start = time.perf_counter()
+        total_adjustment = np.zeros((height, width), dtype=np.int64)
+        neighbor_count = np.zeros((height, width), dtype=np.int64)
+        max_violation = 0
+
+        for dx, dy in NEIGHBOR_OFFSETS:
+            neighbor = shift_grid(alt, dx, dy)
+            diff = alt - neighbor
+            violated = valid_masks[dy] & (np.abs(diff) > max_step)
+            if not violated.any():
+                continue
+            max_violation = max(max_violation, int((np.abs(diff[violated]) - max_step).max()))
+            # Too high → target neighbour + step; too low → neighbour - step
+            target = np.where(diff > 0, neighbor + max_step, neighbor - max_step)
+            total_adjustment += np.where(violated, target - alt, 0)
+            neighbor_count += violated
+
+        adjusted = neighbor_count > 0
+        if adjusted.any():
+            avg = total_adjustment[adjusted] / neighbor_count[adjusted]
+            proposed = alt[adjusted] + np.trunc(avg * relaxation_factor).astype(np.int64)
+            alt[adjusted] = np.clip(proposed, low[adjusted], high[adjusted])
+
+        timings.append(time.perf_counter() - start)
+        if max_violation < tolerance:
+            break
+
+    return alt, iteration + 1, max_violation, timings
+
+
+def numpy_rng():
+    """Return a NumPy generator seeded from the stdlib `random` module.
+
+    Keeps array-based generation reproducible under random.seed() like the
+    rest of map generation.
+    """
+    return np.random.default_rng(random.getrandbits(64))
+
+
+def propagate_moisture(ocean_mask, altitude, passes=3, decay=0.58,
+                       orographic_limit=0.4, orographic_scale=2500.0, orographic_weight=0.35):
+    """Carry moisture west-to-east across the map on a prevailing wind.
+
+    Ocean tiles are fixed at 1.0.  Each land tile takes its western
+    neighbour's moisture times `decay` plus an orographic term from the
+    altitude rise between the two tiles (only when the western tile is
+    also land).  Columns are swept west to east with all rows updated at
+    once, so each pass is a Gauss-Seidel sweep per row: column x reads the
+    already-updated column x-1, and column 0 reads the last column from
+    the previous pass through the east-west wrap.
+
+    Args:
+        ocean_mask (ndarray): 2D bool array, True for ocean tiles
+        altitude (ndarray): 2D array of altitudes in meters
+        passes (int): Number of west-to-east sweeps
+        decay (float): Fraction of moisture carried one tile east
+        orographic_limit (float): Clamp on the altitude-rise ratio
+        orographic_scale (float): Altitude difference (m) giving a ratio of 1.0
+        orographic_weight (float): Weight of the orographic term
+
+    Returns:
+        ndarray: 2D float array of moisture in [0.0, 1.0]
+    """
+    ocean = np.asarray(ocean_mask, dtype=bool)
+    alt = np.asarray(altitude, dtype=np.float64)
+    land = ~ocean
+
+    # Orographic term is fixed across passes — precompute it for every tile
+    west_land = np.roll(land, 1, axis=1)
+    alt_diff = alt - np.roll(alt, 1, axis=1)
+    orographic = np.clip(alt_diff / orographic_scale, -orographic_limit, orographic_limit)
+    orographic = np.where(land & west_land, orographic, 0.0) * orographic_weight
+
+    moisture = np.where(ocean, 1.0, 0.0)
+    width = moisture.shape[1]
+    for _ in range(passes):
+        for x in range(width):
+            carried = np.clip(moisture[:, x - 1] * decay + orographic[:, x], 0.0, 1.0)
+            moisture[:, x] = np.where(ocean[:, x], 1.0, carried)
+    return moisture
+
+
+def classify_rainfall(moisture, ocean_mask, rockiness, cloud_cover, noise,
+                      rock_penalties=(0.0, 0.07, 0.25), arid_below=0.25, rainy_from=0.62):
+    """Convert a moisture grid into rainfall levels (0=arid, 1=moderate, 2=rainy).
+
+    Adds the cloud-cover bias, an equatorial bonus (+0.10 on the centre
+    row, 0 at the top and bottom edges) and per-tile noise, clamps to
+    [0, 1], then subtracts the rockiness dryness penalty before applying
+    the thresholds.  Ocean tiles are always 1.
+
+    Args:
+        moisture (ndarray): 2D float moisture from propagate_moisture
+        ocean_mask (ndarray): 2D bool array, True for ocean tiles
+        rockiness (ndarray): 2D int array (0=flat, 1=rolling, 2=rocky)
+        cloud_cover (float): Global wetness bias
+        noise (ndarray): 2D float noise added per tile
+        rock_penalties (tuple): Moisture penalty indexed by rockiness
+        arid_below (float): Effective moisture below this is arid
+        rainy_from (float): Effective moisture at or above this is rainy
+
+    Returns:
+        ndarray: 2D int array of rainfall levels
+    """
+    height = moisture.shape[0]
+    equator_y = (height - 1) / 2.0
+    if equator_y > 0:
+        dist = np.abs(np.arange(height) - equator_y) / equator_y
+    else:
+        dist = np.zeros(height)
+    tropical_bonus = 0.10 * (1.0 - dist)
+
+    m = np.clip(moisture + tropical_bonus[:, None] + cloud_cover + noise, 0.0, 1.0)
+    effective_m = m - np.asarray(rock_penalties)[np.asarray(rockiness, dtype=np.int64)]
+
+    rainfall = np.where(effective_m < arid_below, 0, np.where(effective_m < rainy_from, 1, 2))
+    return np.where(ocean_mask, 1, rainfall).astype(np.int64)
@@ -33,6 +33,8 @@ class Renderer:
         self.camera_offset_x = 0  # Horizontal scroll in tiles (for wrapping)
         self.camera_offset_y = 0  # Vertical scroll in tiles (no wrapping, with bounds)
         self.base_offset_x = 0  # Centering offset in pixels
+        self._border_overlay = None  # Pre-rendered territory borders for the viewport
+        self._border_overlay_key = None
 
     def _update_offsets(self, game_map):
         """Calculate horizontal offset to center the map."""
@@ -508,16 +510,43 @@ class Renderer:
         delta_x = (tile_x - self.camera_offset_x) % game_map.width
         return delta_x < visible_tiles_x
 
+    # Transparent key for the border overlay (not used by any faction color)
+    BORDER_OVERLAY_COLORKEY = (255, 0, 255)
+
     def draw_territory_borders(self, territory, game_map):
         """Draw dotted territory borders for all players using faction colors.
 
         When territories abut, draws both faction colors side-by-side on the border.
 
+        The borders for the current viewport are rendered once into an
+        overlay surface and blitted every frame.  The overlay is only
+        redrawn when the territory changes (TerritoryManager.version) or
+        the camera moves.
+
+        Args:
+            territory (TerritoryManager): Territory management system
+            game_map: The game map for wrapping calculations
+        """
+        key = (territory, territory.version,
+               self.camera_offset_x % game_map.width, self.camera_offset_y,
+               self.base_offset_x, game_map.width, game_map.height, self.screen.get_size())
+        if key != self._border_overlay_key:
+            self._border_overlay = self._render_border_overlay(territory, game_map)
+            self._border_overlay_key = key
+        self.screen.blit(self._border_overlay, (0, 0))
+
+    def _render_border_overlay(self, territory, game_map):
+        """Render the visible territory borders onto a transparent overlay surface.
+
         Args:
             territory (TerritoryManager): Territory management system
             game_map: The game map for wrapping calculations
+
+        Returns:
+            pygame.Surface: Screen-sized surface with the border dashes drawn
         """
-        from game.data.faction_data import FACTION_DATA
+        overlay = pygame.Surface(self.screen.get_size())
+        overlay.fill(self.BORDER_OVERLAY_COLORKEY)
 
         # Get faction colors (faction_id passed in directly)
         def get_player_color(faction_id):
@@ -526,11 +555,13 @@ class Renderer:
             # Fallback color if out of range
             return (150, 150, 150)
 
+        segments = territory.get_border_segments()
+
         # Calculate visible range with wrapping
         visible_tiles_x = (display.SCREEN_WIDTH // TILE_SIZE) + 2
         visible_tiles_y = display.MAP_AREA_HEIGHT // TILE_SIZE
 
-        # For each visible tile, draw border edges with dual colors
+        # For each visible tile, draw its cached border edges with dual colors
         for screen_y_idx in range(visible_tiles_y):
             map_y = self.camera_offset_y + screen_y_idx
             if map_y >= game_map.height:
@@ -538,37 +569,18 @@ class Renderer:
 
             for screen_x_idx in range(visible_tiles_x):
                 map_x = (self.camera_offset_x + screen_x_idx) % game_map.width
-                owner = territory.get_tile_owner(map_x, map_y)
-                if owner is None:
-                    continue
-
-                # Check each edge and get neighbor owner
-                directions = [
-                    ('N', 0, -1),
-                    ('E', 1, 0),
-                    ('S', 0, 1),
-                    ('W', -1, 0)
-                ]
-
-                for edge_dir, dx, dy in directions:
-                    nx = (map_x + dx) % game_map.width
-                    ny = map_y + dy
-
-                    # Skip if out of bounds (Y doesn't wrap)
-                    if ny < 0 or ny >= game_map.height:
-                        neighbor_owner = None
-                    else:
-                        neighbor_owner = territory.get_tile_owner(nx, ny)
-
-                    # Only draw border if owners differ
-                    if neighbor_owner != owner:
-                        my_color = get_player_color(owner)
-                        neighbor_color = get_player_color(neighbor_owner) if neighbor_owner is not None else None
-                        self._draw_dual_color_border_at_screen_pos(
-                            screen_x_idx, screen_y_idx, edge_dir, my_color, neighbor_color
-                        )
-
-    def _draw_dual_color_border_at_screen_pos(self, screen_x_idx, screen_y_idx, edge_dir, my_color, neighbor_color):
+                for edge_dir, owner, neighbor_owner in segments.get((map_x, map_y), ()):
+                    my_color = get_player_color(owner)
+                    neighbor_color = get_player_color(neighbor_owner) if neighbor_owner is not None else None
+                    self._draw_dual_color_border_at_screen_pos(
+                        screen_x_idx, screen_y_idx, edge_dir, my_color, neighbor_color, surface=overlay
+                    )
+
+        overlay.set_colorkey(self.BORDER_OVERLAY_COLORKEY, pygame.RLEACCEL)
+        return overlay
+
+    def _draw_dual_color_border_at_screen_pos(self, screen_x_idx, screen_y_idx, edge_dir, my_color, neighbor_color,
+                                              surface=None):
         """Draw territory border with dual colors when territories abut.
 
         Draws the owner's color on the inside and neighbor's color on the outside.
@@ -580,7 +592,10 @@ class Renderer:
             edge_dir (str): Edge direction ('N', 'E', 'S', 'W')
             my_color (tuple): RGB color for this tile's owner
             neighbor_color (tuple or None): RGB color for neighbor owner (None if no neighbor)
+            surface (pygame.Surface): Surface to draw on (defaults to the screen)
         """
+        if surface is None:
+            surface = self.screen
         screen_x = (screen_x_idx * TILE_SIZE) + self.base_offset_x
         screen_y = screen_y_idx * TILE_SIZE
 
@@ -597,10 +612,10 @@ class Renderer:
                 x_start = screen_x + i
                 x_end = min(screen_x + i + dash_length, screen_x + TILE_SIZE)
                 # Draw my color on inner line
-                pygame.draw.line(self.screen, my_color, (x_start, y_pos_inner), (x_end, y_pos_inner), 1)
+                pygame.draw.line(surface, my_color, (x_start, y_pos_inner), (x_end, y_pos_inner), 1)
                 # Draw neighbor color on outer line if exists
                 if neighbor_color:
-                    pygame.draw.line(self.screen, neighbor_color, (x_start, y_pos_outer), (x_end, y_pos_outer), 1)
+                    pygame.draw.line(surface, neighbor_color, (x_start, y_pos_outer), (x_end, y_pos_outer), 1)
 
         elif edge_dir == 'S':
             # Bottom edge - draw my color above, neighbor color below
@@ -610,10 +625,10 @@ class Renderer:
                 x_start = screen_x + i
                 x_end = min(screen_x + i + dash_length, screen_x + TILE_SIZE)
                 # Draw my color on inner line
-                pygame.draw.line(self.screen, my_color, (x_start, y_pos_inner), (x_end, y_pos_inner), 1)
+                pygame.draw.line(surface, my_color, (x_start, y_pos_inner), (x_end, y_pos_inner), 1)
                 # Draw neighbor color on outer line if exists
                 if neighbor_color:
-                    pygame.draw.line(self.screen, neighbor_color, (x_start, y_pos_outer), (x_end, y_pos_outer), 1)
+                    pygame.draw.line(surface, neighbor_color, (x_start, y_pos_outer), (x_end, y_pos_outer), 1)
 
         elif edge_dir == 'W':
             # Left edge - draw my color right, neighbor color left
@@ -623,10 +638,10 @@ class Renderer:
                 y_start = screen_y + i
                 y_end = min(screen_y + i + dash_length, screen_y + TILE_SIZE)
                 # Draw my color on inner line
-                pygame.draw.line(self.screen, my_color, (x_pos_inner, y_start), (x_pos_inner, y_end), 1)
+                pygame.draw.line(surface, my_color, (x_pos_inner, y_start), (x_pos_inner, y_end), 1)
                 # Draw neighbor color on outer line if exists
                 if neighbor_color:
-                    pygame.draw.line(self.screen, neighbor_color, (x_pos_outer, y_start), (x_pos_outer, y_end), 1)
+                    pygame.draw.line(surface, neighbor_color, (x_pos_outer, y_start), (x_pos_outer, y_end), 1)
 
         elif edge_dir == 'E':
             # Right edge - draw my color left, neighbor color right
@@ -636,10 +651,10 @@ class Renderer:
                 y_start = screen_y + i
                 y_end = min(screen_y + i + dash_length, screen_y + TILE_SIZE)
                 # Draw my color on inner line
-                pygame.draw.line(self.screen, my_color, (x_pos_inner, y_start), (x_pos_inner, y_end), 1)
+                pygame.draw.line(surface, my_color, (x_pos_inner, y_start), (x_pos_inner, y_end), 1)
                 # Draw neighbor color on outer line if exists
                 if neighbor_color:
-                    pygame.draw.line(self.screen, neighbor_color, (x_pos_outer, y_start), (x_pos_outer, y_end), 1)
+                    pygame.draw.line(surface, neighbor_color, (x_pos_outer, y_start), (x_pos_outer, y_end), 1)
 
     def _draw_tile_borders(self, tile_x, tile_y, edges, color, game_map):
         """Draw dotted borders on specified edges of a tile.
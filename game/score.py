@@ -38,7 +38,7 @@ def calculate_score(game):
     """
     player_id = game.player_faction_id
     player_tech_tree = game.factions[player_id].tech_tree
-    player_bases = [b for b in game.bases if b.owner == player_id]
+    player_bases = game.faction_bases(player_id)
 
     # (1) Citizens in player bases
     citizens = sum(b.population for b in player_bases)
@@ -53,7 +53,7 @@ def calculate_score(game):
         for fid in game.factions:
             if fid == player_id:
                 continue
-            faction_pop = sum(b.population for b in game.bases if b.owner == fid)
+            faction_pop = sum(b.population for b in game.faction_bases(fid))
             if faction_pop == 0:
                 continue
             relation = diplo.diplo_relations.get(fid, 'Uncommitted') if diplo else 'Uncommitted'
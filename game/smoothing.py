@@ -0,0 +1,106 @@
+"""Grid smoothing and percentile thresholds for map generation.
+
+Shared primitive for noise-based map layers (rockiness, xenofungus, ...):
+blend each cell with the mean of its 8 neighbours, then pick per-terrain
+score thresholds so that an exact fraction of land and sea tiles end up
+above them.
+
+The neighbour mean is a 3x3 convolution with the centre excluded.  It
+wraps east-west and is clamped north-south like the rest of the map, and
+can be restricted to a mask so that, for example, land scores are only
+blended with other land tiles.
+
+Public API
+----------
+smooth_scores(score, self_weight, passes, mask)           → smoothed
+percentile_threshold(values, top_fraction, default)       → float
+smooth_and_threshold(score, land_mask, land_fraction, sea_fraction, ...)
+                                                          → (smoothed, land_threshold, sea_threshold)
+"""
+
+import numpy as np
+
+from game.map_arrays import NEIGHBOR_OFFSETS, shift_grid
+
+
+def smooth_scores(score, self_weight, passes=1, mask=None):
+    """Blend every cell with the average of its 8 neighbours.
+
+    new = score * self_weight + neighbour_mean * (1 - self_weight)
+
+    Args:
+        score (ndarray): 2D float array indexed [y][x]
+        self_weight (float): Weight kept from the cell's own score
+        passes (int): Number of smoothing passes
+        mask (ndarray): Optional 2D bool array.  When given, only masked
+            cells are updated and only masked neighbours are averaged.
+
+    Returns:
+        ndarray: Smoothed copy of score
+    """
+    score = np.array(score, dtype=np.float64)
+    if mask is None:
+        mask = np.ones(score.shape, dtype=bool)
+    else:
+        mask = np.asarray(mask, dtype=bool)
+
+    # Neighbour counts only depend on the mask and map edges
+    neighbor_count = np.zeros(score.shape, dtype=np.int64)
+    for dx, dy in NEIGHBOR_OFFSETS:
+        neighbor_count += shift_grid(mask, dx, dy, fill=False)
+    update = mask & (neighbor_count > 0)
+    safe_count = np.maximum(neighbor_count, 1)
+
+    for _ in range(passes):
+        masked = np.where(mask, score, 0.0)
+        neighbor_sum = np.zeros(score.shape, dtype=np.float64)
+        for dx, dy in NEIGHBOR_OFFSETS:
+            neighbor_sum += shift_grid(masked, dx, dy, fill=0.0)
+        blended = score * self_weight + (neighbor_sum / safe_count) * (1.0 - self_weight)
+        score = np.where(update, blended, score)
+    return score
+
+
+def percentile_threshold(values, top_fraction, default):
+    """Return the score at or above which the top `top_fraction` of values lie.
+
+    Equivalent to sorted(values)[max(0, int(n * (1 - top_fraction)) - 1)].
+
+    Args:
+        values (ndarray): 1D array of scores
+        top_fraction (float): Fraction of values that should meet the threshold
+        default (float): Returned when values is empty
+
+    Returns:
+        float: Threshold score
+    """
+    n = len(values)
+    if n == 0:
+        return default
+    k = max(0, int(n * (1.0 - top_fraction)) - 1)
+    return float(np.partition(values, k)[k])
+
+
+def smooth_and_threshold(score, land_mask, land_fraction, sea_fraction, self_weight,
+                         passes=1, land_only=False, default=1.1):
+    """Smooth a score grid and compute separate land and sea thresholds.
+
+    Args:
+        score (ndarray): 2D float array indexed [y][x]
+        land_mask (ndarray): 2D bool array, True for land tiles
+        land_fraction (float): Fraction of land tiles that should meet the land threshold
+        sea_fraction (float): Fraction of ocean tiles that should meet the sea threshold
+        self_weight (float): Weight kept from each cell's own score
+        passes (int): Number of smoothing passes
+        land_only (bool): Smooth land cells with land neighbours only and
+            leave ocean cells untouched
+        default (float): Threshold used when a terrain type has no tiles
+
+    Returns:
+        tuple: (smoothed ndarray, land_threshold, sea_threshold)
+    """
+    land_mask = np.asarray(land_mask, dtype=bool)
+    smoothed = smooth_scores(score, self_weight, passes, mask=land_mask if land_only else None)
+    land_threshold = percentile_threshold(smoothed[land_mask], land_fraction, default)
+    sea_threshold = percentile_threshold(smoothed[~land_mask], sea_fraction, default)
+    return smoothed, land_threshold, sea_threshold
@@ -7,6 +7,23 @@ Players accumulate research points each turn to discover new technologies.
 
 from game.data.tech_tree_data import TECHS
 
+
+def _build_unlock_graph(techs):
+    """Build the reverse prerequisite graph: tech ID -> techs that require it."""
+    unlocks = {tech_id: [] for tech_id in techs}
+    for tech_id, tech in techs.items():
+        for prereq in set(tech.get('prereqs', [])):
+            unlocks.setdefault(prereq, []).append(tech_id)
+    return {tech_id: tuple(children) for tech_id, children in unlocks.items()}
+
+
+# Techs unlocked by each tech, in TECHS order
+TECH_UNLOCKS = _build_unlock_graph(TECHS)
+
+# Position of each tech in TECHS, used as the tie-break when sorting by cost
+_TECH_ORDER = {tech_id: i for i, tech_id in enumerate(TECHS)}
+
+
 class TechTree:
     """Manages the technology tree and research progress.
 
@@ -19,6 +36,9 @@ class TechTree:
         current_research (str): Tech ID currently being researched
         research_accumulated (int): Research points toward current tech
         research_per_turn (int): Research points gained each turn
+
+    Techs must be added with discover() (not discovered_techs.add) so the
+    research frontier stays current.
     """
 
     def __init__(self):
@@ -28,6 +48,57 @@ class TechTree:
         self.current_research = None  # Player chooses what to research
         self.research_accumulated = 0
         self.research_per_turn = 1  # Set by add_research() during upkeep; 1 is a safe default
+        self._rebuild_frontier()
+
+    def _rebuild_frontier(self):
+        """Recompute the research frontier from discovered_techs.
+
+        _missing_prereqs counts each tech's undiscovered prerequisites; the
+        frontier holds the undiscovered techs whose count is zero.
+        """
+        self._missing_prereqs = {
+            tech_id: sum(1 for prereq in set(tech.get('prereqs', []))
+                         if prereq not in self.discovered_techs)
+            for tech_id, tech in self.technologies.items()
+        }
+        self._frontier = {
+            tech_id for tech_id, missing in self._missing_prereqs.items()
+            if missing == 0 and tech_id not in self.discovered_techs
+        }
+        self._available_sorted = None
+
+    def discover(self, tech_id):
+        """Mark a technology as discovered and update the research frontier.
+
+        Only the techs that list it as a prerequisite are touched.
+
+        Args:
+            tech_id (str): Technology ID
+
+        Returns:
+            bool: True if the tech was newly discovered
+        """
+        if tech_id in self.discovered_techs:
+            return False
+        self.discovered_techs.add(tech_id)
+        self._frontier.discard(tech_id)
+        for child in TECH_UNLOCKS.get(tech_id, ()):
+            self._missing_prereqs[child] -= 1
+            if self._missing_prereqs[child] == 0 and child not in self.discovered_techs:
+                self._frontier.add(child)
+        self._available_sorted = None
+        return True
+
+    def get_unlocked_techs(self, tech_id):
+        """Get the technologies that list a tech as a prerequisite.
+
+        Args:
+            tech_id (str): Technology ID
+
+        Returns:
+            tuple: Tech IDs, in tech tree order
+        """
+        return TECH_UNLOCKS.get(tech_id, ())
 
     def is_available(self, tech_id):
         """Check if a technology is available to be researched.
@@ -38,14 +109,7 @@ class TechTree:
         Returns:
             bool: True if prerequisites are met and not yet discovered
         """
-        if tech_id not in self.technologies or tech_id in self.discovered_techs:
-            return False
-
-        tech = self.technologies[tech_id]
-
-        # 'all()' returns True if the list is empty (Tier 1)
-        # or if every prereq is in our discovered set.
-        return all(prereq in self.discovered_techs for prereq in tech.get('prereqs', []))
+        return tech_id in self._frontier
 
     def get_available_techs(self):
         """Get all technologies that can currently be researched.
@@ -53,14 +117,12 @@ class TechTree:
         Returns:
             list: List of (tech_id, tech_data) tuples for available techs
         """
-        available = []
-        for tech_id, tech_data in self.technologies.items():
-            if self.is_available(tech_id):
-                available.append((tech_id, tech_data))
-
-        # Sort by cost (cheapest first)
-        available.sort(key=lambda x: x[1]['cost'])
-        return available
+        if self._available_sorted is None:
+            # Sort by cost (cheapest first), ties in tech tree order
+            ordered = sorted(self._frontier,
+                             key=lambda t: (self.technologies[t]['cost'], _TECH_ORDER[t]))
+            self._available_sorted = [(tech_id, self.technologies[tech_id]) for tech_id in ordered]
+        return list(self._available_sorted)
 
     def set_current_research(self, tech_id):
         """Set the technology to research.
@@ -161,7 +223,7 @@ class TechTree:
         # Check for tech completion
         if self.research_accumulated >= self.get_research_cost():
             completed_tech = self.current_research
-            self.discovered_techs.add(completed_tech)
+            self.discover(completed_tech)
             tech_name = self.technologies[completed_tech]['name']
             print(f"Technology discovered: {tech_name}!")
 
@@ -277,6 +339,7 @@ class TechTree:
 
         # Restore research state
         tree.discovered_techs = set(data['discovered_techs'])
+        tree._rebuild_frontier()
         tree.current_research = data['current_research']
         tree.research_accumulated = data['research_accumulated']
 
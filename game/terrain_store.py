@@ -0,0 +1,248 @@
+"""Structure-of-arrays terrain storage.
+
+GameMap keeps all per-tile terrain state in one TerrainStore: a handful of
+typed NumPy arrays indexed [y][x] instead of one Python object (with its
+own sets) per tile.  Tile objects in map.py are thin views onto a single
+cell of the store and are only created when something asks for them.
+
+Terrain improvements and river edges are stored as bitmasks.  The
+ImprovementSet and RiverEdgeSet views give them the same set interface
+the rest of the game already uses (`in`, add, discard, clear, iteration,
+`&`), so `tile.improvements.add('farm')` keeps working.
+
+Public API
+----------
+TerrainStore(width, height)
+improvement_bit(key)     → int
+improvement_mask(keys)   → int
+improvement_keys(mask)   → list[str]
+river_edge_keys(mask)    → list[str]
+"""
+
+import abc
+from collections.abc import MutableSet
+
+import numpy as np
+
+from game.data.terraforming_data import IMPROVEMENTS
+
+
+# ---------------------------------------------------------------------------
+# Bit assignments
+# ---------------------------------------------------------------------------
+
+# One bit per improvement key.  Keys from IMPROVEMENTS get fixed bits; any
+# other key (e.g. from a save made with a different data file) is assigned
+# the next free bit on first use.
+_IMPROVEMENT_BITS = {key: 1 << i for i, key in enumerate(IMPROVEMENTS)}
+_MAX_IMPROVEMENT_BITS = 64
+
+RIVER_EDGE_BITS = {'N': 1, 'S': 2, 'E': 4, 'W': 8}
+
+
+def improvement_bit(key):
+    """Return the bitmask bit for an improvement key, assigning one if new."""
+    bit = _IMPROVEMENT_BITS.get(key)
+    if bit is None:
+        if len(_IMPROVEMENT_BITS) >= _MAX_IMPROVEMENT_BITS:
+            raise ValueError(f"Too many improvement types to store '{key}'")
+        bit = 1 << len(_IMPROVEMENT_BITS)
+        _IMPROVEMENT_BITS[key] = bit
+    return bit
+
+
+def improvement_mask(keys):
+    """Return the combined bitmask for an iterable of improvement keys."""
+    mask = 0
+    for key in keys:
+        mask |= improvement_bit(key)
+    return mask
+
+
+def _keys_in_mask(bits, mask):
+    """Yield the keys of `bits` whose bit is set in mask."""
+    for key, bit in bits.items():
+        if mask & bit:
+            yield key
+
+
+def improvement_keys(mask):
+    """Return the list of improvement keys set in an improvement bitmask."""
+    return list(_keys_in_mask(_IMPROVEMENT_BITS, mask))
+
+
+def river_edge_keys(mask):
+    """Return the list of directions set in a river edge bitmask."""
+    return list(_keys_in_mask(RIVER_EDGE_BITS, mask))
+
+
+# ---------------------------------------------------------------------------
+# Bitmask set views
+# ---------------------------------------------------------------------------
+
+class _BitmaskSet(MutableSet):
+    """Set-like view over one cell of an integer bitmask array.
+
+    `on_change(index)` is called after every write, if given.
+    """
+
+    __slots__ = ('_array', '_index', '_on_change')
+
+    def __init__(self, array, index, on_change=None):
+        self._array = array
+        self._index = index
+        self._on_change = on_change
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Results of &, |, - etc. are plain sets, not new views
+        return set(it)
+
+    @abc.abstractmethod
+    def _bit(self, key):
+        """Return the bit for a key (raising or assigning one if it is unknown)."""
+
+    @abc.abstractmethod
+    def _bits(self):
+        """Return the key -> bit table of the keys that have bits."""
+
+    def _get(self):
+        return self._array.item(self._index)
+
+    def _set(self, mask):
+        self._array.flat[self._index] = mask
+        if self._on_change is not None:
+            self._on_change(self._index)
+
+    def __contains__(self, key):
+        bit = self._bits().get(key)
+        return bit is not None and bool(self._get() & bit)
+
+    def __iter__(self):
+        return _keys_in_mask(self._bits(), self._get())
+
+    def __len__(self):
+        return bin(self._get()).count('1')
+
+    def add(self, key):
+        self._set(self._get() | self._bit(key))
+
+    def discard(self, key):
+        bit = self._bits().get(key)
+        if bit is not None:
+            self._set(self._get() & ~bit)
+
+    def clear(self):
+        self._set(0)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({set(self)!r})"
+
+
+class ImprovementSet(_BitmaskSet):
+    """Set view of a tile's completed terraforming improvements."""
+
+    __slots__ = ()
+
+    def _bit(self, key):
+        return improvement_bit(key)
+
+    def _bits(self):
+        return _IMPROVEMENT_BITS
+
+
+class RiverEdgeSet(_BitmaskSet):
+    """Set view of the directions ('N', 'S', 'E', 'W') a river crosses."""
+
+    __slots__ = ()
+
+    def _bit(self, key):
+        return RIVER_EDGE_BITS[key]
+
+    def _bits(self):
+        return RIVER_EDGE_BITS
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class TerrainStore:
+    """Typed per-tile terrain arrays for one map.
+
+    Every array has shape (height, width) and is indexed [y][x].
+
+    Attributes:
+        land (ndarray[bool]): True for land, False for ocean
+        altitude (ndarray[int16]): Altitude in meters (-3000 to 3500)
+        rainfall (ndarray[int8]): 0=arid, 1=moderate, 2=rainy
+        rockiness (ndarray[int8]): 0=flat, 1=rolling, 2=rocky
+        fungus (ndarray[bool]): Fungus backing flag (see Tile.fungus)
+        void (ndarray[bool]): Edge rows outside the playable map
+        supply_pod (ndarray[bool]): Unity supply pod present
+        monolith (ndarray[bool]): Alien monolith present
+        has_river (ndarray[bool]): Aquifer drilled here
+        improvements (ndarray[uint64]): Improvement bitmask (see improvement_bit)
+        river_edges (ndarray[uint8]): River edge bitmask (see RIVER_EDGE_BITS)
+        yield_version (ndarray[uint32]): Bumped whenever a tile's yields may change
+        yield_epoch (int): Bumped whenever any tile's yields may change
+        yield_cache (dict): Flat tile index -> memoized yield record (see map.tile_yields)
+        yield_cache_hits (int): Yield lookups served from the cache (debug stat)
+        yield_cache_misses (int): Yield lookups that had to be computed (debug stat)
+    """
+
+    def __init__(self, width, height):
+        """Allocate empty (all-ocean, moderate, flat) terrain arrays.
+
+        Args:
+            width (int): Map width in tiles
+            height (int): Map height in tiles
+        """
+        self.width = width
+        self.height = height
+        shape = (height, width)
+        self.land = np.zeros(shape, dtype=bool)
+        self.altitude = np.zeros(shape, dtype=np.int16)
+        self.rainfall = np.ones(shape, dtype=np.int8)
+        self.rockiness = np.zeros(shape, dtype=np.int8)
+        self.fungus = np.zeros(shape, dtype=bool)
+        self.void = np.zeros(shape, dtype=bool)
+        self.supply_pod = np.zeros(shape, dtype=bool)
+        self.monolith = np.zeros(shape, dtype=bool)
+        self.has_river = np.zeros(shape, dtype=bool)
+        self.improvements = np.zeros(shape, dtype=np.uint64)
+        self.river_edges = np.zeros(shape, dtype=np.uint8)
+        self.yield_version = np.zeros(shape, dtype=np.uint32)
+        self.yield_epoch = 0
+        self.yield_cache = {}
+        self.yield_cache_hits = 0
+        self.yield_cache_misses = 0
+
+    @property
+    def ocean(self):
+        """Bool array, True for ocean tiles."""
+        return ~self.land
+
+    def touch_yields(self, index):
+        """Mark one tile's yields as changed.
+
+        Called by Tile setters for every field that feeds the yield
+        calculation, so cached records are dropped only for the tiles that
+        actually changed.
+
+        Args:
+            index (int): Flat tile index (y * width + x)
+        """
+        self.yield_version.flat[index] += 1
+        self.yield_epoch += 1
+        self.yield_cache.pop(index, None)
+
+    def invalidate_yields(self):
+        """Mark every tile's yields as changed (after writing arrays directly)."""
+        self.yield_version += 1
+        self.yield_epoch += 1
+        self.yield_cache.clear()
+
+    def nbytes(self):
+        """Total bytes held by the terrain arrays."""
+        return sum(arr.nbytes for arr in vars(self).values() if isinstance(arr, np.ndarray))
@@ -6,6 +6,20 @@ borders in the owning player's color. Tiles are assigned to the closest
 base, with ties resolved by various criteria.
 """
 
+import numpy as np
+
+from game.map_arrays import shift_grid
+
+
+TERRITORY_RADIUS = 7  # Manhattan distance a base projects territory
+
+
+NEUTRAL = -1  # owner_grid value for unclaimed / contested tiles
+
+
+# Cardinal edges in drawing order: (edge, dx, dy)
+BORDER_DIRECTIONS = (('N', 0, -1), ('E', 1, 0), ('S', 0, 1), ('W', -1, 0))
+
 
 class TerritoryManager:
     """Manages territory control across the map.
@@ -16,38 +30,197 @@ class TerritoryManager:
     2. If different owners, leave neutral
     3. Secondary tiebreaker: base with higher population wins
 
+    Nearest bases are found with a multi-source breadth-first expansion
+    from every base at once, so a rebuild costs time proportional to the
+    claimed area rather than tiles × bases.
+
+    Border edges are derived from owner_grid on demand and cached until
+    the next territory update; `version` increases on every update so
+    renderers can cache anything they draw from the borders.
+
     Attributes:
         game_map (GameMap): Reference to the game map
-        territory_map (dict): Maps (x, y) to owner_id or None
+        base_index (BaseIndex): Spatial index of bases, or None to scan the bases list
+        owner_grid (ndarray): [y][x] int8 owner_id, or NEUTRAL (-1)
+        version (int): Incremented whenever owner_grid changes
     """
 
-    def __init__(self, game_map):
+    def __init__(self, game_map, base_index=None):
         """Initialize territory manager.
 
         Args:
             game_map (GameMap): The game map
+            base_index (BaseIndex): Spatial index of the game's bases (optional)
         """
         self.game_map = game_map
-        self.territory_map = {}  # (x, y) -> owner_id or None for neutral
+        self.base_index = base_index
+        self.owner_grid = np.full((game_map.height, game_map.width), NEUTRAL, dtype=np.int8)
+        self.version = 0
+        self._border_segments = None
 
     def update_territory(self, bases):
         """Recalculate all territory based on current bases.
 
+        Full rebuild — use when there is no previous territory to update
+        (new game, loaded save).  Single base events should go through
+        update_territory_for_base.
+
         Args:
             bases (list): List of all bases in the game
         """
-        # Reset territory map
-        self.territory_map = {}
+        self.owner_grid.fill(NEUTRAL)
+        for (x, y), closest_bases in self._find_closest_bases(bases).items():
+            self.owner_grid[y, x] = self._resolve_owner(x, y, closest_bases)
+        self._invalidate_borders()
+
+    def update_territory_for_base(self, base, bases):
+        """Recalculate territory around one base that changed.
+
+        Call after a base is founded, destroyed, captured, or changes
+        population.  Only tiles within TERRITORY_RADIUS of the base can
+        change owner, and only bases within twice that radius can compete
+        for them, so the work is independent of map size and base count.
+
+        Args:
+            base (Base): The base that was added, removed, captured or resized
+                (for a removed base, its last position is used)
+            bases (list): List of all bases in the game, after the change
+                (only scanned when there is no base_index)
+        """
+        if self.base_index is not None:
+            nearby_bases = self.base_index.bases_within(base.x, base.y, 2 * TERRITORY_RADIUS)
+        else:
+            nearby_bases = [b for b in bases
+                            if self._manhattan_distance(base.x, base.y, b.x, b.y) <= 2 * TERRITORY_RADIUS]
+        closest = self._find_closest_bases(nearby_bases)
+        for x, y in self._tiles_within_radius(base.x, base.y, TERRITORY_RADIUS):
+            closest_bases = closest.get((x, y))
+            if closest_bases:
+                self.owner_grid[y, x] = self._resolve_owner(x, y, closest_bases)
+            else:
+                self.owner_grid[y, x] = NEUTRAL
+        self._invalidate_borders()
+
+    def _invalidate_borders(self):
+        """Drop the cached border edges after owner_grid changed."""
+        self.version += 1
+        self._border_segments = None
+
+    def get_border_segments(self):
+        """Get every territory border edge on the map.
+
+        An edge is a border when the tile is owned and the neighbour across
+        it has a different owner, is neutral, or is off the top or bottom
+        of the map.  Built once per territory update and cached.
 
-        # Calculate for each tile
+        Returns:
+            dict: (x, y) -> tuple of (edge, owner, neighbor_owner) records in
+                N, E, S, W order, where neighbor_owner is None for neutral or
+                off-map neighbours.  Tiles without border edges are absent.
+        """
+        if self._border_segments is None:
+            self._border_segments = self._build_border_segments()
+        return self._border_segments
+
+    def _build_border_segments(self):
+        """Compute the border edge records for get_border_segments."""
+        grid = self.owner_grid
+        owned = grid != NEUTRAL
+        segments = {}
+        for edge, dx, dy in BORDER_DIRECTIONS:
+            neighbor = shift_grid(grid, dx, dy, fill=NEUTRAL)
+            ys, xs = np.nonzero(owned & (neighbor != grid))
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                owner = grid.item(y, x)
+                neighbor_owner = neighbor.item(y, x)
+                record = (edge, owner, None if neighbor_owner == NEUTRAL else neighbor_owner)
+                segments.setdefault((x, y), []).append(record)
+        return {coords: tuple(records) for coords, records in segments.items()}
+
+    def verify_territory(self, bases):
+        """Compare the current territory against a brute-force rebuild.
+
+        Validation path only: checks every tile against every base.
+
+        Args:
+            bases (list): List of all bases in the game
+
+        Returns:
+            list: (x, y, current_owner, expected_owner) for every mismatched tile
+        """
+        mismatches = []
         for y in range(self.game_map.height):
             for x in range(self.game_map.width):
-                owner = self._calculate_tile_owner(x, y, bases)
-                if owner is not None:
-                    self.territory_map[(x, y)] = owner
+                current = self.get_tile_owner(x, y)
+                expected = self._calculate_tile_owner(x, y, bases)
+                if current != expected:
+                    mismatches.append((x, y, current, expected))
+        return mismatches
+
+    def _find_closest_bases(self, bases):
+        """Find the nearest base(s) of every tile within TERRITORY_RADIUS.
+
+        Multi-source BFS over the 4-connected grid (wrapping horizontally),
+        seeded from every base.  A base is nearest to a tile at distance d
+        exactly when it is nearest to some neighbour at distance d - 1, so
+        each layer inherits the union of its parents' nearest bases.
+
+        Args:
+            bases (list): Bases to expand from
+
+        Returns:
+            dict: (x, y) -> list of bases tied for nearest
+        """
+        width = self.game_map.width
+        height = self.game_map.height
+        closest = {}
+        frontier = []
+        for base in bases:
+            coords = (base.x, base.y)
+            if coords not in closest:
+                closest[coords] = []
+                frontier.append(coords)
+            closest[coords].append(base)
+
+        for _ in range(TERRITORY_RADIUS):
+            next_layer = {}
+            for x, y in frontier:
+                parent_bases = closest[(x, y)]
+                for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0)):
+                    ny = y + dy
+                    if ny < 0 or ny >= height:
+                        continue
+                    coords = ((x + dx) % width, ny)
+                    if coords in closest:
+                        continue  # Already reached at a smaller distance
+                    layer_bases = next_layer.setdefault(coords, [])
+                    for base in parent_bases:
+                        if base not in layer_bases:
+                            layer_bases.append(base)
+            closest.update(next_layer)
+            frontier = list(next_layer)
+        return closest
+
+    def _tiles_within_radius(self, cx, cy, radius):
+        """Return the set of (x, y) tiles within Manhattan radius of a tile.
+
+        Wraps horizontally and is clipped to the map vertically.
+        """
+        tiles = set()
+        for dy in range(-radius, radius + 1):
+            y = cy + dy
+            if y < 0 or y >= self.game_map.height:
+                continue
+            span = radius - abs(dy)
+            for dx in range(-span, span + 1):
+                tiles.add(((cx + dx) % self.game_map.width, y))
+        return tiles
 
     def _calculate_tile_owner(self, x, y, bases):
-        """Calculate which player owns a specific tile.
+        """Calculate which player owns a specific tile by checking every base.
+
+        Brute-force reference for verify_territory; normal updates use
+        _find_closest_bases.
 
         Args:
             x (int): Tile X coordinate
@@ -64,7 +237,7 @@ class TerritoryManager:
         candidates = []
         for base in bases:
             dist = self._manhattan_distance(x, y, base.x, base.y)
-            if dist <= 7:
+            if dist <= TERRITORY_RADIUS:
                 candidates.append((dist, base))
 
         if not candidates:
@@ -73,7 +246,19 @@ class TerritoryManager:
         # Find minimum distance
         min_dist = min(c[0] for c in candidates)
         closest_bases = [c[1] for c in candidates if c[0] == min_dist]
+        return self._resolve_owner(x, y, closest_bases)
+
+    def _resolve_owner(self, x, y, closest_bases):
+        """Pick the owner of a tile from the bases tied for nearest.
+
+        Args:
+            x (int): Tile X coordinate
+            y (int): Tile Y coordinate
+            closest_bases (list): Bases at the minimum distance (at least one)
 
+        Returns:
+            int: Owner player_id
+        """
         # Single closest base - clear ownership
         if len(closest_bases) == 1:
             return closest_bases[0].owner
@@ -86,7 +271,7 @@ class TerritoryManager:
 
         # Different owners at same distance - use multiple tiebreakers
         # Tiebreaker 1: base with higher population wins
-        closest_bases.sort(key=lambda b: (b.population, -b.x, -b.y), reverse=True)
+        closest_bases = sorted(closest_bases, key=lambda b: (b.population, -b.x, -b.y), reverse=True)
         if closest_bases[0].population > closest_bases[1].population:
             return closest_bases[0].owner
 
@@ -125,7 +310,11 @@ class TerritoryManager:
         Returns:
             int or None: Owner player_id, or None if neutral
         """
-        return self.territory_map.get((x, y), None)
+        if 0 <= x < self.game_map.width and 0 <= y < self.game_map.height:
+            owner = self.owner_grid.item(y, x)
+            if owner != NEUTRAL:
+                return owner
+        return None
 
     def is_border_tile(self, x, y):
         """Check if a tile is on a territory border.
@@ -144,6 +333,7 @@ class TerritoryManager:
             return False
 
         # Check all 4 cardinal directions
+        grid = self.owner_grid
         directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
         for dx, dy in directions:
             nx = (x + dx) % self.game_map.width  # Wrap X
@@ -152,8 +342,7 @@ class TerritoryManager:
             if ny < 0 or ny >= self.game_map.height:
                 continue
 
-            neighbor_owner = self.get_tile_owner(nx, ny)
-            if neighbor_owner != owner:
+            if grid.item(ny, nx) != owner:
                 return True
 
         return False
@@ -170,24 +359,5 @@ class TerritoryManager:
         Returns:
             list: List of edge directions ('N', 'E', 'S', 'W')
         """
-        owner = self.get_tile_owner(x, y)
-        if owner is None:
-            return []
-
-        edges = []
-        directions = [('N', 0, -1), ('E', 1, 0), ('S', 0, 1), ('W', -1, 0)]
-
-        for edge, dx, dy in directions:
-            nx = (x + dx) % self.game_map.width  # Wrap X
-            ny = y + dy
-            # Y doesn't wrap - check for map edge
-            if ny < 0 or ny >= self.game_map.height:
-                # Map edge (top or bottom)
-                edges.append(edge)
-                continue
-
-            neighbor_owner = self.get_tile_owner(nx, ny)
-            if neighbor_owner != owner:
-                edges.append(edge)
-
-        return edges
+        segments = self.get_border_segments().get((x, y), ())
+        return [edge for edge, _, _ in segments]
@@ -4,6 +4,8 @@ Handles the game clock: when things happen, in what order, and who acts next.
 Covers end-of-turn, AI turn processing, upkeep phase, and unit cycling.
 """
 
+import time
+
 import pygame
 
 
@@ -17,6 +19,12 @@ class TurnManager:
             game (Game): Reference to main game instance
         """
         self.game = game
+        self.fast_ai = False  # Run AI decisions in per-frame time slices (see process_ai_slice)
+        self.ai_camera_follow = True  # Center the camera on each AI unit as it moves
+        self.ai_turn_started = None  # perf_counter() when the current AI turns began
+        self.ai_processing_time = 0.0  # Seconds spent inside process_ai_turns this turn
+        self.ai_decisions = 0  # process_ai_turns calls this turn
+        self.last_ai_turn_time = None  # (processing seconds, elapsed seconds) of the last AI turn
         self.known_ai_secret_projects = set()        # (faction_id, project_name) already notified
         self.known_ai_secret_project_warnings = set()  # (faction_id, project_name) 1-turn warnings fired
 
@@ -151,9 +159,8 @@ class TurnManager:
         """
         game = self.game
         # Reset player units
-        for unit in game.units:
-            if unit.owner == game.player_faction_id:
-                unit.end_turn()
+        for unit in game.faction_units(game.player_faction_id):
+            unit.end_turn()
 
         # Refuel air units at bases and check for crashes
         game._process_air_unit_fuel(game.player_faction_id)
@@ -173,10 +180,62 @@ class TurnManager:
     # AI turn processing
     # -----------------------------------------------------------------------
 
+    def process_ai_slice(self, budget_ms, is_blocked):
+        """Run AI steps until a frame's time budget is used up (fast AI mode).
+
+        Stops early when the AI turns finish or something needs the player
+        (is_blocked returns True), so dialogs and battles behave exactly as
+        with one step per call.
+
+        Args:
+            budget_ms (float): Time budget for this frame in milliseconds
+            is_blocked (callable): Returns True while a dialog must be answered
+
+        Returns:
+            bool: True if still processing AI, False if all AI turns complete
+        """
+        game = self.game
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while game.processing_ai:
+            self.process_ai_turns()
+            if is_blocked() or time.perf_counter() >= deadline:
+                break
+        return game.processing_ai
+
     def process_ai_turns(self):
+        """Process one AI step and keep track of the AI turn's time.
+
+        Returns:
+            bool: True if still processing AI, False if all AI turns complete
+        """
+        game = self.game
+        if not game.processing_ai:
+            return False
+
+        started = time.perf_counter()
+        if self.ai_turn_started is None:
+            self.ai_turn_started = started
+            self.ai_processing_time = 0.0
+            self.ai_decisions = 0
+
+        still_processing = self._process_ai_step()
+
+        finished = time.perf_counter()
+        self.ai_processing_time += finished - started
+        self.ai_decisions += 1
+        if not game.processing_ai:
+            elapsed = finished - self.ai_turn_started
+            self.last_ai_turn_time = (self.ai_processing_time, elapsed)
+            self.ai_turn_started = None
+            print(f"AI turns took {self.ai_processing_time * 1000:.0f} ms of processing "
+                  f"over {self.ai_decisions} steps ({elapsed:.1f} s elapsed)")
+        return still_processing
+
+    def _process_ai_step(self):
         """Process AI turns sequentially, one unit at a time.
 
-        Called repeatedly from main loop with delay between units. For each
+        Called through process_ai_turns: once per AI_TURN_DELAY from the main
+        loop, or as often as the frame budget allows in fast AI mode. For each
         AI player, resets their units then processes them one by one. After
         all AI players finish, collects upkeep events and starts upkeep phase.
 
@@ -192,7 +251,8 @@ class TurnManager:
         6. If no upkeep events → start new turn immediately
 
         Note:
-            Centers camera on active AI unit for visibility.
+            Centers camera on active AI unit for visibility (unless
+            ai_camera_follow is off).
             Checks victory conditions after all AI turns complete.
         """
         game = self.game
@@ -214,23 +274,23 @@ class TurnManager:
                 # Process this AI player
                 print(f"\n=== AI Player {ai_player.player_id} Turn ===")
 
+                ai_units = game.faction_units(ai_player.player_id)
+
                 # Reset AI units for their turn
-                for unit in game.units:
-                    if unit.owner == ai_player.player_id:
-                        unit.end_turn()
+                for unit in ai_units:
+                    unit.end_turn()
 
-                # Advance terraforming for AI formers
+                # Advance terraforming for AI formers (completing one can destroy units)
                 from game.terraforming import process_terraforming
-                for unit in game.units:
-                    if unit.owner == ai_player.player_id and unit.terraforming_action:
-                        process_terraforming(unit, game)
+                for unit in [u for u in ai_units if u.terraforming_action]:
+                    process_terraforming(unit, game)
 
                 # Heal AI units
                 game._process_unit_repair(ai_player.player_id)
 
                 # Queue up all AI units with moves
-                game.ai_unit_queue = [u for u in game.units
-                                      if u.owner == ai_player.player_id and u.moves_remaining > 0]
+                game.ai_unit_queue = [u for u in game.faction_units(ai_player.player_id)
+                                      if u.moves_remaining > 0]
                 game.ai_current_unit_index = 0
                 if game.ai_unit_queue:
                     return True
@@ -247,21 +307,20 @@ class TurnManager:
                 total_economy = 0
                 total_labs = 0
                 bureaucracy_map = game._calc_bureaucracy_drones(game.player_faction_id)
-                for base in game.bases:
-                    if base.owner == game.player_faction_id:
-                        # Reset hurry flag at start of turn
-                        base.hurried_this_turn = False
-                        player_faction = game.factions[game.player_faction_id]
-                        ineff_loss = game._calc_inefficiency_loss(base, game.player_faction_id)
-                        b_drones = bureaucracy_map.get(base, 0)
-                        completed_item = base.process_turn(game.global_energy_allocation, player_faction, game, inefficiency_loss=ineff_loss, bureaucracy_drones=b_drones)
-                        if completed_item:
-                            # Store for spawning at start of next turn (after upkeep)
-                            game.pending_production.append((base, completed_item))
-
-                        # Collect energy outputs
-                        total_economy += base.economy_output
-                        total_labs += base.labs_output
+                for base in game.faction_bases(game.player_faction_id):
+                    # Reset hurry flag at start of turn
+                    base.hurried_this_turn = False
+                    player_faction = game.factions[game.player_faction_id]
+                    ineff_loss = game._calc_inefficiency_loss(base, game.player_faction_id)
+                    b_drones = bureaucracy_map.get(base, 0)
+                    completed_item = base.process_turn(game.global_energy_allocation, player_faction, game, inefficiency_loss=ineff_loss, bureaucracy_drones=b_drones)
+                    if completed_item:
+                        # Store for spawning at start of next turn (after upkeep)
+                        game.pending_production.append((base, completed_item))
+
+                    # Collect energy outputs
+                    total_economy += base.economy_output
+                    total_labs += base.labs_output
 
                 # Add economy output to energy reserves
                 game.energy_credits += total_economy
@@ -332,7 +391,8 @@ class TurnManager:
             ai_player = game.ai_players[game.current_ai_index]
 
             # Center camera on AI unit
-            game.center_camera_on_tile = (unit.x, unit.y)
+            if self.ai_camera_follow:
+                game.center_camera_on_tile = (unit.x, unit.y)
 
             # Move this unit
             ai_player._move_unit(unit, game)
@@ -360,45 +420,43 @@ class TurnManager:
             ai_bureaucracy_map = game._calc_bureaucracy_drones(ai_player.player_id)
             from game.data.facility_data import SECRET_PROJECTS
             _secret_project_names = {p['name'] for p in SECRET_PROJECTS}
-            for base in game.bases:
-                if base.owner == ai_player.player_id:
-                    # Reset hurry flag at start of AI turn
-                    base.hurried_this_turn = False
-                    ai_faction = game.factions[ai_player.player_id]
-                    ineff_loss = game._calc_inefficiency_loss(base, ai_player.player_id)
-                    b_drones = ai_bureaucracy_map.get(base, 0)
-                    completed_item = base.process_turn(ai_energy_allocation, ai_faction, game, inefficiency_loss=ineff_loss, bureaucracy_drones=b_drones)
-                    if completed_item:
-                        # Store for spawning at start of next turn (after upkeep)
-                        game.pending_production.append((base, completed_item))
-                    total_labs += base.labs_output
-
-                    # Notify player when an AI faction starts or is 1 turn from finishing a secret project
-                    prod = base.current_production
-                    if prod in _secret_project_names:
-                        start_key = (ai_player.player_id, prod)
-                        if start_key not in self.known_ai_secret_projects:
-                            self.known_ai_secret_projects.add(start_key)
-                            game.secret_project_notifications.append({
-                                'type': 'started',
-                                'project_name': prod,
-                                'faction_id': ai_player.player_id,
-                            })
-                        warn_key = (ai_player.player_id, prod)
-                        if (base.production_turns_remaining <= 1
-                                and warn_key not in self.known_ai_secret_project_warnings):
-                            self.known_ai_secret_project_warnings.add(warn_key)
-                            player_also = any(
-                                b.current_production == prod
-                                for b in game.bases
-                                if b.owner == game.player_faction_id
-                            )
-                            game.secret_project_notifications.append({
-                                'type': 'warning',
-                                'project_name': prod,
-                                'faction_id': ai_player.player_id,
-                                'player_also_building': player_also,
-                            })
+            for base in game.faction_bases(ai_player.player_id):
+                # Reset hurry flag at start of AI turn
+                base.hurried_this_turn = False
+                ai_faction = game.factions[ai_player.player_id]
+                ineff_loss = game._calc_inefficiency_loss(base, ai_player.player_id)
+                b_drones = ai_bureaucracy_map.get(base, 0)
+                completed_item = base.process_turn(ai_energy_allocation, ai_faction, game, inefficiency_loss=ineff_loss, bureaucracy_drones=b_drones)
+                if completed_item:
+                    # Store for spawning at start of next turn (after upkeep)
+                    game.pending_production.append((base, completed_item))
+                total_labs += base.labs_output
+
+                # Notify player when an AI faction starts or is 1 turn from finishing a secret project
+                prod = base.current_production
+                if prod in _secret_project_names:
+                    start_key = (ai_player.player_id, prod)
+                    if start_key not in self.known_ai_secret_projects:
+                        self.known_ai_secret_projects.add(start_key)
+                        game.secret_project_notifications.append({
+                            'type': 'started',
+                            'project_name': prod,
+                            'faction_id': ai_player.player_id,
+                        })
+                    warn_key = (ai_player.player_id, prod)
+                    if (base.production_turns_remaining <= 1
+                            and warn_key not in self.known_ai_secret_project_warnings):
+                        self.known_ai_secret_project_warnings.add(warn_key)
+                        player_also = any(
+                            b.current_production == prod
+                            for b in game.faction_bases(game.player_faction_id)
+                        )
+                        game.secret_project_notifications.append({
+                            'type': 'warning',
+                            'project_name': prod,
+                            'faction_id': ai_player.player_id,
+                            'player_also_building': player_also,
+                        })
 
             # Process AI tech research with labs output
             ai_tech_tree = game.factions[ai_player.player_id].tech_tree
@@ -498,9 +556,8 @@ class TurnManager:
 
         # Advance terraforming for player formers
         from game.terraforming import process_terraforming
-        for unit in game.units:
-            if unit.owner == game.player_faction_id and unit.terraforming_action:
-                process_terraforming(unit, game)
+        for unit in [u for u in game.faction_units(game.player_faction_id) if u.terraforming_action]:
+            process_terraforming(unit, game)
 
         # Heal player units (upkeep phase — only units that skipped last turn)
         game._process_unit_repair(game.player_faction_id)
@@ -15,6 +15,27 @@ class CombatDialog(Dialog):
         self.battle_prediction_ok_rect = None
         self.battle_prediction_cancel_rect = None
 
+    def _get_modifier_display(self, game, battle):
+        """Get formatted (attacker, defender) modifier lists for a battle.
+
+        Formatted once per battle and kept in the battle dict, since the
+        modifiers cannot change while the prediction or animation is shown.
+
+        Args:
+            game: Game instance
+            battle (dict): pending_battle or active_battle dict
+
+        Returns:
+            tuple: (attacker_modifiers, defender_modifiers) lists of modifier dicts
+        """
+        if 'modifier_display' not in battle:
+            attacker = battle['attacker']
+            defender = battle['defender']
+            battle['modifier_display'] = (
+                game.combat.get_combat_modifiers(attacker, is_defender=False, vs_unit=defender),
+                game.combat.get_combat_modifiers(defender, is_defender=True, vs_unit=attacker))
+        return battle['modifier_display']
+
     def draw_battle_prediction(self, screen, game):
         """Draw battle prediction dialog before combat."""
         if not game.combat.pending_battle:
@@ -52,7 +73,7 @@ class CombatDialog(Dialog):
         screen.blit(att_hp, (att_x, att_y + 55))
 
         # Attacker modifiers
-        att_modifiers = game.combat.get_combat_modifiers(attacker, is_defender=False, vs_unit=defender)
+        att_modifiers, def_modifiers = self._get_modifier_display(game, game.combat.pending_battle)
         mod_y = att_y + 75
         for mod in att_modifiers:
             mod_text = self.small_font.render(f"{mod['name']}: {mod['display']}", True, (150, 255, 150))
@@ -77,7 +98,6 @@ class CombatDialog(Dialog):
         screen.blit(def_hp, (def_x, def_y + 55))
 
         # Defender modifiers
-        def_modifiers = game.combat.get_combat_modifiers(defender, is_defender=True, vs_unit=attacker)
         mod_y = def_y + 75
         for mod in def_modifiers:
             mod_text = self.small_font.render(f"{mod['name']}: {mod['display']}", True, (150, 255, 150))
@@ -85,11 +105,17 @@ class CombatDialog(Dialog):
             mod_y += 18
 
         # Combat odds
-        odds = game.combat.calculate_combat_odds(attacker, defender)
-        odds_text = self.font.render(f"Win Chance: {int(odds * 100)}%", True, (255, 255, 100))
+        outcome = game.combat.predict_combat(attacker, defender, game.combat.pending_battle)
+        odds_text = self.font.render(f"Win Chance: {int(outcome.attacker_wins * 100)}%", True, (255, 255, 100))
         odds_rect = odds_text.get_rect(centerx=box_x + box_w // 2, top=box_y + 240)
         screen.blit(odds_text, odds_rect)
 
+        disengage = outcome.attacker_disengages + outcome.defender_disengages
+        if disengage >= 0.01:
+            dis_text = self.small_font.render(f"Disengage: {int(disengage * 100)}%", True, (200, 200, 150))
+            dis_rect = dis_text.get_rect(centerx=box_x + box_w // 2, top=odds_rect.bottom + 4)
+            screen.blit(dis_text, dis_rect)
+
         # OK and Cancel buttons
         button_y = box_y + box_h - 60
         ok_w, ok_h = 100, 40
@@ -185,7 +211,7 @@ class CombatDialog(Dialog):
             mod_y = panel_y + 90
 
             # Attacker modifiers (left side)
-            att_modifiers = game.combat.get_combat_modifiers(attacker, is_defender=False, vs_unit=defender)
+            att_modifiers, def_modifiers = self._get_modifier_display(game, battle)
             for mod in att_modifiers:
                 mod_text = self.small_font.render(f"{mod['name']}: {mod['display']}", True, (150, 255, 150))
                 screen.blit(mod_text, (panel_x + 10, mod_y))
@@ -193,7 +219,6 @@ class CombatDialog(Dialog):
 
             # Defender modifiers (right side)
             mod_y = panel_y + 90
-            def_modifiers = game.combat.get_combat_modifiers(defender, is_defender=True, vs_unit=attacker)
             for mod in def_modifiers:
                 mod_text = self.small_font.render(f"{mod['name']}: {mod['display']}", True, (150, 255, 150))
                 mod_text_rect = mod_text.get_rect(right=panel_x + panel_w - 10, top=mod_y)
@@ -569,7 +569,7 @@ class BaseScreen:
             return
 
         # Compute tiles claimed by closer bases (friendly or enemy)
-        self._unworkable_coords = base.get_unworkable_coords(game.game_map, game.bases) if hasattr(game, 'bases') else set()
+        self._unworkable_coords = base.get_unworkable_coords(game.game_map, game.bases, game.base_index) if hasattr(game, 'bases') else set()
 
         # Refresh resource output from worked tiles so display is always current
         if hasattr(game, 'game_map'):
@@ -682,8 +682,7 @@ class BaseScreen:
         pygame.draw.rect(screen, (25, 35, 40), map_view_rect)
         pygame.draw.rect(screen, COLOR_UI_BORDER, map_view_rect, 2)
 
-        from game.map import tile_base_nutrients, tile_base_minerals, tile_base_energy
-        from game.terraforming import get_tile_yields
+        from game.map import tile_yields
         from game.data.faction_data import FACTION_DATA
 
         tile_size = 44  # 5 × 44 = 220
@@ -836,16 +835,10 @@ class BaseScreen:
 
                 # Resource number overlays for worked tiles (including base tile)
                 if coord in worked_coords:
-                    imp_yields = get_tile_yields(actual_tile)
-                    if imp_yields['fixed']:
-                        nut, min_, ene = imp_yields['fixed']
-                    else:
-                        mult = imp_yields['nutrients_multiplier']
-                        nut  = int((tile_base_nutrients(actual_tile) + imp_yields['nutrients']) * mult)
-                        if fungus_nut_bonus and getattr(actual_tile, 'fungus', False):
-                            nut += fungus_nut_bonus
-                        min_ = tile_base_minerals(actual_tile) + imp_yields['minerals']
-                        ene  = tile_base_energy(actual_tile)   + imp_yields['energy']
+                    yields = tile_yields(actual_tile)
+                    nut, min_, ene = yields.nutrients, yields.minerals, yields.energy
+                    if not yields.fixed and fungus_nut_bonus and getattr(actual_tile, 'fungus', False):
+                        nut += fungus_nut_bonus
 
                     # Draw small colored numbers at bottom of tile, left to right
                     num_x = tile_rect.x + 2
@@ -1553,8 +1546,11 @@ class BaseScreen:
             })
 
         # Facilities (filtered by tech and not already built)
-        player_tech_tree = game.factions[game.player_faction_id].tech_tree
-        available_facilities = facilities.get_available_facilities(player_tech_tree)
+        if not hasattr(game, 'completed_secret_projects'):
+            game.completed_secret_projects = {}
+        buildable = facilities.get_buildable(game.factions[game.player_faction_id],
+                                             game.completed_secret_projects)
+        available_facilities = buildable.facilities
 
         # Get free facility for this base's faction
         from game.data.faction_data import FACTION_DATA
@@ -1581,10 +1577,7 @@ class BaseScreen:
             production_items.append({"name": facility['name'], "type": "facility", "description": description})
 
         # Secret Projects (filtered by tech and global uniqueness)
-        if not hasattr(game, 'completed_secret_projects'):
-            game.completed_secret_projects = {}
-        available_projects = facilities.get_available_projects(player_tech_tree, game.completed_secret_projects)
-        for project in available_projects:
+        for project in buildable.projects:
             turns = get_turns(project['name'])
             description = f"{project['effect']}, {turns} turns"
             production_items.append({"name": project['name'], "type": "project", "description": description})
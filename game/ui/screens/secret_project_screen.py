@@ -4,6 +4,7 @@ import pygame
 from game.data import display_data as display
 from game.data.display_data import COLOR_TEXT, COLOR_BUTTON, COLOR_BUTTON_HOVER, COLOR_BUTTON_BORDER
 from game.data.facility_data import SECRET_PROJECTS
+from game.facilities import get_facility_by_name, is_secret_project
 from game.data.faction_data import FACTION_DATA
 from game.ui.components import draw_button
 
@@ -32,11 +33,10 @@ class SecretProjectScreen:
         completed_secret_projects = getattr(game, 'completed_secret_projects', {})
         for base in game.bases:
             prod = getattr(base, 'current_production', None)
-            if prod:
-                for proj in SECRET_PROJECTS:
-                    if proj['name'] == prod and proj['id'] not in completed_secret_projects:
-                        if proj['name'] not in in_progress_by_name:
-                            in_progress_by_name[proj['name']] = base.owner
+            proj = get_facility_by_name(prod) if prod else None
+            if proj and is_secret_project(proj['id']) and proj['id'] not in completed_secret_projects:
+                if proj['name'] not in in_progress_by_name:
+                    in_progress_by_name[proj['name']] = base.owner
 
         # Only in-progress and completed; in-progress first
         visible_projects = []
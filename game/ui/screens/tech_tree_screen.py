@@ -5,6 +5,40 @@ from game.data import display_data as display
 from game.data.display_data import (COLOR_TEXT, COLOR_BUTTON, COLOR_BUTTON_HOVER,
                                  COLOR_BUTTON_BORDER, COLOR_BUTTON_HIGHLIGHT)
 from game.data.faction_data import FACTION_DATA
+from game.data.unit_data import CHASSIS, WEAPONS, ARMOR, REACTORS, SPECIAL_ABILITIES
+from game.data.facility_data import FACILITIES, SECRET_PROJECTS
+
+_UNLOCK_CATEGORIES = ('abilities', 'facilities', 'unit_types', 'social')
+
+
+def _build_item_unlocks():
+    """Index every component, ability and facility by its prerequisite tech.
+
+    Returns:
+        dict: {tech_id: {category: [names]}} for techs that unlock something
+    """
+    index = {}
+
+    def add(tech_id, category, name):
+        if tech_id is not None:
+            index.setdefault(tech_id, {}).setdefault(category, []).append(name)
+
+    for item in CHASSIS + WEAPONS + ARMOR + REACTORS:
+        add(item.get('prereq'), 'unit_types', item['name'])
+    for ability in SPECIAL_ABILITIES:
+        if ability['id'] != 'none':
+            add(ability.get('prereq'), 'abilities', ability['name'])
+    # Includes both regular facilities and secret projects
+    for facility in FACILITIES + SECRET_PROJECTS:
+        add(facility.get('prereq'), 'facilities', facility['name'])
+
+    # TODO: Add social engineering unlocks when implemented
+    # For now, social remains empty
+    return index
+
+
+# Tech ID -> {category: [item names]}
+_ITEM_UNLOCKS = _build_item_unlocks()
 
 
 class TechTreeScreen:
@@ -388,10 +422,8 @@ class TechTreeScreen:
                 ])
 
         # UNLOCKS (arrows to right - techs that require this one)
-        unlocks = []
-        for tech_id, tech_data in tech_tree.technologies.items():
-            if focused_id in tech_data.get('prereqs', []):
-                unlocks.append((tech_id, tech_data))
+        unlocks = [(tech_id, tech_tree.technologies[tech_id])
+                   for tech_id in tech_tree.get_unlocked_techs(focused_id)]
 
         unlock_x = center_x + tech_box_w // 2 + 200
         # Center based on number of unlocks we'll actually display (max 4)
@@ -717,54 +749,8 @@ class TechTreeScreen:
         Returns:
             dict: Categories of unlocks {'abilities': [...], 'facilities': [...], 'unit_types': [...], 'social': [...]}
         """
-        from game.data.unit_data import CHASSIS, WEAPONS, ARMOR, REACTORS, SPECIAL_ABILITIES
-        from game.data.facility_data import FACILITIES, SECRET_PROJECTS
-
-        unlocks = {
-            'abilities': [],
-            'facilities': [],
-            'unit_types': [],
-            'social': []
-        }
-
-        # Check chassis
-        for chassis in CHASSIS:
-            if chassis.get('prereq') == tech_id:
-                unlocks['unit_types'].append(chassis['name'])
-
-        # Check weapons
-        for weapon in WEAPONS:
-            if weapon.get('prereq') == tech_id:
-                unlocks['unit_types'].append(weapon['name'])
-
-        # Check armor
-        for armor in ARMOR:
-            if armor.get('prereq') == tech_id:
-                unlocks['unit_types'].append(armor['name'])
-
-        # Check reactors
-        for reactor in REACTORS:
-            if reactor.get('prereq') == tech_id:
-                unlocks['unit_types'].append(reactor['name'])
-
-        # Check abilities
-        for ability in SPECIAL_ABILITIES:
-            if ability.get('prereq') == tech_id and ability['id'] != 'none':
-                unlocks['abilities'].append(ability['name'])
-
-        # Check facilities (includes both regular facilities and secret projects)
-        for facility in FACILITIES:
-            if facility.get('prereq') == tech_id:
-                unlocks['facilities'].append(facility['name'])
-
-        for project in SECRET_PROJECTS:
-            if project.get('prereq') == tech_id:
-                unlocks['facilities'].append(project['name'])
-
-        # TODO: Add social engineering unlocks when implemented
-        # For now, social remains empty
-
-        return unlocks
+        unlocks = _ITEM_UNLOCKS.get(tech_id, {})
+        return {category: list(unlocks.get(category, ())) for category in _UNLOCK_CATEGORIES}
 
     def _wrap_text(self, text, max_width, font):
         """Wrap text to fit within max_width.
@@ -141,12 +141,16 @@ class UIManager:
         ]
 
         # "Game" drop-right submenu (opens when "Game" is clicked)
-        submenu_w, submenu_h = 200, 50
+        submenu_w, submenu_h = 200, 185
         submenu_x = self.main_menu_rect.right  # flush against the right edge
-        submenu_y = self.main_menu_rect.y + 5  # aligned with the Game button
+        # Aligned with the Game button, but never hanging below the main menu
+        submenu_y = min(self.main_menu_rect.y + 5, self.main_menu_rect.bottom - submenu_h)
         self.game_submenu_rect = pygame.Rect(submenu_x, submenu_y, submenu_w, submenu_h)
         self.game_submenu_buttons = [
             Button(self.game_submenu_rect.x + 5, self.game_submenu_rect.y + 5, submenu_w - 10, 40, "Resign"),
+            Button(self.game_submenu_rect.x + 5, self.game_submenu_rect.y + 50, submenu_w - 10, 40, "Battles: Animated"),
+            Button(self.game_submenu_rect.x + 5, self.game_submenu_rect.y + 95, submenu_w - 10, 40, "AI Turns: Normal"),
+            Button(self.game_submenu_rect.x + 5, self.game_submenu_rect.y + 140, submenu_w - 10, 40, "AI Camera: Follow"),
         ]
 
         # Minimap & Commlink Positioning - right side of UI panel
@@ -420,16 +424,17 @@ class UIManager:
                 # Battle prediction takes highest priority
                 if game.combat.pending_battle:
                     # Enter key acts as OK button
-                    attacker = game.combat.pending_battle['attacker']
-                    defender = game.combat.pending_battle['defender']
-                    target_x = game.combat.pending_battle['target_x']
-                    target_y = game.combat.pending_battle['target_y']
+                    battle = game.combat.pending_battle
+                    attacker = battle['attacker']
+                    defender = battle['defender']
+                    target_x = battle['target_x']
+                    target_y = battle['target_y']
 
                     # Clear pending battle
                     game.combat.pending_battle = None
 
                     # Resolve combat
-                    game.combat.resolve_combat(attacker, defender, target_x, target_y)
+                    game.combat.resolve_combat(attacker, defender, target_x, target_y, battle)
                     return True
 
                 # Supply pod message takes priority
@@ -651,7 +656,7 @@ class UIManager:
                         if available:
                             tech_id, tech_data = random.choice(available)
                             tech_name = tech_data['name']
-                            tech_tree.discovered_techs.add(tech_id)
+                            tech_tree.discover(tech_id)
                             if tech_tree.current_research == tech_id:
                                 tech_tree.current_research = None
                                 tech_tree.research_accumulated = 0
@@ -742,10 +747,11 @@ class UIManager:
                 result = self.combat_dialog.handle_battle_prediction_click(event.pos)
                 if result == 'ok':
                     # OK clicked - initiate combat
-                    attacker = game.combat.pending_battle['attacker']
-                    defender = game.combat.pending_battle['defender']
-                    target_x = game.combat.pending_battle['target_x']
-                    target_y = game.combat.pending_battle['target_y']
+                    battle = game.combat.pending_battle
+                    attacker = battle['attacker']
+                    defender = battle['defender']
+                    target_x = battle['target_x']
+                    target_y = battle['target_y']
 
                     # Consume attacker's movement
                     if attacker.type in ['sea', 'air']:
@@ -755,7 +761,7 @@ class UIManager:
                         # Land units: attack costs 1 move
                         attacker.moves_remaining -= 1
 
-                    game.combat.resolve_combat(attacker, defender, target_x, target_y)
+                    game.combat.resolve_combat(attacker, defender, target_x, target_y, battle)
                     game.combat.pending_battle = None
                     return True
                 elif result == 'cancel':
@@ -891,6 +897,15 @@ class UIManager:
                                 game.game_over = True
                                 game.victory_type = None
                                 game.resigned = True
+                            elif btn.text.startswith("Battles:"):
+                                # Toggle animation of the player's battles
+                                game.combat.animate_battles = not game.combat.animate_battles
+                            elif btn.text.startswith("AI Turns:"):
+                                # Toggle time-sliced AI turns
+                                game.turns.fast_ai = not game.turns.fast_ai
+                            elif btn.text.startswith("AI Camera:"):
+                                # Toggle following AI units with the camera
+                                game.turns.ai_camera_follow = not game.turns.ai_camera_follow
                             return True
                     return True  # Consume click inside submenu
                 elif self.main_menu_rect.collidepoint(event.pos):
@@ -1324,6 +1339,11 @@ class UIManager:
             if self.game_submenu_open:
                 pygame.draw.rect(screen, (20, 25, 30), self.game_submenu_rect)
                 pygame.draw.rect(screen, COLOR_BUTTON_BORDER, self.game_submenu_rect, 3)
+                self.game_submenu_buttons[1].text = ("Battles: Animated" if game.combat.animate_battles
+                                                     else "Battles: Instant")
+                self.game_submenu_buttons[2].text = "AI Turns: Fast" if game.turns.fast_ai else "AI Turns: Normal"
+                self.game_submenu_buttons[3].text = ("AI Camera: Follow" if game.turns.ai_camera_follow
+                                                     else "AI Camera: Off")
                 for btn in self.game_submenu_buttons:
                     btn.draw(screen, self.font)
 
@@ -1765,14 +1785,13 @@ class UIManager:
         tile = game.game_map.get_tile(base.x, base.y)
         if tile:
             tile.base = None
-        if base in game.bases:
-            game.bases.remove(base)
+        game.remove_base(base)
 
         # Close base view if it was open
         if self.base_screen.viewing_base is base:
             self.base_screen.viewing_base = None
 
-        game.territory.update_territory(game.bases)
+        game.territory.update_territory_for_base(base, game.bases)
         game.check_faction_elimination()
         game.check_victory()
 
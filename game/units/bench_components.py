@@ -0,0 +1,168 @@
+"""Microbenchmark for Unit component property access.
+
+Times the reads that hot loops make on every unit (chassis_data,
+weapon_data, armor_data, reactor_data and type) three ways:
+
+- cached: the Unit properties, which return records resolved on assignment
+- registry: a get_*_by_id dict lookup on every read
+- legacy: what the properties did before component records were cached,
+  a function-level import and a linear search of the component list on
+  every read (type went through chassis_data, so it paid this twice)
+
+Command line:
+    python -m game.units.bench_components
+    python -m game.units.bench_components --units 5000 --repeat 10 --seed 1
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from game.data.unit_data import CHASSIS, WEAPONS, ARMOR, REACTORS
+from game.units.unit_components import (get_chassis_by_id, get_weapon_by_id,
+                                        get_armor_by_id, get_reactor_by_id)
+
+
+def _scan(records, record_id, default):
+    """Find a component record by linear search (the old get_*_by_id)."""
+    for record in records:
+        if record['id'] == record_id:
+            return record
+    return default
+
+
+# Old Unit property bodies: a function-level import on every call, then a scan
+
+
+def _legacy_chassis_data(unit):
+    from game.data.unit_data import CHASSIS
+    return _scan(CHASSIS, unit.chassis, CHASSIS[0])
+
+
+def _legacy_weapon_data(unit):
+    from game.data.unit_data import WEAPONS
+    return _scan(WEAPONS, unit.weapon, WEAPONS[5])
+
+
+def _legacy_armor_data(unit):
+    from game.data.unit_data import ARMOR
+    return _scan(ARMOR, unit.armor, ARMOR[0])
+
+
+def _legacy_reactor_data(unit):
+    from game.data.unit_data import REACTORS
+    return _scan(REACTORS, unit.reactor, REACTORS[0])
+
+
+def read_cached(units):
+    """Read every unit's component records through the Unit properties."""
+    total = 0
+    for unit in units:
+        total += (unit.chassis_data['speed'] + unit.weapon_data['attack']
+                  + unit.armor_data['defense'] + unit.reactor_data['power'])
+        if unit.type == 'land':
+            total += 1
+    return total
+
+
+def read_registry(units):
+    """Read every unit's component records with one dict lookup per read."""
+    total = 0
+    for unit in units:
+        total += (get_chassis_by_id(unit.chassis)['speed'] + get_weapon_by_id(unit.weapon)['attack']
+                  + get_armor_by_id(unit.armor)['defense'] + get_reactor_by_id(unit.reactor)['power'])
+        if get_chassis_by_id(unit.chassis)['type'] == 'land':
+            total += 1
+    return total
+
+
+def read_legacy(units):
+    """Read every unit's component records the way the old properties did."""
+    total = 0
+    for unit in units:
+        total += (_legacy_chassis_data(unit)['speed'] + _legacy_weapon_data(unit)['attack']
+                  + _legacy_armor_data(unit)['defense'] + _legacy_reactor_data(unit)['power'])
+        if _legacy_chassis_data(unit)['type'] == 'land':
+            total += 1
+    return total
+
+
+def make_units(count, rng):
+    """Create units with random component combinations.
+
+    Args:
+        count (int): Number of units
+        rng (random.Random): Random generator
+
+    Returns:
+        list: Unit objects
+    """
+    from game.units.unit import Unit
+
+    units = []
+    for i in range(count):
+        chassis = rng.choice(CHASSIS)['id']
+        weapon = rng.choice(WEAPONS)['id']
+        armor = rng.choice(ARMOR)['id']
+        reactor = rng.choice(REACTORS)['id']
+        units.append(Unit(0, 0, chassis, i % 7, f'Unit {i}', weapon, armor, reactor))
+    return units
+
+
+def time_reads(read, units, repeat):
+    """Return the best time per unit, in microseconds, over several passes.
+
+    Args:
+        read (callable): One of the read_* functions
+        units (list): Units to read
+        repeat (int): Number of timed passes
+
+    Returns:
+        float: Fastest pass time divided by the number of units
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        read(units)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6 / len(units)
+
+
+def _parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog='python -m game.units.bench_components',
+        description='Time Unit component property reads in a tight loop.')
+    parser.add_argument('--units', type=int, default=1000, help='Number of units to read')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed passes per method (best is kept)')
+    parser.add_argument('--seed', type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Print per-unit read times for each lookup method.
+
+    Returns:
+        int: Process exit status (1 if the methods disagree)
+    """
+    args = _parse_args(argv)
+    units = make_units(args.units, random.Random(args.seed))
+
+    methods = [('cached', read_cached), ('registry', read_registry), ('legacy', read_legacy)]
+    results = {read(units) for _, read in methods}
+    if len(results) != 1:
+        print("MISMATCH: lookup methods returned different records")
+        return 1
+
+    print(f"{args.units} units, 4 records + type per unit, best of {args.repeat} passes")
+    times = {name: time_reads(read, units, args.repeat) for name, read in methods}
+    for name, _ in methods:
+        line = f"  {name:<9}{times[name]:8.2f} us/unit"
+        if name != 'legacy':
+            line += f"  ({times['legacy'] / times[name]:.1f}x faster than legacy)"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
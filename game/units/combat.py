@@ -8,11 +8,44 @@ This module handles all combat-related calculations and resolution including:
 - Battle cleanup and unit destruction
 
 The Combat class maintains battle state (pending_battle, active_battle) and
-coordinates with the Game class to modify units and game state.
+coordinates with the Game class to modify units and game state. Only battles
+the player takes part in are animated (and only while animate_battles is on);
+all others are applied as soon as they are resolved.
 """
 
 import random
 
+from game.data.faction_data import FACTION_DATA
+from game.units.combat_odds import solve_combat
+
+# Display (name, value) for each modifier kind; {} fields are filled in by
+# Combat.get_combat_modifiers (morale and PLANET values are built there)
+MODIFIER_LABELS = {
+    'morale': ('Morale ({})', None),
+    'rocky': ('Rocky Terrain', '+50%'),
+    'fungus': ('Xenofungus', '+50%'),
+    'base': ('Base Defense', '+25%'),
+    'perimeter': ('Perimeter Defense', '+100%'),
+    'trance': ('Trance vs Psi', '+50%'),
+    'aaa': ('AAA vs Air', '+100%'),
+    'aaa_tracking': ('AAA Tracking', '+100%'),
+    'artillery_vs_ship': ('Artillery vs Ship', '+50%'),
+    'infantry_vs_base': ('Infantry vs Base', '+25%'),
+    'mobile_vs_infantry': ('Mobile vs Infantry', '+25%'),
+    'high_ground': ('Artillery High Ground (+{})', '+{}%'),
+    'airdrop': ('Airdrop Penalty', '-50%'),
+    'faction': ('Faction Bonus', '+{}%'),
+    'comm_jammer': ('Comm Jammer', '+50%'),
+    'blink_displacer': ('Blink Displacer', '+25%'),
+    'empath': ('Empath vs Psi', '+50%'),
+    'empath_song': ('Empath Song', '+50%'),
+    'low_moves': ('Low Moves', '-66%'),
+    'partial_move': ('Partial Move', '-33%'),
+    'planet': ('PLANET ({})', None),
+    'proj_vs_energy': ('Mode: Proj vs Energy', '+25%'),
+    'energy_vs_proj': ('Mode: Energy vs Proj', '+25%'),
+}
+
 
 class Combat:
     """Manages combat resolution and battle state."""
@@ -26,9 +59,15 @@ class Combat:
         self.game = game
         self.pending_battle = None  # Dict with attacker, defender, target_x, target_y
         self.active_battle = None  # Dict tracking ongoing battle animation
+        self.animate_battles = True  # Player setting: animate battles the player is in
+        self.on_screen = None  # Callable (x, y) -> bool for the current viewport, set by main.py
 
-    def get_combat_modifiers(self, unit, is_defender=False, vs_unit=None):
-        """Get all combat modifiers for a unit.
+    def _modifier_terms(self, unit, is_defender=False, vs_unit=None):
+        """Collect the combat modifiers that apply to a unit, without formatting.
+
+        Each term is a (kind, multiplier, detail) tuple; kind is a key of
+        MODIFIER_LABELS and detail carries the value a parameterized label
+        needs (altitude levels, bonus percent, PLANET rating).
 
         Args:
             unit (Unit): Unit to get modifiers for
@@ -36,22 +75,15 @@ class Combat:
             vs_unit (Unit): Opponent unit (for mode bonuses)
 
         Returns:
-            list: List of modifier dicts with 'name' and 'multiplier' keys
+            list: List of (kind, multiplier, detail) tuples
         """
-        modifiers = []
+        terms = []
 
         # Morale modifier: +12.5% per level above Green (level 2)
         # Green (level 2) is baseline 1.0
         multiplier = 1.0 + (unit.morale_level - 2) * 0.125
         if multiplier != 1.0:
-            morale_name = unit.get_morale_name()
-            percent = int((multiplier - 1.0) * 100)
-            sign = '+' if percent > 0 else ''
-            modifiers.append({
-                'name': f'Morale ({morale_name})',
-                'multiplier': multiplier,
-                'display': f'{sign}{percent}%'
-            })
+            terms.append(('morale', multiplier, None))
 
         # Defender bonuses
         if is_defender:
@@ -60,63 +92,35 @@ class Combat:
             # Rocky terrain defense bonus (+50%) — only outside a base
             # (base defense already accounts for fortifications)
             if tile and not tile.base and tile.is_land() and getattr(tile, 'rockiness', 0) == 2:
-                modifiers.append({
-                    'name': 'Rocky Terrain',
-                    'multiplier': 1.50,
-                    'display': '+50%'
-                })
+                terms.append(('rocky', 1.50, None))
 
             # Xenofungus defense bonus (+50%) — land fungus only, outside a base,
             # vs human/Progenitor factions (native life not yet implemented so always applies)
             if (tile and not tile.base and tile.is_land()
                     and getattr(tile, 'fungus', False)
                     and vs_unit is not None):
-                modifiers.append({
-                    'name': 'Xenofungus',
-                    'multiplier': 1.50,
-                    'display': '+50%'
-                })
+                terms.append(('fungus', 1.50, None))
 
             # Base defense bonus
             if tile and tile.base:
-                modifiers.append({
-                    'name': 'Base Defense',
-                    'multiplier': 1.25,
-                    'display': '+25%'
-                })
+                terms.append(('base', 1.25, None))
 
                 # Perimeter Defense: +100% defense
                 if 'perimeter_defense' in tile.base.facilities:
-                    modifiers.append({
-                        'name': 'Perimeter Defense',
-                        'multiplier': 2.00,
-                        'display': '+100%'
-                    })
+                    terms.append(('perimeter', 2.00, None))
 
             # Trance defending vs Psi (+50%)
             if vs_unit and hasattr(unit, 'abilities'):
                 if 'trance' in unit.abilities and vs_unit.weapon_data.get('mode', 'projectile') == 'psi':
-                    modifiers.append({
-                        'name': 'Trance vs Psi',
-                        'multiplier': 1.50,
-                        'display': '+50%'
-                    })
+                    terms.append(('trance', 1.50, None))
 
                 # AAA vs air units (+100%)
                 if 'AAA' in unit.abilities and vs_unit.type == 'air':
-                    modifiers.append({
-                        'name': 'AAA vs Air',
-                        'multiplier': 2.00,
-                        'display': '+100%'
-                    })
+                    terms.append(('aaa', 2.00, None))
 
             # AAA Tracking ability (+100% vs air)
             if vs_unit and unit.has_aaa_tracking and vs_unit.type == 'air':
-                modifiers.append({
-                    'name': 'AAA Tracking',
-                    'multiplier': 2.00,
-                    'display': '+100%'
-                })
+                terms.append(('aaa_tracking', 2.00, None))
 
             # TODO: Blink Displacer ignores base defenses — cancel base defense bonus
             #       when attacker has blink displacer. Attacker-side is already implemented.
@@ -125,11 +129,7 @@ class Combat:
 
             # Artillery defending vs ship: +50%
             if unit.has_artillery and vs_unit and vs_unit.type == 'sea':
-                modifiers.append({
-                    'name': 'Artillery vs Ship',
-                    'multiplier': 1.50,
-                    'display': '+50%'
-                })
+                terms.append(('artillery_vs_ship', 1.50, None))
 
         # Attacker bonuses
         else:
@@ -138,95 +138,53 @@ class Combat:
 
             # Infantry attacking base bonus
             if unit.chassis == 'infantry' and defender_tile and defender_tile.base:
-                modifiers.append({
-                    'name': 'Infantry vs Base',
-                    'multiplier': 1.25,
-                    'display': '+25%'
-                })
+                terms.append(('infantry_vs_base', 1.25, None))
 
             # Mobile unit vs infantry in open
             if (unit.chassis in ['speeder', 'hovertank'] and
                 vs_unit and vs_unit.chassis == 'infantry' and
                 defender_tile and not defender_tile.base):
-                modifiers.append({
-                    'name': 'Mobile vs Infantry',
-                    'multiplier': 1.25,
-                    'display': '+25%'
-                })
+                terms.append(('mobile_vs_infantry', 1.25, None))
 
             # Artillery altitude bonuses
             if unit.has_artillery and vs_unit and tile and defender_tile:
                 # Artillery vs ship: +50%
                 if vs_unit.type == 'sea':
-                    modifiers.append({
-                        'name': 'Artillery vs Ship',
-                        'multiplier': 1.50,
-                        'display': '+50%'
-                    })
+                    terms.append(('artillery_vs_ship', 1.50, None))
                 # Artillery attacking land target from higher ground: +25% per 1000m
                 elif vs_unit.type == 'land':
                     altitude_diff = tile.altitude - defender_tile.altitude
                     levels_above = altitude_diff // 1000
                     if levels_above > 0:
-                        bonus_multiplier = 1.0 + (0.25 * levels_above)
-                        modifiers.append({
-                            'name': f'Artillery High Ground (+{levels_above})',
-                            'multiplier': bonus_multiplier,
-                            'display': f'+{int(levels_above * 25)}%'
-                        })
+                        terms.append(('high_ground', 1.0 + (0.25 * levels_above), levels_above))
 
             # Airdrop penalty - check if unit has used airdrop this turn
             if hasattr(unit, 'used_airdrop') and unit.used_airdrop:
-                modifiers.append({
-                    'name': 'Airdrop Penalty',
-                    'multiplier': 0.50,
-                    'display': '-50%'
-                })
+                terms.append(('airdrop', 0.50, None))
 
             # Faction attack bonus (e.g. Miriam: +25% when attacking)
-            from game.data.faction_data import FACTION_DATA
             faction_bonuses = FACTION_DATA[unit.owner].get('bonuses', {}) if unit.owner < len(FACTION_DATA) else {}
             attack_bonus_pct = faction_bonuses.get('attack_bonus', 0)
             if attack_bonus_pct:
-                modifiers.append({
-                    'name': 'Faction Bonus',
-                    'multiplier': 1.0 + attack_bonus_pct / 100.0,
-                    'display': f'+{attack_bonus_pct}%'
-                })
+                terms.append(('faction', 1.0 + attack_bonus_pct / 100.0, attack_bonus_pct))
 
             # Comm Jammer reduces enemy defense (-50% to defender's effective armor)
             if getattr(unit, 'has_comm_jammer', False):
-                modifiers.append({
-                    'name': 'Comm Jammer',
-                    'multiplier': 1.50,  # +50% attack (equivalent to -50% enemy defense)
-                    'display': '+50%'
-                })
+                terms.append(('comm_jammer', 1.50, None))  # +50% attack (equivalent to -50% enemy defense)
 
             # Blink Displacer ignores base defenses
             if getattr(unit, 'has_blink_displacer', False) and defender_tile and defender_tile.base:
-                modifiers.append({
-                    'name': 'Blink Displacer',
-                    'multiplier': 1.25,  # Negates base defense
-                    'display': '+25%'
-                })
+                terms.append(('blink_displacer', 1.25, None))  # Negates base defense
 
             # Empath Song attacking Psi (+50% vs psi)
             if vs_unit and hasattr(unit, 'abilities'):
                 if 'empath' in unit.abilities and vs_unit.armor_data.get('mode', 'projectile') == 'psi':
-                    modifiers.append({
-                        'name': 'Empath vs Psi',
-                        'multiplier': 1.50,
-                        'display': '+50%'
-                    })
+                    terms.append(('empath', 1.50, None))
 
             # Empath Song (new ability system)
             if vs_unit and getattr(unit, 'has_empath_song', False):
                 if vs_unit.armor_data.get('mode', 'projectile') == 'psi':
-                    modifiers.append({
-                        'name': 'Empath Song',
-                        'multiplier': 1.50,
-                        'display': '+50%'
-                    })
+                    terms.append(('empath_song', 1.50, None))
 
             # Fractional-move attack penalty (attacker only)
             # A unit that has used road/river moves may attack but at reduced strength.
@@ -236,65 +194,119 @@ class Combat:
                 remaining = unit.moves_remaining
                 if 0.0 < remaining < max_mv - 1e-6:  # Has used at least one full-cost move
                     if remaining < (2.0 / 3.0) - 1e-6:
-                        modifiers.append({'name': 'Low Moves', 'multiplier': 0.34, 'display': '-66%'})
+                        terms.append(('low_moves', 0.34, None))
                     else:
-                        modifiers.append({'name': 'Partial Move', 'multiplier': 0.67, 'display': '-33%'})
+                        terms.append(('partial_move', 0.67, None))
 
             # PLANET rating bonus in psi combat (+/-10% per point, attacker only)
             if vs_unit and self._is_psi_combat(unit, vs_unit):
                 planet_rating = self.game.get_planet_rating(unit.owner)
                 if planet_rating != 0:
-                    planet_mult = max(0.0, 1.0 + planet_rating * 0.10)
-                    sign = '+' if planet_rating > 0 else ''
-                    modifiers.append({
-                        'name': f'PLANET ({sign}{planet_rating})',
-                        'multiplier': planet_mult,
-                        'display': f'{sign}{planet_rating * 10}%'
-                    })
+                    terms.append(('planet', max(0.0, 1.0 + planet_rating * 0.10), planet_rating))
 
         # Combat mode bonuses (both attacker and defender)
         if vs_unit:
             # Projectile weapon vs Energy armor = +25%
             if unit.weapon_data.get('mode', 'projectile') == 'projectile' and vs_unit.armor_data.get('mode', 'projectile') == 'energy':
-                modifiers.append({
-                    'name': 'Mode: Proj vs Energy',
-                    'multiplier': 1.25,
-                    'display': '+25%'
-                })
+                terms.append(('proj_vs_energy', 1.25, None))
             # Energy weapon vs Projectile armor = +25%
             elif unit.weapon_data.get('mode', 'projectile') == 'energy' and vs_unit.armor_data.get('mode', 'projectile') == 'projectile':
-                modifiers.append({
-                    'name': 'Mode: Energy vs Proj',
-                    'multiplier': 1.25,
-                    'display': '+25%'
-                })
+                terms.append(('energy_vs_proj', 1.25, None))
             # Binary armor = no bonus for anyone
             # Missile weapons = never get mode bonus
 
+        return terms
+
+    def get_modifier_total(self, unit, is_defender=False, vs_unit=None):
+        """Get the product of all combat modifiers for a unit.
+
+        Numeric fast path for odds and resolution; use get_combat_modifiers
+        when the individual modifiers need to be shown.
+
+        Args:
+            unit (Unit): Unit to get modifiers for
+            is_defender (bool): Whether unit is defending
+            vs_unit (Unit): Opponent unit (for mode bonuses)
+
+        Returns:
+            float: Combined modifier multiplier (1.0 = no modifiers)
+        """
+        total = 1.0
+        for _, multiplier, _ in self._modifier_terms(unit, is_defender, vs_unit):
+            total *= multiplier
+        return total
+
+    def get_battle_modifiers(self, attacker, defender, battle=None):
+        """Get (attacker, defender) modifier totals for a battle.
+
+        With a battle dict (pending_battle), the totals are computed once and
+        kept in it, so the prediction dialog and the resolution of that same
+        battle share one computation and use the same numbers.
+
+        Args:
+            attacker (Unit): Attacking unit
+            defender (Unit): Defending unit
+            battle (dict): Battle the totals belong to (optional)
+
+        Returns:
+            tuple: (attacker_modifier_total, defender_modifier_total)
+        """
+        if battle is not None and 'modifier_totals' in battle:
+            return battle['modifier_totals']
+
+        totals = (self.get_modifier_total(attacker, is_defender=False, vs_unit=defender),
+                  self.get_modifier_total(defender, is_defender=True, vs_unit=attacker))
+        if battle is not None:
+            battle['modifier_totals'] = totals
+        return totals
+
+    def get_combat_modifiers(self, unit, is_defender=False, vs_unit=None):
+        """Get all combat modifiers for a unit, formatted for display.
+
+        Args:
+            unit (Unit): Unit to get modifiers for
+            is_defender (bool): Whether unit is defending
+            vs_unit (Unit): Opponent unit (for mode bonuses)
+
+        Returns:
+            list: List of modifier dicts with 'name', 'multiplier' and 'display' keys
+        """
+        modifiers = []
+        for kind, multiplier, detail in self._modifier_terms(unit, is_defender, vs_unit):
+            name, display = MODIFIER_LABELS[kind]
+            if kind == 'morale':
+                percent = int((multiplier - 1.0) * 100)
+                sign = '+' if percent > 0 else ''
+                name = name.format(unit.get_morale_name())
+                display = f'{sign}{percent}%'
+            elif kind == 'high_ground':
+                name = name.format(detail)
+                display = display.format(int(detail * 25))
+            elif kind == 'faction':
+                display = display.format(detail)
+            elif kind == 'planet':
+                sign = '+' if detail > 0 else ''
+                name = name.format(f'{sign}{detail}')
+                display = f'{sign}{detail * 10}%'
+            modifiers.append({'name': name, 'multiplier': multiplier, 'display': display})
         return modifiers
 
-    def can_disengage(self, unit, opponent, current_hp, max_hp):
-        """Check if a unit can disengage from combat.
+    def disengage_chance(self, unit, opponent):
+        """Chance that a unit disengages once it is at half HP or less.
 
         Args:
             unit (Unit): Unit attempting to disengage
             opponent (Unit): Opposing unit
-            current_hp (int): Unit's current HP
-            max_hp (int): Unit's maximum HP
 
         Returns:
-            bool: True if unit successfully disengages
+            float: Disengage probability, or 0.0 if the unit is not fast enough
         """
-        # Check if unit is damaged to 50% or less
-        if current_hp > max_hp * 0.5:
-            return False
-
         # Check if unit has speed advantage (at least 2 more movement points)
         unit_moves = unit.max_moves()
         opponent_moves = opponent.max_moves()
 
         if unit_moves < opponent_moves + 2:
-            return False
+            return 0.0
 
         # Calculate disengage chance based on morale and speed advantage
         # Base 50% chance, +10% per morale level, +5% per extra move point
@@ -302,7 +314,27 @@ class Combat:
         morale_bonus = 0.1 * unit.morale_level
         speed_bonus = 0.05 * (unit_moves - opponent_moves - 2)
 
-        disengage_chance = min(0.9, base_chance + morale_bonus + speed_bonus)
+        return min(0.9, base_chance + morale_bonus + speed_bonus)
+
+    def can_disengage(self, unit, opponent, current_hp, max_hp):
+        """Check if a unit can disengage from combat.
+
+        Args:
+            unit (Unit): Unit attempting to disengage
+            opponent (Unit): Opposing unit
+            current_hp (int): Unit's current HP
+            max_hp (int): Unit's maximum HP
+
+        Returns:
+            bool: True if unit successfully disengages
+        """
+        # Check if unit is damaged to 50% or less
+        if current_hp > max_hp * 0.5:
+            return False
+
+        disengage_chance = self.disengage_chance(unit, opponent)
+        if disengage_chance <= 0.0:
+            return False
 
         return random.random() < disengage_chance
 
@@ -337,47 +369,75 @@ class Combat:
         defender_base = float(defender.current_health)
         return attacker_base, defender_base
 
-    def calculate_combat_odds(self, attacker, defender):
-        """Calculate combat odds for battle prediction screen.
+    def _strength_per_hp(self, attacker, defender):
+        """Return (attacker, defender) combat strength per HP before modifiers.
+
+        Normal combat uses weapon attack and armor defense values; psi combat
+        uses the psi base strengths.
+        """
+        if self._is_psi_combat(attacker, defender):
+            attacker_base, defender_base = self._get_psi_base_strengths(attacker, defender)
+            attack = attacker_base / attacker.current_health if attacker.current_health else 1.0
+            defense = defender_base / defender.current_health if defender.current_health else 1.0
+            return attack, defense
+        return attacker.weapon_data['attack'], defender.armor_data['defense']
+
+    def battle_parameters(self, attacker, defender, battle=None):
+        """Round-model parameters of an attack, from the units' current state.
 
         Args:
             attacker (Unit): Attacking unit
             defender (Unit): Defending unit
+            battle (dict): Battle whose modifier totals to reuse (see get_battle_modifiers)
 
         Returns:
-            float: Probability of attacker winning (0.0 to 1.0)
+            tuple: (attack, defense, attacker_hp, defender_hp, attacker_disengage,
+                defender_disengage), the arguments of combat_odds.solve_combat
         """
-        if self._is_psi_combat(attacker, defender):
-            attacker_base, defender_base = self._get_psi_base_strengths(attacker, defender)
-        else:
-            # Normal combat: base strength = weapon/armor value * health
-            attacker_base = attacker.weapon_data['attack'] * attacker.current_health
-            defender_base = defender.armor_data['defense'] * defender.current_health
+        attack, defense = self._strength_per_hp(attacker, defender)
 
         # Apply modifiers (morale, terrain, facilities, abilities)
-        attacker_modifiers = self.get_combat_modifiers(attacker, is_defender=False, vs_unit=defender)
-        defender_modifiers = self.get_combat_modifiers(defender, is_defender=True, vs_unit=attacker)
+        attacker_modifier_total, defender_modifier_total = self.get_battle_modifiers(attacker, defender, battle)
+        attack *= attacker_modifier_total
+        defense *= defender_modifier_total
+
+        return (attack, defense, attacker.current_health, defender.current_health,
+                self.disengage_chance(attacker, defender),
+                self.disengage_chance(defender, attacker))
 
-        attacker_strength = attacker_base
-        for mod in attacker_modifiers:
-            attacker_strength *= mod['multiplier']
+    def predict_combat(self, attacker, defender, battle=None):
+        """Exact outcome probabilities of an attack, from the units' current state.
 
-        defender_strength = defender_base
-        for mod in defender_modifiers:
-            defender_strength *= mod['multiplier']
+        Args:
+            attacker (Unit): Attacking unit
+            defender (Unit): Defending unit
+            battle (dict): Battle whose modifier totals to reuse (see get_battle_modifiers)
+
+        Returns:
+            CombatOutcome: Win/lose/disengage probabilities and final HP distributions
+        """
+        return solve_combat(*self.battle_parameters(attacker, defender, battle))
 
-        total_strength = attacker_strength + defender_strength
-        if total_strength == 0:
-            return 0.5  # 50/50 if both have 0 strength
+    def calculate_combat_odds(self, attacker, defender):
+        """Calculate combat odds for battle prediction screen.
 
-        return attacker_strength / total_strength
+        Args:
+            attacker (Unit): Attacking unit
+            defender (Unit): Defending unit
+
+        Returns:
+            float: Probability of attacker winning (0.0 to 1.0)
+        """
+        return self.predict_combat(attacker, defender).attacker_wins
 
-    def resolve_combat(self, attacker, defender, target_x, target_y):
+    def resolve_combat(self, attacker, defender, target_x, target_y, battle=None):
         """Resolve combat between two units.
 
         Sets up active_battle dict with pre-simulated combat rounds for
         frame-by-frame animation. Combat uses weapon vs armor with modifiers,
         damage is 1-3 HP per round. Units can disengage at 50% health loss.
+        Battles the player is not watching (see is_watched) skip the
+        animation and are finished immediately.
 
         Also updates diplomatic relations to Vendetta when combat occurs.
 
@@ -386,6 +446,8 @@ class Combat:
             defender (Unit): The defending unit
             target_x (int): Target tile X coordinate (where defender is)
             target_y (int): Target tile Y coordinate
+            battle (dict): The pending_battle the player confirmed, whose
+                modifier totals the prediction already computed (optional)
 
         Side Effects:
             - Sets self.active_battle with pre-simulated combat rounds
@@ -395,7 +457,8 @@ class Combat:
 
         Note:
             Actual HP changes and unit removal happen in the update loop
-            when active_battle animation completes.
+            when active_battle animation completes, or before this method
+            returns for an unwatched battle.
         """
         # Save original health values
         original_attacker_hp = attacker.current_health
@@ -431,17 +494,8 @@ class Combat:
             'original_defender_hp': original_defender_hp,
         }
 
-        # Get modifiers (calculated once at battle start, pass opponent for mode bonuses)
-        attacker_modifiers = self.get_combat_modifiers(attacker, is_defender=False, vs_unit=defender)
-        defender_modifiers = self.get_combat_modifiers(defender, is_defender=True, vs_unit=attacker)
-
-        attacker_modifier_total = 1.0
-        for mod in attacker_modifiers:
-            attacker_modifier_total *= mod['multiplier']
-
-        defender_modifier_total = 1.0
-        for mod in defender_modifiers:
-            defender_modifier_total *= mod['multiplier']
+        # Get modifier totals (shared with the prediction the player confirmed)
+        attacker_modifier_total, defender_modifier_total = self.get_battle_modifiers(attacker, defender, battle)
 
         # Psi combat: weapon/armor values are replaced by psi base strengths
         is_psi = self._is_psi_combat(attacker, defender)
@@ -522,6 +576,34 @@ class Combat:
         else:
             self.active_battle['victor'] = 'attacker'
 
+        # Nobody is watching: apply HP, losses, experience and retreat now
+        if not self.is_watched(attacker, defender):
+            self.finish_battle()
+
+    def is_watched(self, attacker, defender):
+        """Return True if a battle should be animated for the player.
+
+        The player watches battles their own units fight, unless battle
+        animation is turned off. AI-vs-AI battles are never animated. When
+        the camera does not follow AI units, an AI attack is only watched if
+        one of the two units is on screen.
+
+        Args:
+            attacker (Unit): Attacking unit
+            defender (Unit): Defending unit
+
+        Returns:
+            bool: True to animate the battle, False to apply it immediately
+        """
+        if not self.animate_battles:
+            return False
+        player_id = self.game.player_faction_id
+        if attacker.owner != player_id and defender.owner != player_id:
+            return False
+        if self.game.processing_ai and not self.game.turns.ai_camera_follow and self.on_screen is not None:
+            return self.on_screen(attacker.x, attacker.y) or self.on_screen(defender.x, defender.y)
+        return True
+
     def _apply_combat_movement_cost(self, unit, original_hp):
         """Consume movement points for a unit that survived combat.
 
@@ -656,12 +738,11 @@ class Combat:
                             break
 
                 if not has_enemy:
-                    # Calculate "safety score" - prefer tiles closer to friendly bases
+                    # Calculate "safety score" - prefer tiles closer to the nearest friendly base
                     safety_score = 0
-                    for base in self.game.bases:
-                        if base.owner == unit.owner:
-                            dist = abs(new_x - base.x) + abs(new_y - base.y)
-                            safety_score -= dist  # Negative distance = closer is better
+                    _, dist = self.game.base_index.nearest_base(new_x, new_y, owner=unit.owner)
+                    if dist is not None:
+                        safety_score -= dist  # Negative distance = closer is better
 
                     adjacent_tiles.append(((new_x, new_y), safety_score))
 
@@ -0,0 +1,118 @@
+"""Exact combat outcome probabilities.
+
+Combat.resolve_combat plays a battle out round by round: each round the
+attacker wins with probability  A*a / (A*a + D*d)  (A, D = per-HP strengths
+after modifiers, a, d = current HP), the loser takes 1-3 damage, and a unit
+knocked to half its starting HP or less may disengage.  Since HP only ever
+goes down, the battle is a walk through (attacker HP, defender HP) states
+toward zero, so the outcome distribution can be computed exactly by pushing
+probability mass through the states in order of decreasing total HP.
+
+Results are memoized on the battle parameters, so prediction screens and AI
+attack checks can ask for them as often as they like.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+DAMAGE_VALUES = (1, 2, 3)  # Damage per lost round, equally likely
+
+# Outcome probabilities of one battle.  attacker_hp / defender_hp are final
+# HP distributions: tuple index = HP at battle end, value = probability.
+CombatOutcome = namedtuple('CombatOutcome', [
+    'attacker_wins', 'defender_wins', 'attacker_disengages', 'defender_disengages',
+    'attacker_hp', 'defender_hp', 'expected_attacker_hp', 'expected_defender_hp',
+])
+
+
+@lru_cache(maxsize=4096)
+def solve_combat(attack, defense, attacker_hp, defender_hp,
+                 attacker_disengage=0.0, defender_disengage=0.0):
+    """Compute the exact outcome distribution of a battle.
+
+    Args:
+        attack (float): Attacker strength per HP, modifiers included
+        defense (float): Defender strength per HP, modifiers included
+        attacker_hp (int): Attacker HP at battle start
+        defender_hp (int): Defender HP at battle start
+        attacker_disengage (float): Attacker's disengage chance once at half HP
+            or less (0 if it is not fast enough to disengage)
+        defender_disengage (float): Defender's disengage chance, likewise
+
+    Returns:
+        CombatOutcome: Win/lose/disengage probabilities and final HP distributions
+    """
+    a0 = max(0, attacker_hp)
+    d0 = max(0, defender_hp)
+    attacker_final = [0.0] * (a0 + 1)
+    defender_final = [0.0] * (d0 + 1)
+
+    if a0 == 0 or d0 == 0:
+        # No rounds are fought; resolve_combat awards the battle to the defender
+        # only if the attacker has no HP
+        attacker_final[a0] = defender_final[d0] = 1.0
+        wins = 1.0 if a0 > 0 else 0.0
+        return CombatOutcome(wins, 1.0 - wins, 0.0, 0.0,
+                             tuple(attacker_final), tuple(defender_final), float(a0), float(d0))
+
+    attacker_wins = defender_wins = attacker_escapes = defender_escapes = 0.0
+    attacker_threshold = a0 * 0.5
+    defender_threshold = d0 * 0.5
+    share = 1.0 / len(DAMAGE_VALUES)
+
+    # mass[a][d] = probability that a round is fought at (a, d)
+    mass = [[0.0] * (d0 + 1) for _ in range(a0 + 1)]
+    mass[a0][d0] = 1.0
+
+    for total_hp in range(a0 + d0, 1, -1):
+        for a in range(max(1, total_hp - d0), min(a0, total_hp - 1) + 1):
+            d = total_hp - a
+            m = mass[a][d]
+            if m == 0.0:
+                continue
+
+            attacker_strength = attack * a
+            defender_strength = defense * d
+            total_strength = attacker_strength + defender_strength
+            odds = 0.5 if total_strength == 0 else attacker_strength / total_strength
+            round_won = m * odds * share
+            round_lost = m * (1.0 - odds) * share
+
+            for damage in DAMAGE_VALUES:
+                # Attacker wins the round
+                if round_won:
+                    new_d = d - damage
+                    if new_d <= 0:
+                        attacker_wins += round_won
+                        attacker_final[a] += round_won
+                        defender_final[0] += round_won
+                    elif defender_disengage and new_d <= defender_threshold:
+                        escaped = round_won * defender_disengage
+                        defender_escapes += escaped
+                        attacker_final[a] += escaped
+                        defender_final[new_d] += escaped
+                        mass[a][new_d] += round_won - escaped
+                    else:
+                        mass[a][new_d] += round_won
+
+                # Defender wins the round
+                if round_lost:
+                    new_a = a - damage
+                    if new_a <= 0:
+                        defender_wins += round_lost
+                        attacker_final[0] += round_lost
+                        defender_final[d] += round_lost
+                    elif attacker_disengage and new_a <= attacker_threshold:
+                        escaped = round_lost * attacker_disengage
+                        attacker_escapes += escaped
+                        attacker_final[new_a] += escaped
+                        defender_final[d] += escaped
+                        mass[new_a][d] += round_lost - escaped
+                    else:
+                        mass[new_a][d] += round_lost
+
+    expected_attacker_hp = sum(hp * p for hp, p in enumerate(attacker_final))
+    expected_defender_hp = sum(hp * p for hp, p in enumerate(defender_final))
+    return CombatOutcome(attacker_wins, defender_wins, attacker_escapes, defender_escapes,
+                         tuple(attacker_final), tuple(defender_final),
+                         expected_attacker_hp, expected_defender_hp)
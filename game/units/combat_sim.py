@@ -0,0 +1,316 @@
+"""Batched Monte Carlo combat simulator for balance analysis.
+
+Runs thousands of battles at once with NumPy, using the same round rules as
+Combat.resolve_combat: per-round odds  A*a / (A*a + D*d), 1-3 damage to the
+loser, and a disengage roll for a unit at half its starting HP or less.
+Nothing is animated or applied to units; this is for questions like "how
+often does a Chaos Gun beat Silksteel on rocky terrain?".
+
+Command line:
+    python -m game.units.combat_sim --weapons laser,chaos_gun --armors synthmetal,silksteel
+    python -m game.units.combat_sim --terrain rocky --defender-morale 4 --verify
+
+Matchups are set up as two real Units on a two-tile map, so every modifier
+comes from Combat's own rules (morale, terrain, base defense, mode and
+chassis bonuses).  --verify compares every table cell with the exact odds
+from Combat.predict_combat for the same two units and exits with status 1
+if any cell is further off than sampling noise allows.
+"""
+
+import argparse
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from game.units.combat_odds import DAMAGE_VALUES
+
+# Per-battle outcome codes in SimulationResult.outcomes
+FIGHTING = 0
+ATTACKER_WINS = 1
+DEFENDER_WINS = 2
+ATTACKER_DISENGAGES = 3
+DEFENDER_DISENGAGES = 4
+
+# Defender tile choices for matchups (the attacker always stands on open land)
+TERRAINS = ('open', 'rocky', 'fungus', 'base', 'perimeter')
+
+SimulationResult = namedtuple('SimulationResult', [
+    'battles', 'attacker_wins', 'defender_wins', 'attacker_disengages', 'defender_disengages',
+    'attacker_hp', 'defender_hp', 'outcomes',
+])
+
+
+def simulate_battles(attack, defense, attacker_hp, defender_hp,
+                     attacker_disengage=0.0, defender_disengage=0.0,
+                     battles=10000, rng=None):
+    """Simulate many independent battles with the same starting state.
+
+    Takes the same parameters as combat_odds.solve_combat. Every battle that
+    is still being fought advances one round per loop iteration.
+
+    Args:
+        attack (float): Attacker strength per HP, modifiers included
+        defense (float): Defender strength per HP, modifiers included
+        attacker_hp (int): Attacker HP at battle start
+        defender_hp (int): Defender HP at battle start
+        attacker_disengage (float): Attacker's disengage chance at half HP or less
+        defender_disengage (float): Defender's disengage chance at half HP or less
+        battles (int): Number of battles to run
+        rng (numpy.random.Generator): Random generator (optional)
+
+    Returns:
+        SimulationResult: Outcome fractions, final HP arrays and per-battle outcome codes
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    a = np.full(battles, max(0, attacker_hp), dtype=np.int32)
+    d = np.full(battles, max(0, defender_hp), dtype=np.int32)
+    outcomes = np.full(battles, FIGHTING, dtype=np.int8)
+
+    if attacker_hp <= 0 or defender_hp <= 0:
+        # No rounds are fought (see solve_combat)
+        outcomes[:] = ATTACKER_WINS if attacker_hp > 0 else DEFENDER_WINS
+        active = np.empty(0, dtype=np.intp)
+    else:
+        active = np.arange(battles)
+
+    attacker_threshold = attacker_hp * 0.5
+    defender_threshold = defender_hp * 0.5
+    low_damage, high_damage = DAMAGE_VALUES[0], DAMAGE_VALUES[-1]
+
+    while active.size:
+        aa = a[active]
+        dd = d[active]
+        attacker_strength = attack * aa
+        defender_strength = defense * dd
+        total_strength = attacker_strength + defender_strength
+        odds = np.divide(attacker_strength, total_strength,
+                         out=np.full(active.size, 0.5), where=total_strength != 0)
+
+        won = rng.random(active.size) < odds
+        damage = rng.integers(low_damage, high_damage + 1, size=active.size)
+        dd = np.where(won, np.maximum(dd - damage, 0), dd)
+        aa = np.where(won, aa, np.maximum(aa - damage, 0))
+        a[active] = aa
+        d[active] = dd
+
+        result = np.zeros(active.size, dtype=np.int8)
+        result[won & (dd == 0)] = ATTACKER_WINS
+        result[~won & (aa == 0)] = DEFENDER_WINS
+        if defender_disengage:
+            may_escape = won & (dd > 0) & (dd <= defender_threshold)
+            result[may_escape & (rng.random(active.size) < defender_disengage)] = DEFENDER_DISENGAGES
+        if attacker_disengage:
+            may_escape = ~won & (aa > 0) & (aa <= attacker_threshold)
+            result[may_escape & (rng.random(active.size) < attacker_disengage)] = ATTACKER_DISENGAGES
+
+        outcomes[active] = result
+        active = active[result == FIGHTING]
+
+    counts = np.bincount(outcomes, minlength=5) / battles
+    return SimulationResult(battles, counts[ATTACKER_WINS], counts[DEFENDER_WINS],
+                            counts[ATTACKER_DISENGAGES], counts[DEFENDER_DISENGAGES],
+                            a, d, outcomes)
+
+
+class _DuelMap:
+    """Two land tiles side by side: the attacker's at (0, 0), the defender's at (1, 0)."""
+
+    def __init__(self, terrain):
+        from game.base import Base
+        from game.map import Tile
+        from game.terrain_store import TerrainStore
+
+        store = TerrainStore(2, 1)
+        store.land[:] = True
+        self.tiles = [Tile(store, 0, 0), Tile(store, 1, 0)]
+        defender_tile = self.tiles[1]
+        if terrain == 'rocky':
+            defender_tile.rockiness = 2
+        elif terrain == 'fungus':
+            defender_tile.fungus = True
+        elif terrain in ('base', 'perimeter'):
+            defender_tile.base = Base(1, 0, 1, 'Defender')
+            if terrain == 'perimeter':
+                defender_tile.base.facilities.add('perimeter_defense')
+
+    def get_tile(self, x, y):
+        if y == 0 and 0 <= x < 2:
+            return self.tiles[x]
+        return None
+
+
+class _DuelGame:
+    """The parts of Game that Combat's modifier rules read."""
+
+    def __init__(self, terrain):
+        self.game_map = _DuelMap(terrain)
+        self.turn = 1
+
+    def get_planet_rating(self, faction_id):
+        return 0
+
+
+def build_duel(weapon, armor, attacker_reactor='fission', defender_reactor='fission',
+               attacker_morale=2, defender_morale=2,
+               attacker_chassis='infantry', defender_chassis='infantry', terrain='open'):
+    """Set up a full-health matchup as two real units on a two-tile map.
+
+    The attacker wears no armor and the defender carries hand weapons.
+    Neither unit belongs to a faction with an attack bonus.
+
+    Args:
+        weapon (str): Attacker weapon ID
+        armor (str): Defender armor ID
+        attacker_reactor (str): Attacker reactor ID
+        defender_reactor (str): Defender reactor ID
+        attacker_morale (int): Attacker morale level (2 = Green)
+        defender_morale (int): Defender morale level
+        attacker_chassis (str): Attacker chassis ID
+        defender_chassis (str): Defender chassis ID
+        terrain (str): Defender tile, one of TERRAINS
+
+    Returns:
+        tuple: (combat, attacker, defender) where combat is a Combat bound to the duel map
+    """
+    from game.units.unit import Unit
+    from game.units.combat import Combat
+
+    attacker = Unit(0, 0, attacker_chassis, 0, 'Attacker', weapon, 'no_armor', attacker_reactor)
+    defender = Unit(1, 0, defender_chassis, 1, 'Defender', 'hand_weapons', armor, defender_reactor)
+    attacker.morale_level = attacker_morale
+    defender.morale_level = defender_morale
+    return Combat(_DuelGame(terrain)), attacker, defender
+
+
+def battle_from_specs(weapon, armor, attacker_reactor='fission', defender_reactor='fission',
+                      attacker_morale=2, defender_morale=2,
+                      attacker_chassis='infantry', defender_chassis='infantry',
+                      terrain='open', attacker_modifier=1.0, defender_modifier=1.0):
+    """Build solver/simulator parameters for a full-health matchup.
+
+    The units come from build_duel and the parameters from
+    Combat.battle_parameters, so all of Combat's modifier rules apply.
+    The extra modifiers are multiplied in on top.
+
+    Args:
+        weapon (str): Attacker weapon ID
+        armor (str): Defender armor ID
+        attacker_reactor (str): Attacker reactor ID
+        defender_reactor (str): Defender reactor ID
+        attacker_morale (int): Attacker morale level (2 = Green)
+        defender_morale (int): Defender morale level
+        attacker_chassis (str): Attacker chassis ID
+        defender_chassis (str): Defender chassis ID
+        terrain (str): Defender tile, one of TERRAINS
+        attacker_modifier (float): Extra attacker multiplier
+        defender_modifier (float): Extra defender multiplier
+
+    Returns:
+        tuple: (attack, defense, attacker_hp, defender_hp, attacker_disengage, defender_disengage)
+    """
+    combat, attacker, defender = build_duel(weapon, armor, attacker_reactor, defender_reactor,
+                                            attacker_morale, defender_morale,
+                                            attacker_chassis, defender_chassis, terrain)
+    attack, defense, attacker_hp, defender_hp, attacker_disengage, defender_disengage = \
+        combat.battle_parameters(attacker, defender)
+    return (attack * attacker_modifier, defense * defender_modifier, attacker_hp, defender_hp,
+            attacker_disengage, defender_disengage)
+
+
+def _parse_args(argv):
+    from game.data.unit_data import WEAPONS, ARMOR
+
+    combat_weapons = [w['id'] for w in WEAPONS
+                      if w.get('mode') in ('projectile', 'energy', 'missile') and 0 < w['attack'] < 99]
+    combat_armors = [a['id'] for a in ARMOR if a['defense'] > 0]
+
+    parser = argparse.ArgumentParser(
+        prog='python -m game.units.combat_sim',
+        description='Monte Carlo win-rate tables for weapon vs armor matchups.')
+    parser.add_argument('--weapons', default=','.join(combat_weapons),
+                        help='Comma-separated attacker weapon IDs (default: all combat weapons)')
+    parser.add_argument('--armors', default=','.join(combat_armors),
+                        help='Comma-separated defender armor IDs (default: all non-psi armor)')
+    parser.add_argument('--attacker-reactor', default='fission')
+    parser.add_argument('--defender-reactor', default='fission')
+    parser.add_argument('--attacker-morale', type=int, default=2, help='0-7, 2 = Green')
+    parser.add_argument('--defender-morale', type=int, default=2, help='0-7, 2 = Green')
+    parser.add_argument('--attacker-chassis', default='infantry')
+    parser.add_argument('--defender-chassis', default='infantry')
+    parser.add_argument('--terrain', choices=TERRAINS, default='open')
+    parser.add_argument('--attacker-modifier', type=float, default=1.0,
+                        help='Extra attacker modifier total')
+    parser.add_argument('--defender-modifier', type=float, default=1.0,
+                        help='Extra defender modifier total')
+    parser.add_argument('--battles', type=int, default=10000, help='Battles per matchup')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--verify', action='store_true',
+                        help='Check each result against the exact odds')
+    args = parser.parse_args(argv)
+    if args.verify and (args.attacker_modifier != 1.0 or args.defender_modifier != 1.0):
+        parser.error('--verify checks real unit matchups and cannot include extra modifiers')
+    return args
+
+
+def main(argv=None):
+    """Print a weapon x armor attacker win-rate table.
+
+    Returns:
+        int: Process exit status (1 if --verify found a mismatch)
+    """
+    args = _parse_args(argv)
+    weapons = [w for w in args.weapons.split(',') if w]
+    armors = [a for a in args.armors.split(',') if a]
+    rng = np.random.default_rng(args.seed)
+
+    print(f"Attacker win rate, {args.battles} battles per cell, terrain: {args.terrain}, "
+          f"morale {args.attacker_morale} vs {args.defender_morale}")
+    width = max(len(a) for a in armors + ['weapon']) + 2
+    label_width = max(len(w) for w in weapons + ['weapon']) + 2
+    print('weapon'.ljust(label_width) + ''.join(a.rjust(width) for a in armors))
+
+    worst_z = 0.0
+    failures = []
+    for weapon in weapons:
+        row = weapon.ljust(label_width)
+        for armor in armors:
+            params = battle_from_specs(
+                weapon, armor, args.attacker_reactor, args.defender_reactor,
+                args.attacker_morale, args.defender_morale,
+                args.attacker_chassis, args.defender_chassis,
+                args.terrain, args.attacker_modifier, args.defender_modifier)
+            result = simulate_battles(*params, battles=args.battles, rng=rng)
+            row += f"{result.attacker_wins * 100:.1f}%".rjust(width)
+
+            if args.verify:
+                # Exact odds straight from the game's own prediction for the same units
+                combat, attacker, defender = build_duel(
+                    weapon, armor, args.attacker_reactor, args.defender_reactor,
+                    args.attacker_morale, args.defender_morale,
+                    args.attacker_chassis, args.defender_chassis, args.terrain)
+                exact = combat.predict_combat(attacker, defender)
+                for name in ('attacker_wins', 'defender_wins',
+                             'attacker_disengages', 'defender_disengages'):
+                    p = getattr(exact, name)
+                    error = abs(getattr(result, name) - p)
+                    sigma = max((p * (1 - p) / args.battles) ** 0.5, 1e-9)
+                    worst_z = max(worst_z, error / sigma if error > 1e-12 else 0.0)
+                    # 5 sigma plus a floor for probabilities too small to sample
+                    if error > 5 * sigma + 1.0 / args.battles:
+                        failures.append((weapon, armor, name, getattr(result, name), p))
+        print(row)
+
+    if args.verify:
+        cells = len(weapons) * len(armors)
+        if failures:
+            print(f"\nVERIFY FAILED: {len(failures)} value(s) outside sampling noise")
+            for weapon, armor, name, simulated, exact in failures:
+                print(f"  {weapon} vs {armor} {name}: simulated {simulated:.4f}, exact {exact:.4f}")
+            return 1
+        print(f"\nVERIFY OK: {cells} matchups match the exact odds (worst deviation {worst_z:.2f} sigma)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
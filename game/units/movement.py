@@ -400,20 +400,20 @@ class MovementManager:
                         print(f"AI player {unit.owner} destroyed {base.name}!")
 
                     # Remove base from game
-                    game.bases.remove(base)
+                    game.remove_base(base)
                     target_tile.base = None
 
                     # Check if this eliminated the faction
                     game.check_faction_elimination()
 
                     # Update territory
-                    game.territory.update_territory(game.bases)
+                    game.territory.update_territory_for_base(base, game.bases)
 
                     # Check for victory/defeat immediately
                     game.check_victory()
                 else:
                     # Base captured successfully
-                    base.owner = unit.owner
+                    game.set_base_owner(base, unit.owner)
                     base.turns_since_capture = 0  # Mark as newly captured for disloyal citizens
 
                     # Recalculate production and growth based on new population
@@ -422,7 +422,7 @@ class MovementManager:
                     base.production_turns_remaining = base._calculate_production_turns()
 
                     # Update territory
-                    game.territory.update_territory(game.bases)
+                    game.territory.update_territory_for_base(base, game.bases)
 
                     # Show message
                     if unit.owner == game.player_faction_id:
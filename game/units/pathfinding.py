@@ -0,0 +1,662 @@
+"""Pathfinding for unit movement: A* routes and shared flow fields.
+
+Plans multi-tile routes using the same step rules as MovementManager:
+- Step cost from MovementManager._get_movement_cost (mag-tubes, roads, rivers)
+  plus the rocky terrain and fungus costs try_move_unit charges
+- Land/sea domains (sea units may dock at their own land bases)
+- Zone of control for land units
+- Tiles holding hostile units are blocked except as the final step (an attack)
+
+Each unit's current path is cached and reused turn after turn; it is only
+searched again when the target changes or the next step stops being legal.
+Step costs and land/sea regions are memoized until the terrain or the set
+of bases changes, and targets in another region are rejected without a
+search.  The map wraps east-west and is clamped north-south.
+
+FlowField covers the opposite case: many units of one faction heading for
+the nearest of a shared set of targets.  One Dijkstra map per objective
+gives every unit its distance and next step without a search of its own.
+"""
+
+import heapq
+
+import numpy as np
+
+from game.map_arrays import shift_grid
+from game.terrain_store import RIVER_EDGE_BITS, improvement_bit
+
+# 8-neighbour offsets; _NEIGHBORS[7 - i] is the opposite of _NEIGHBORS[i]
+_NEIGHBORS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+# River edge crossed by an orthogonal step: (edge on the from tile, edge on the to tile)
+_RIVER_CROSSINGS = {(0, -1): ('N', 'S'), (0, 1): ('S', 'N'), (1, 0): ('E', 'W'), (-1, 0): ('W', 'E')}
+
+# Fungus kinds stored with memoized step costs
+_NO_FUNGUS, _LAND_FUNGUS, _SEA_FUNGUS = 0, 1, 2
+SEA_FUNGUS_COST = 2.0  # Extra moves to enter sea fungus (see try_move_unit)
+
+
+class PathFinder:
+    """Finds and caches unit paths over the game map.
+
+    Attributes:
+        searches (int): A* searches run (profiling stat)
+        cache_hits (int): Steps served from a cached path (profiling stat)
+    """
+
+    def __init__(self, game):
+        """Initialize pathfinder.
+
+        Args:
+            game (Game): Reference to main game instance
+        """
+        self.game = game
+        self._paths = {}  # unit -> (target, remaining steps with the next one last, turn searched)
+        self._terrain_key = None
+        self._land = []  # Flat tile index -> True for land
+        self._void = []  # Flat tile index -> True for border tiles
+        self._step_costs = []  # Per _NEIGHBORS direction: flat tile index -> base cost of the step
+        self._step_fungus = []  # Per _NEIGHBORS direction: flat tile index -> fungus kind entered
+        self._region_key = None
+        self._regions = []  # Flat tile index -> connected land/ocean region id (-1 for void)
+        self._region_grid = None  # Same ids as a 2D array (see region_labels)
+        self.searches = 0
+        self.cache_hits = 0
+
+    def forget(self, unit):
+        """Drop a unit's cached path (unit removed or its orders changed)."""
+        self._paths.pop(unit, None)
+
+    def next_step(self, unit, target_x, target_y):
+        """Return the next tile on the unit's path to a target.
+
+        Reuses the cached path while the target is unchanged and the next
+        step is still legal; otherwise searches again. A failed search is
+        remembered until the next turn.
+
+        Args:
+            unit (Unit): Unit to move
+            target_x (int): Target X coordinate
+            target_y (int): Target Y coordinate
+
+        Returns:
+            tuple: (x, y) of the next step, or None if the target is unreachable
+        """
+        target = (target_x % self.game.game_map.width, target_y)
+        if target == (unit.x, unit.y):
+            return None
+
+        entry = self._paths.get(unit)
+        if entry is not None and entry[0] == target:
+            steps = entry[1]
+            if steps is None:
+                if entry[2] == self.game.turn:
+                    return None
+            else:
+                # Drop the step the unit took since the last call
+                if steps and steps[-1] == (unit.x, unit.y):
+                    steps.pop()
+                if steps and self._step_is_open(unit, steps[-1], target):
+                    self.cache_hits += 1
+                    return steps[-1]
+
+        path = self.find_path(unit, target[0], target[1])
+        if path is None:
+            self._paths[unit] = (target, None, self.game.turn)
+            return None
+        steps = path[::-1]
+        self._paths[unit] = (target, steps, self.game.turn)
+        return steps[-1]
+
+    def _step_is_open(self, unit, step, target):
+        """Return True if the unit can still take a cached step right now."""
+        game = self.game
+        game_map = game.game_map
+        dx = (step[0] - unit.x + 1) % game_map.width - 1
+        dy = step[1] - unit.y
+        if abs(dx) > 1 or abs(dy) > 1:
+            return False  # Unit was moved off its path
+
+        from_tile = game_map.get_tile(unit.x, unit.y)
+        tile = game_map.get_tile(step[0], step[1])
+        if tile is None or from_tile is None:
+            return False
+        if not self._can_enter(unit, from_tile, tile):
+            return False
+        if step != target and self._hostile_units(unit, tile):
+            return False
+        return not game.movement._violates_zone_of_control(unit, unit.x, unit.y, step[0], step[1])
+
+    def can_enter(self, unit, x, y):
+        """Return True if a one-tile move to (x, y) passes the terrain checks.
+
+        Lets callers skip moves try_move_unit would certainly refuse. Moving
+        onto an ocean tile with an own transport (boarding) counts as allowed.
+
+        Args:
+            unit (Unit): Unit to move
+            x (int): Target X coordinate (wraps)
+            y (int): Target Y coordinate
+
+        Returns:
+            bool: False if the move is certain to fail on terrain
+        """
+        game_map = self.game.game_map
+        tile = game_map.get_tile(x % game_map.width, y)
+        from_tile = game_map.get_tile(unit.x, unit.y)
+        if tile is None or from_tile is None:
+            return False
+        if (unit.type == 'land' and tile.is_ocean()
+                and any(u.owner == unit.owner and u.transport_capacity > 0 for u in tile.units)):
+            return True
+        return self._can_enter(unit, from_tile, tile)
+
+    def _can_enter(self, unit, from_tile, tile):
+        """Domain check for one step, ignoring units and movement points.
+
+        Mirrors the checks in MovementManager.try_move_unit.
+        """
+        if tile.void:
+            return False
+        if unit.type == 'land':
+            if tile.is_ocean():
+                return False
+            # Leaving a sea base for land needs amphibious pods
+            return not (from_tile.is_ocean() and not unit.has_amphibious_pods)
+        if unit.type == 'sea' and tile.is_land():
+            # Sea port: dock at an own land base from the ocean
+            return tile.base is not None and tile.base.owner == unit.owner and from_tile.is_ocean()
+        return True
+
+    def _hostile_units(self, unit, tile):
+        """Return True if the tile holds units the unit would have to attack."""
+        if not tile.units:
+            return False
+        first = tile.units[0]
+        return first.owner != unit.owner and not self.game.has_pact_with(unit.owner, first.owner)
+
+    def _enemy_zoc_tiles(self, unit):
+        """Return the set of flat tile indices adjacent to a hostile unit."""
+        game = self.game
+        game_map = game.game_map
+        width, height = game_map.width, game_map.height
+        hostile_owners = {}
+        zoc = set()
+        for other in game.units:
+            if other.owner == unit.owner:
+                continue
+            hostile = hostile_owners.get(other.owner)
+            if hostile is None:
+                hostile = hostile_owners[other.owner] = not game.has_pact_with(unit.owner, other.owner)
+            if not hostile:
+                continue
+            for dx, dy in _NEIGHBORS:
+                y = other.y + dy
+                if 0 <= y < height:
+                    zoc.add(y * width + (other.x + dx) % width)
+        return zoc
+
+    def _refresh_terrain(self):
+        """Drop memoized terrain data if the terrain or bases have changed."""
+        game = self.game
+        store = game.game_map.terrain
+        key = (id(store), store.yield_epoch, game.base_index.version)
+        if key == self._terrain_key:
+            return
+        self._terrain_key = key
+        self._land = store.land.ravel().tolist()
+        self._void = store.void.ravel().tolist()
+        self._build_step_tables(store)
+
+        land_bytes = store.land.tobytes()
+        if land_bytes != self._region_key:
+            self._region_key = land_bytes
+            self._regions = self._label_regions()
+            self._region_grid = np.array(self._regions).reshape(store.land.shape)
+
+    def region_labels(self):
+        """Return the connected land/ocean region id of every tile.
+
+        Two tiles with the same id are joined by tiles of the same kind
+        (land or ocean); -1 marks void tiles.
+
+        Returns:
+            ndarray: Region ids indexed [y][x]
+        """
+        self._refresh_terrain()
+        return self._region_grid
+
+    def _label_regions(self):
+        """Label 8-connected land and ocean regions (with east-west wrap).
+
+        Returns:
+            list: Flat tile index -> region id, -1 for void tiles
+        """
+        game_map = self.game.game_map
+        width, height = game_map.width, game_map.height
+        land, void = self._land, self._void
+        regions = [-1] * (width * height)
+        region = 0
+        for start in range(width * height):
+            if regions[start] != -1 or void[start]:
+                continue
+            is_land = land[start]
+            regions[start] = region
+            stack = [start]
+            while stack:
+                index = stack.pop()
+                y, x = divmod(index, width)
+                for dx, dy in _NEIGHBORS:
+                    ny = y + dy
+                    if not 0 <= ny < height:
+                        continue
+                    neighbor = ny * width + (x + dx) % width
+                    if regions[neighbor] == -1 and not void[neighbor] and land[neighbor] == is_land:
+                        regions[neighbor] = region
+                        stack.append(neighbor)
+            region += 1
+        return regions
+
+    def _build_step_tables(self, store):
+        """Compute the cost of every step on the map with NumPy.
+
+        Array form of MovementManager._get_movement_cost (bases count as
+        road and mag-tube) plus the rocky terrain surcharge try_move_unit
+        charges.  The fungus cost depends on the unit, so only the kind of
+        fungus entered is recorded and the caller adds the cost.
+
+        Args:
+            store (TerrainStore): Terrain arrays of the current map
+        """
+        has_base = np.zeros(store.land.shape, dtype=bool)
+        for base in self.game.bases:
+            has_base[base.y, base.x] = True
+        improvements = store.improvements
+
+        def has(key):
+            return (improvements & np.uint64(improvement_bit(key))) != 0
+
+        road = has('road') | has_base
+        magtube = has('mag_tube') | has_base
+        fungus_kind = np.where(store.land,
+                               np.where(has('fungus') | store.fungus, _LAND_FUNGUS, _NO_FUNGUS),
+                               np.where(has('sea_fungus'), _SEA_FUNGUS, _NO_FUNGUS)).astype(np.int8)
+        rocky = store.land & (store.rockiness == 2)
+
+        self._step_costs = []
+        self._step_fungus = []
+        for dx, dy in _NEIGHBORS:
+            cost = np.ones(store.land.shape)
+            crossing = _RIVER_CROSSINGS.get((dx, dy))
+            if crossing:
+                from_bit, to_bit = RIVER_EDGE_BITS[crossing[0]], RIVER_EDGE_BITS[crossing[1]]
+                to_edges = shift_grid(store.river_edges, dx, dy)
+                cost[((store.river_edges & from_bit) != 0) & ((to_edges & to_bit) != 0)] = 1.0 / 3.0
+            cost[road & shift_grid(road, dx, dy, False)] = 1.0 / 3.0
+            cost[magtube & shift_grid(magtube, dx, dy, False)] = 0.0
+            cost[(cost >= 1.0) & shift_grid(rocky, dx, dy, False)] += 1.0
+            fungus = np.where(cost > 0.0, shift_grid(fungus_kind, dx, dy, _NO_FUNGUS), _NO_FUNGUS)
+            self._step_costs.append(cost.ravel().tolist())
+            self._step_fungus.append(fungus.ravel().tolist())
+
+    def _reachable_region(self, unit, start_tile, goal_tile):
+        """Return False if the goal is certainly outside the unit's region."""
+        if unit.type == 'air':
+            return True
+        regions = self._regions
+        start_region = regions[start_tile._index]
+        if unit.type == 'land':
+            # A land unit in a sea base may leave by amphibious assault
+            return start_tile.is_ocean() or regions[goal_tile._index] == start_region
+        if start_tile.is_land():
+            return True  # Docked at a land base; can sail out to adjacent oceans
+        if goal_tile.is_ocean():
+            return regions[goal_tile._index] == start_region
+        # Own land base: reachable if it touches the unit's ocean
+        game_map = self.game.game_map
+        for dx, dy in _NEIGHBORS:
+            tile = game_map.get_tile((goal_tile.x + dx) % game_map.width, goal_tile.y + dy)
+            if tile is not None and regions[tile._index] == start_region:
+                return True
+        return False
+
+    def find_path(self, unit, target_x, target_y):
+        """Search for the cheapest path from the unit to a target tile.
+
+        The target may hold a hostile unit or base (the last step is then an
+        attack or capture); no other step may.  The heuristic assumes
+        plain one-move steps, so routes along roads and rivers can come out
+        slightly longer than the true optimum in exchange for much smaller
+        searches.
+
+        Args:
+            unit (Unit): Unit to move
+            target_x (int): Target X coordinate
+            target_y (int): Target Y coordinate
+
+        Returns:
+            list: (x, y) steps from the tile after the unit's position up to and
+                including the target, or None if no path exists
+        """
+        game = self.game
+        game_map = game.game_map
+        width, height = game_map.width, game_map.height
+        target_x %= width
+        start_tile = game_map.get_tile(unit.x, unit.y)
+        goal_tile = game_map.get_tile(target_x, target_y)
+        if start_tile is None or goal_tile is None or goal_tile.void:
+            return None
+        if unit.type == 'land' and goal_tile.is_ocean():
+            return None
+        if unit.type == 'sea' and goal_tile.is_land() and not (
+                goal_tile.base is not None and goal_tile.base.owner == unit.owner):
+            return None
+
+        self._refresh_terrain()
+        if not self._reachable_region(unit, start_tile, goal_tile):
+            return None
+
+        self.searches += 1
+        land, void = self._land, self._void
+        unit_type = unit.type
+        owner = unit.owner
+        amphibious = unit.has_amphibious_pods
+        zoc = self._enemy_zoc_tiles(unit) if unit_type == 'land' else ()
+
+        # Land fungus drains the rest of the turn with this chance (see try_move_unit)
+        consume_chance = max(0.0, 0.50 - game.get_planet_rating(owner) * 0.10)
+        fungus_costs = (0.0, consume_chance * unit.max_moves(), SEA_FUNGUS_COST)
+
+        step_costs, step_fungus = self._step_costs, self._step_fungus
+        half_width = width // 2
+        start = start_tile._index
+        goal = goal_tile._index
+
+        def heuristic(x, y):
+            dx = abs(x - target_x)
+            if dx > half_width:
+                dx = width - dx
+            return max(dx, abs(y - target_y))
+
+        best = {start: 0.0}
+        came_from = {}
+        counter = 0
+        frontier = [(heuristic(unit.x, unit.y), counter, start)]
+        while frontier:
+            _, _, node = heapq.heappop(frontier)
+            if node == goal:
+                path = []
+                while node != start:
+                    path.append(divmod(node, width)[::-1])
+                    node = came_from[node]
+                return path[::-1]
+
+            cost_here = best[node]
+            y, x = divmod(node, width)
+            from_tile = game_map.get_tile(x, y)
+            from_land = land[node]
+            from_zoc = node in zoc and not from_tile.base
+            for direction, (dx, dy) in enumerate(_NEIGHBORS):
+                ny = y + dy
+                if not 0 <= ny < height:
+                    continue
+                nx = (x + dx) % width
+                neighbor = ny * width + nx
+                if void[neighbor]:
+                    continue
+                tile = game_map.get_tile(nx, ny)
+                if unit_type == 'land':
+                    if not land[neighbor] or (not from_land and not amphibious):
+                        continue
+                elif unit_type == 'sea' and land[neighbor]:
+                    # Sea port: dock at an own land base from the ocean
+                    if from_land or tile.base is None or tile.base.owner != owner:
+                        continue
+
+                # Attacks and stacking with own units are exempt from ZOC
+                zoc_exempt = False
+                if tile.units:
+                    if self._hostile_units(unit, tile):
+                        if neighbor != goal:
+                            continue
+                        zoc_exempt = True
+                    else:
+                        zoc_exempt = any(u.owner == owner for u in tile.units)
+                if from_zoc and not zoc_exempt and not tile.base and neighbor in zoc:
+                    continue
+
+                new_cost = (cost_here + step_costs[direction][node]
+                            + fungus_costs[step_fungus[direction][node]])
+                if new_cost < best.get(neighbor, float('inf')):
+                    best[neighbor] = new_cost
+                    came_from[neighbor] = node
+                    counter += 1
+                    heapq.heappush(frontier, (new_cost + heuristic(nx, ny), counter, neighbor))
+        return None
+
+
+class FlowField:
+    """Distance-to-nearest-target map shared by all units of one faction.
+
+    A multi-source Dijkstra map over one movement domain: every tile holds
+    the move cost to the nearest target, so any unit can read its distance
+    and next step from its own tile and its neighbours. Costs follow
+    PathFinder's terrain rules, with land fungus weighted as for a one-move
+    unit. Units other than the targets and zone of control are ignored;
+    they are left to the per-move checks.
+
+    update() applies only the difference between the old and new target
+    sets: tiles whose nearest target disappeared are cleared and refilled
+    from their surviving neighbours, and new targets spread outward only
+    where they are closer. The map is rebuilt from scratch when the
+    terrain or the set of bases changes.
+
+    Attributes:
+        owner (int): Faction whose units use the field (own bases are sea ports)
+        domain (str): Unit type the field is built for ('land', 'sea' or 'air')
+        targets (set): Flat tile indices of the current targets
+    """
+
+    def __init__(self, game, owner, domain):
+        """Initialize an empty field.
+
+        Args:
+            game (Game): Reference to main game instance
+            owner (int): Faction ID of the units using the field
+            domain (str): 'land', 'sea' or 'air'
+        """
+        self.game = game
+        self.owner = owner
+        self.domain = domain
+        self.targets = set()
+        self._terrain_key = None
+        self._dist = []  # Flat tile index -> move cost to the nearest target
+        self._source = []  # Flat tile index -> nearest target index (-1 if none)
+        self._passable = []  # Flat tile index -> True if the domain can stand there
+        self._edges = []  # Flat tile index -> [(neighbour, cost of stepping from it to here)]
+        self._fungus_costs = (0.0, 0.0, SEA_FUNGUS_COST)  # Extra cost by fungus kind
+
+    def update(self, targets):
+        """Bring the field up to date with the current target tiles.
+
+        Args:
+            targets (iterable): (x, y) target coordinates
+        """
+        width = self.game.game_map.width
+        new_targets = {y * width + x % width for x, y in targets}
+        pathfinder = self.game.pathfinder
+        pathfinder._refresh_terrain()
+        # Land fungus drains a one-move unit's turn with this chance
+        fungus_chance = max(0.0, 0.50 - self.game.get_planet_rating(self.owner) * 0.10)
+        if pathfinder._terrain_key != self._terrain_key or fungus_chance != self._fungus_costs[1]:
+            self._terrain_key = pathfinder._terrain_key
+            self._fungus_costs = (0.0, fungus_chance, SEA_FUNGUS_COST)
+            self._rebuild(new_targets)
+            return
+        if new_targets == self.targets:
+            return
+
+        removed = self.targets - new_targets
+        added = new_targets - self.targets
+        self.targets = new_targets
+        dist, source = self._dist, self._source
+        seeds = {}
+
+        if removed:
+            # Clear every tile that was routed to a removed target ...
+            inf = float('inf')
+            cleared = [i for i, s in enumerate(source) if s in removed]
+            for index in cleared:
+                dist[index] = inf
+                source[index] = -1
+            # ... and refill them from the untouched tiles around them
+            edges = self._edges
+            for index in cleared:
+                for neighbor, _ in edges[index]:
+                    if source[neighbor] != -1:
+                        seeds[neighbor] = dist[neighbor]
+
+        for index in added:
+            if self._passable[index]:
+                dist[index] = 0.0
+                source[index] = index
+                seeds[index] = 0.0
+
+        self._spread(seeds)
+
+    def distance(self, unit):
+        """Return the unit's move cost to the nearest target.
+
+        Args:
+            unit (Unit): Unit of the field's faction and domain
+
+        Returns:
+            float: Move cost, or None if no target can be reached
+        """
+        game_map = self.game.game_map
+        index = unit.y * game_map.width + unit.x
+        if self._dist[index] < float('inf'):
+            return self._dist[index]
+        # Off the field (e.g. a land unit aboard a ship): best neighbour
+        step = self.next_step(unit)
+        if step is None:
+            return None
+        return step[2]
+
+    def next_step(self, unit):
+        """Return the neighbouring tile that leads to the nearest target.
+
+        Args:
+            unit (Unit): Unit of the field's faction and domain
+
+        Returns:
+            tuple: (x, y, distance from the unit's tile), or None if the unit
+                is on a target or no target can be reached
+        """
+        game_map = self.game.game_map
+        width, height = game_map.width, game_map.height
+        index = unit.y * width + unit.x
+        if index in self.targets:
+            return None
+
+        pathfinder = self.game.pathfinder
+        from_tile = game_map.get_tile(unit.x, unit.y)
+        dist = self._dist
+        best = None
+        best_cost = float('inf')
+        for direction, (dx, dy) in enumerate(_NEIGHBORS):
+            ny = unit.y + dy
+            if not 0 <= ny < height:
+                continue
+            nx = (unit.x + dx) % width
+            remaining = dist[ny * width + nx]
+            if remaining >= best_cost:
+                continue
+            tile = game_map.get_tile(nx, ny)
+            if not pathfinder._can_enter(unit, from_tile, tile):
+                continue
+            cost = remaining + self._cost(index, direction)
+            if cost < best_cost:
+                best_cost = cost
+                best = (nx, ny, cost)
+        return best
+
+    def _rebuild(self, targets):
+        """Recompute the whole field for a target set."""
+        game = self.game
+        game_map = game.game_map
+        pathfinder = game.pathfinder
+        size = game_map.width * game_map.height
+        land, void = pathfinder._land, pathfinder._void
+        if self.domain == 'land':
+            passable = [is_land and not is_void for is_land, is_void in zip(land, void)]
+        elif self.domain == 'sea':
+            passable = [not is_land and not is_void for is_land, is_void in zip(land, void)]
+            for base in game.faction_bases(self.owner):
+                passable[base.y * game_map.width + base.x] = True  # Sea port
+        else:
+            passable = [not is_void for is_void in void]
+        self._passable = passable
+
+        # Steps are symmetric here, so a tile's in-edges also list the tiles it can step to
+        width, height = game_map.width, game_map.height
+        sea = self.domain == 'sea'
+        edges = [()] * size
+        for node in range(size):
+            if not passable[node]:
+                continue
+            y, x = divmod(node, width)
+            node_edges = []
+            for direction, (dx, dy) in enumerate(_NEIGHBORS):
+                ny = y + dy
+                if not 0 <= ny < height:
+                    continue
+                neighbor = ny * width + (x + dx) % width
+                if not passable[neighbor]:
+                    continue
+                # Sea units cannot sail from one port straight into another
+                if sea and land[neighbor] and land[node]:
+                    continue
+                # Cost of the step from the neighbour back into this tile
+                node_edges.append((neighbor, self._cost(neighbor, 7 - direction)))
+            edges[node] = node_edges
+        self._edges = edges
+
+        self.targets = targets
+        self._dist = [float('inf')] * size
+        self._source = [-1] * size
+        seeds = {}
+        for index in targets:
+            if passable[index]:
+                self._dist[index] = 0.0
+                self._source[index] = index
+                seeds[index] = 0.0
+        self._spread(seeds)
+
+    def _spread(self, seeds):
+        """Run Dijkstra outward from seed tiles, lowering distances only.
+
+        Args:
+            seeds (dict): Flat tile index -> its current distance
+        """
+        edges = self._edges
+        dist, source = self._dist, self._source
+        frontier = [(cost, index) for index, cost in seeds.items()]
+        heapq.heapify(frontier)
+        while frontier:
+            cost_here, node = heapq.heappop(frontier)
+            if cost_here > dist[node]:
+                continue
+            node_source = source[node]
+            for neighbor, step_cost in edges[node]:
+                new_cost = cost_here + step_cost
+                if new_cost < dist[neighbor]:
+                    dist[neighbor] = new_cost
+                    source[neighbor] = node_source
+                    heapq.heappush(frontier, (new_cost, neighbor))
+
+    def _cost(self, index, direction):
+        """Move cost of the step from a tile toward a _NEIGHBORS direction, fungus included."""
+        pathfinder = self.game.pathfinder
+        return (pathfinder._step_costs[direction][index]
+                + self._fungus_costs[pathfinder._step_fungus[direction][index]])
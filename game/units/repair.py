@@ -45,9 +45,7 @@ def calculate_repair(unit, game):
     if tile.monolith:
         return full_damage
 
-    # TODO: Nano Factory and Xenoempathy Dome need a proper global secret project
-    # data structure. Fix once one is built.
-    if any('nano_factory' in b.facilities for b in game.bases if b.owner == unit.owner):
+    if game.faction_has_facility(unit.owner, 'nano_factory'):
         return full_damage
 
     if at_base:
@@ -83,7 +81,7 @@ def calculate_repair(unit, game):
 
     if tile.fungus:
         is_native = unit.weapon == 'native'
-        has_xenoempathy = any('xenoempathy_dome' in b.facilities for b in game.bases if b.owner == unit.owner)
+        has_xenoempathy = game.faction_has_facility(unit.owner, 'xenoempathy_dome')
         if is_native or has_xenoempathy:
             repair_percent += 0.10
             bonuses.append("Fungus +10%")
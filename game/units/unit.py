@@ -8,6 +8,21 @@ the map, garrison in bases, and respect terrain restrictions.
 
 import random
 
+from game.units.unit_components import (get_chassis_by_id, get_weapon_by_id,
+                                        get_armor_by_id, get_reactor_by_id,
+                                        ABILITY_BITS)
+
+# Ability bits behind the has_* flags
+_CLOAKING = ABILITY_BITS['cloaking']
+_DROP_PODS = ABILITY_BITS['drop_pods']
+_AMPHIBIOUS = ABILITY_BITS['amphibious']
+_CLEAN_REACTOR = ABILITY_BITS['clean_reactor']
+_AAA = ABILITY_BITS['AAA']
+_COMM_JAMMER = ABILITY_BITS['comm_jammer']
+_BLINK = ABILITY_BITS['blink']
+_EMPATH = ABILITY_BITS['empath']
+_FUNGAL_PAYLOAD = ABILITY_BITS['fungal_payload']
+
 
 class Unit:
     """Represents a game unit (military, colony pod, former, transport, etc.).
@@ -31,6 +46,22 @@ class Unit:
         has_moved (bool): Whether unit has moved this turn
     """
 
+    # Units are numerous and long-lived, so they use a fixed slot layout
+    # instead of a per-instance __dict__. New attributes must be listed here.
+    __slots__ = (
+        '_chassis', '_chassis_data', '_type', '_weapon', '_weapon_data',
+        '_armor', '_armor_data', '_reactor', '_reactor_data',
+        '_ability1', '_ability2', '_ability_mask',
+        'x', 'y', 'owner', 'name', 'has_moved', 'repair_eligible', 'held',
+        'reactor_level', 'moves_remaining', 'moves_this_turn',
+        'max_health', 'current_health', 'morale_level', 'kills', 'monolith_upgrade',
+        'has_artillery', 'artillery_mode',
+        'fuel', 'max_fuel', 'operational_range', 'last_refuel_x', 'last_refuel_y',
+        'home_base', 'support_cost', 'transport_capacity', 'loaded_units',
+        'is_probe', 'is_former', 'is_cloaked',
+        'terraforming_action', 'terraforming_turns_left',
+    )
+
     def __init__(self, x, y, chassis, owner, name, weapon, armor, reactor,
                  ability1='none', ability2='none'):
         """Initialize unit with mandatory components.
@@ -65,8 +96,9 @@ class Unit:
         self.weapon = weapon
         self.armor = armor
         self.reactor = reactor
-        self.ability1 = ability1
-        self.ability2 = ability2
+        self._ability1 = ability1
+        self._ability2 = ability2
+        self._update_ability_mask()
         self.has_moved = False
         self.repair_eligible = True  # True if unit skipped its turn entirely (eligible for natural repair)
         self.held = False  # If True, unit won't be auto-cycled for actions
@@ -127,34 +159,99 @@ class Unit:
         self.terraforming_action = None   # str key from IMPROVEMENTS, or None
         self.terraforming_turns_left = 0
 
+    # Component IDs resolve their data records once, when they are assigned.
+    # Changing a component (e.g. a design upgrade) refreshes its record.
+
+    @property
+    def chassis(self):
+        """Chassis ID."""
+        return self._chassis
+
+    @chassis.setter
+    def chassis(self, chassis_id):
+        self._chassis = chassis_id
+        self._chassis_data = get_chassis_by_id(chassis_id)
+        self._type = self._chassis_data['type']
+
+    @property
+    def weapon(self):
+        """Weapon ID."""
+        return self._weapon
+
+    @weapon.setter
+    def weapon(self, weapon_id):
+        self._weapon = weapon_id
+        self._weapon_data = get_weapon_by_id(weapon_id)
+
+    @property
+    def armor(self):
+        """Armor ID."""
+        return self._armor
+
+    @armor.setter
+    def armor(self, armor_id):
+        self._armor = armor_id
+        self._armor_data = get_armor_by_id(armor_id)
+
+    @property
+    def reactor(self):
+        """Reactor ID."""
+        return self._reactor
+
+    @reactor.setter
+    def reactor(self, reactor_id):
+        self._reactor = reactor_id
+        self._reactor_data = get_reactor_by_id(reactor_id)
+
     @property
     def chassis_data(self):
         """Get full chassis data dictionary."""
-        from game.units.unit_components import get_chassis_by_id
-        return get_chassis_by_id(self.chassis)
+        return self._chassis_data
 
     @property
     def weapon_data(self):
         """Get full weapon data dictionary."""
-        from game.units.unit_components import get_weapon_by_id
-        return get_weapon_by_id(self.weapon)
+        return self._weapon_data
 
     @property
     def armor_data(self):
         """Get full armor data dictionary."""
-        from game.units.unit_components import get_armor_by_id
-        return get_armor_by_id(self.armor)
+        return self._armor_data
 
     @property
     def reactor_data(self):
         """Get full reactor data dictionary."""
-        from game.units.unit_components import get_reactor_by_id
-        return get_reactor_by_id(self.reactor)
+        return self._reactor_data
 
     @property
     def type(self):
         """Get unit type from chassis ('land', 'sea', or 'air')."""
-        return self.chassis_data['type']
+        return self._type
+
+    @property
+    def ability1(self):
+        """First special ability ID."""
+        return self._ability1
+
+    @ability1.setter
+    def ability1(self, ability_id):
+        self._ability1 = ability_id
+        self._update_ability_mask()
+
+    @property
+    def ability2(self):
+        """Second special ability ID."""
+        return self._ability2
+
+    @ability2.setter
+    def ability2(self, ability_id):
+        self._ability2 = ability_id
+        self._update_ability_mask()
+
+    def _update_ability_mask(self):
+        """Recompute the ability bitmask from the two ability slots."""
+        self._ability_mask = (ABILITY_BITS.get(self._ability1, 0)
+                              | ABILITY_BITS.get(self._ability2, 0))
 
     def has_ability(self, ability_id):
         """Check if unit has a specific ability.
@@ -165,27 +262,48 @@ class Unit:
         Returns:
             bool: True if unit has this ability in either slot
         """
-        return self.ability1 == ability_id or self.ability2 == ability_id
-
-    # Legacy property accessors for abilities (for backwards compatibility with existing code)
-    def __getattr__(self, name):
-        """Dynamic attribute lookup for has_* ability checks."""
-        if name.startswith('has_'):
-            # Map common ability check patterns to ability IDs
-            ability_map = {
-                'has_cloaking': 'cloaking',
-                'has_drop_pods': 'drop_pods',
-                'has_amphibious_pods': 'amphibious',
-                'has_clean_reactor': 'clean_reactor',
-                'has_aaa_tracking': 'AAA',
-                'has_comm_jammer': 'comm_jammer',
-                'has_blink_displacer': 'blink',
-                'has_empath_song': 'empath',
-                'has_fungal_payload': 'fungal_payload'
-            }
-            if name in ability_map:
-                return self.has_ability(ability_map[name])
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        bit = ABILITY_BITS.get(ability_id)
+        if bit is None:
+            # Unknown ID: fall back to comparing the slots directly
+            return self._ability1 == ability_id or self._ability2 == ability_id
+        return bool(self._ability_mask & bit)
+
+    # Named ability flags
+    @property
+    def has_cloaking(self):
+        return bool(self._ability_mask & _CLOAKING)
+
+    @property
+    def has_drop_pods(self):
+        return bool(self._ability_mask & _DROP_PODS)
+
+    @property
+    def has_amphibious_pods(self):
+        return bool(self._ability_mask & _AMPHIBIOUS)
+
+    @property
+    def has_clean_reactor(self):
+        return bool(self._ability_mask & _CLEAN_REACTOR)
+
+    @property
+    def has_aaa_tracking(self):
+        return bool(self._ability_mask & _AAA)
+
+    @property
+    def has_comm_jammer(self):
+        return bool(self._ability_mask & _COMM_JAMMER)
+
+    @property
+    def has_blink_displacer(self):
+        return bool(self._ability_mask & _BLINK)
+
+    @property
+    def has_empath_song(self):
+        return bool(self._ability_mask & _EMPATH)
+
+    @property
+    def has_fungal_payload(self):
+        return bool(self._ability_mask & _FUNGAL_PAYLOAD)
 
     def max_moves(self):
         """Return maximum movement points per turn."""
@@ -313,12 +431,14 @@ class Unit:
 
         return self.fuel is not None and self.fuel <= 0
 
-    def can_reach_refuel_point(self, game_map, bases):
+    def can_reach_refuel_point(self, game_map, bases, base_index=None):
         """Check if unit can reach a refuel point (base or airbase).
 
         Args:
             game_map: GameMap instance
             bases: List of all bases
+            base_index (BaseIndex): Spatial index of bases (optional, avoids
+                scanning every base)
 
         Returns:
             bool: True if a refuel point is reachable
@@ -326,14 +446,20 @@ class Unit:
         if not self.is_air_unit() or self.fuel is None:
             return True  # Non-air units always return True
 
-        # Check distance to nearest friendly base
-        min_distance = float('inf')
-        for base in bases:
-            if base.owner == self.owner:
-                dx = abs(base.x - self.x)
-                dy = abs(base.y - self.y)
-                distance = max(dx, dy)  # Chebyshev distance
-                min_distance = min(min_distance, distance)
+        # Check distance to nearest friendly base (Chebyshev, wrapping east-west)
+        if base_index is not None:
+            _, min_distance = base_index.nearest_base(self.x, self.y, owner=self.owner, chebyshev=True)
+            if min_distance is None:
+                min_distance = float('inf')
+        else:
+            min_distance = float('inf')
+            for base in bases:
+                if base.owner == self.owner:
+                    dx = abs(base.x - self.x)
+                    dx = min(dx, game_map.width - dx)
+                    dy = abs(base.y - self.y)
+                    distance = max(dx, dy)  # Chebyshev distance
+                    min_distance = min(min_distance, distance)
 
         # TODO: Also check for airbases when terrain improvements are implemented
 
@@ -8,36 +8,35 @@ prerequisite that must be researched before it can be used.
 
 from game.data.unit_data import CHASSIS, WEAPONS, ARMOR, REACTORS, SPECIAL_ABILITIES
 
+# Id-keyed registries so lookups don't scan the component lists
+CHASSIS_BY_ID = {chassis['id']: chassis for chassis in CHASSIS}
+WEAPONS_BY_ID = {weapon['id']: weapon for weapon in WEAPONS}
+ARMOR_BY_ID = {armor['id']: armor for armor in ARMOR}
+REACTORS_BY_ID = {reactor['id']: reactor for reactor in REACTORS}
+ABILITIES_BY_ID = {ability['id']: ability for ability in SPECIAL_ABILITIES}
+
+# One bit per special ability, used for Unit's ability mask
+ABILITY_BITS = {ability['id']: 1 << i for i, ability in enumerate(SPECIAL_ABILITIES)}
+
+
 def get_chassis_by_id(chassis_id):
     """Get chassis data by ID."""
-    for chassis in CHASSIS:
-        if chassis['id'] == chassis_id:
-            return chassis
-    return CHASSIS[0]  # Default to infantry
+    return CHASSIS_BY_ID.get(chassis_id, CHASSIS[0])  # Default to infantry
 
 
 def get_weapon_by_id(weapon_id):
     """Get weapon data by ID."""
-    for weapon in WEAPONS:
-        if weapon['id'] == weapon_id:
-            return weapon
-    return WEAPONS[5]  # Default to hand weapons
+    return WEAPONS_BY_ID.get(weapon_id, WEAPONS[5])  # Default to hand weapons
 
 
 def get_armor_by_id(armor_id):
     """Get armor data by ID."""
-    for armor in ARMOR:
-        if armor['id'] == armor_id:
-            return armor
-    return ARMOR[0]  # Default to no armor
+    return ARMOR_BY_ID.get(armor_id, ARMOR[0])  # Default to no armor
 
 
 def get_reactor_by_id(reactor_id):
     """Get reactor data by ID."""
-    for reactor in REACTORS:
-        if reactor['id'] == reactor_id:
-            return reactor
-    return REACTORS[0]  # Default to fission
+    return REACTORS_BY_ID.get(reactor_id, REACTORS[0])  # Default to fission
 
 
 def generate_unit_name(weapon_id, chassis_id, armor_id, reactor_id, ability1, ability2):
@@ -208,7 +207,4 @@ def is_component_available(component, tech_tree):
 
 def get_ability_by_id(ability_id):
     """Get special ability data by ID."""
-    for ability in SPECIAL_ABILITIES:
-        if ability['id'] == ability_id:
-            return ability
-    return SPECIAL_ABILITIES[0]  # Default to none
+    return ABILITIES_BY_ID.get(ability_id, SPECIAL_ABILITIES[0])  # Default to none
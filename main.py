@@ -13,6 +13,7 @@ and renders the screen each frame.
 """
 import pygame
 import sys
+from functools import partial
 from game.data import display_data as display
 from game.game import Game
 from game.renderer import Renderer
@@ -639,6 +640,10 @@ def main():
         # Handle continuous input (camera movement)
         game.handle_input(renderer)
 
+        # Tell combat what the player can see (with the AI camera off, AI battles
+        # outside the viewport are not animated)
+        game.combat.on_screen = partial(renderer.is_tile_on_screen, game_map=game.game_map)
+
         # Check for auto-cycle to next unit after delay
         game.turns.check_auto_cycle()
 
@@ -648,10 +653,15 @@ def main():
             dialogs_blocking = has_blocking_dialog(game, ui_panel)
 
             if not dialogs_blocking:
-                current_time = pygame.time.get_ticks()
-                if current_time - last_ai_action >= display.AI_TURN_DELAY:
-                    game.turns.process_ai_turns()
-                    last_ai_action = current_time
+                if game.turns.fast_ai:
+                    # As many AI moves as fit in this frame, stopping for any dialog
+                    game.turns.process_ai_slice(display.AI_FRAME_BUDGET,
+                                                lambda: has_blocking_dialog(game, ui_panel))
+                else:
+                    current_time = pygame.time.get_ticks()
+                    if current_time - last_ai_action >= display.AI_TURN_DELAY:
+                        game.turns.process_ai_turns()
+                        last_ai_action = current_time
 
         # Handle map scrolling when mouse is at edges (only in map area)
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -712,7 +722,7 @@ def main():
 
         # Draw debug overlay if enabled
         if game.debug.enabled:
-            game.debug.draw_overlay(screen, pygame.font.Font(None, 20))
+            game.debug.draw_overlay(screen, pygame.font.Font(None, 20), game)
 
         # Draw exit dialog on top of everything if showing
         if exit_dialog.show_dialog: